@@ -0,0 +1,129 @@
+"""Connections and sockets as the number of accounts grows.
+
+For every ``--accounts`` count a fresh Home Assistant is set up against the
+fake cloud with that many entries, each logging in as its own account, and
+every entity of every entry is then refreshed once. The fake cloud serves
+the same devices to every account, so their entities only get created for
+the first entry; login, inventory and the other setup requests still run
+per account.
+
+The report shows, per account count, the setup time, the requests made and
+the TCP connections the process opened for them, and the sockets open
+afterwards. With the shared connection pool, connections track the per-host
+limit instead of the number of requests or accounts. The fake cloud runs
+in process over plain HTTP, so the open sockets include its side of every
+connection and no TLS handshake is measured; connections opened are the
+handshakes a real install would pay.
+
+    python -m benchmarks.bench_accounts --accounts 1 2 4 8 --devices plug=20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from unittest import mock
+
+import aiohttp
+
+from .bench_setup import DEFAULT_DEVICES, async_poll_cycle
+from .common import (
+    ENTRY_DATA,
+    Stopwatch,
+    async_add_entry,
+    ensure_loaded,
+    async_start_hass,
+    open_sockets,
+    parse_counts,
+    print_report,
+)
+from .fake_cloud import (
+    DEVICE_KINDS,
+    FakeWyzeCloud,
+    SyntheticAccount,
+    redirect_wyze_traffic,
+)
+
+
+async def async_measure(accounts: int, devices: dict[str, int]) -> dict:
+    """Set up ``accounts`` entries, poll them once and count connections."""
+    cloud = FakeWyzeCloud(SyntheticAccount(devices))
+    base_url = await cloud.start()
+    connections = 0
+    original = aiohttp.TCPConnector._create_connection  # noqa: SLF001
+
+    async def _create_connection(connector, *args, **kwargs):
+        nonlocal connections
+        connections += 1
+        return await original(connector, *args, **kwargs)
+
+    try:
+        with (
+            redirect_wyze_traffic(base_url),
+            mock.patch.object(
+                aiohttp.TCPConnector, "_create_connection", _create_connection
+            ),
+        ):
+            async with async_start_hass() as hass:
+                entries = [
+                    await async_add_entry(
+                        hass, {**ENTRY_DATA, "username": f"bench{i}@example.com"}
+                    )
+                    for i in range(accounts)
+                ]
+                with Stopwatch() as setup:
+                    for entry in entries:
+                        await hass.config_entries.async_setup(entry.entry_id)
+                    await hass.async_block_till_done()
+                for entry in entries:
+                    ensure_loaded(entry)
+                setup_requests = sum(cloud.requests.values())
+                setup_connections = connections
+
+                cloud.reset_counts()
+                connections = 0
+                await asyncio.gather(
+                    *(async_poll_cycle(hass, entry.entry_id) for entry in entries)
+                )
+                report = {
+                    "setup_s": round(setup.wall, 3),
+                    "setup_requests": setup_requests,
+                    "setup_connections": setup_connections,
+                    "poll_requests": sum(cloud.requests.values()),
+                    "poll_connections": connections,
+                    "open_sockets": open_sockets(),
+                }
+                for entry in entries:
+                    await hass.config_entries.async_unload(entry.entry_id)
+    finally:
+        await cloud.stop()
+    return report
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Measure every requested account count."""
+    devices = parse_counts(args.devices)
+    print_report(
+        {
+            f"{accounts} accounts": await async_measure(accounts, devices)
+            for accounts in args.accounts
+        }
+    )
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--accounts", type=int, nargs="*", default=[1, 2, 4, 8])
+    parser.add_argument(
+        "--devices",
+        nargs="*",
+        default=DEFAULT_DEVICES,
+        metavar="KIND=COUNT",
+        help=f"devices per kind for every account, kinds: {', '.join(DEVICE_KINDS)}",
+    )
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Import time of the integration and of each platform.
+
+Every scenario imports the package (and optionally some platforms) in a fresh
+interpreter under ``python -X importtime``. The Home Assistant modules any
+running instance already has loaded are imported first, so the report only
+contains what loading the integration adds: its total import time, the
+slowest modules it pulled in, the time spent in the integration's own
+modules, and which heavy optional dependencies (bleak, pycryptodome,
+websockets, ...) were loaded.
+
+    python -m benchmarks.bench_import --platforms lock camera --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+import subprocess
+import sys
+
+from .common import REPO_ROOT, print_report
+
+PACKAGE = "custom_components.wyzeapi"
+PLATFORMS = [
+    "light",
+    "switch",
+    "lock",
+    "climate",
+    "alarm_control_panel",
+    "sensor",
+    "binary_sensor",
+    "siren",
+    "cover",
+    "number",
+    "button",
+    "camera",
+]
+
+# Loaded by Home Assistant before any custom integration is imported.
+PRELOADED = [
+    "aiohttp",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.device_registry",
+    "homeassistant.helpers.dispatcher",
+    "homeassistant.helpers.entity_platform",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.update_coordinator",
+]
+
+# Optional dependencies that should only be loaded when a device needs them.
+HEAVY = ["bleak", "bleak_retry_connector", "Crypto", "websockets", "sqlite3"]
+
+
+@dataclass
+class ImportRecord:
+    """One line of ``-X importtime`` output."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportRecord]:
+    """Parse the ``-X importtime`` lines of ``output``."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        if not self_us.strip().isdigit():  # the header line
+            continue
+        module = name.lstrip()
+        records.append(
+            ImportRecord(
+                module=module.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name) - len(module)) // 2,
+            )
+        )
+    return records
+
+
+def measure(modules: list[str], preload: bool = True) -> list[ImportRecord]:
+    """Import ``modules`` in a fresh interpreter and return its import records."""
+    code = "\n".join(
+        [
+            *(f"import {module}" for module in (PRELOADED if preload else [])),
+            "import sys",
+            "sys.stderr.write('--- measured ---\\n')",
+            *(f"import {module}" for module in modules),
+        ]
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode:
+        raise RuntimeError(f"Importing {', '.join(modules)} failed:\n{result.stderr}")
+    return parse_importtime(result.stderr.split("--- measured ---", 1)[-1])
+
+
+def summarize(records: list[ImportRecord], top: int) -> dict:
+    """Return the report of one measurement."""
+    loaded = {record.module for record in records}
+    return {
+        "total_ms": round(
+            sum(record.cumulative_us for record in records if record.depth == 1) / 1000,
+            1,
+        ),
+        "modules": len(records),
+        "integration_self_ms": {
+            record.module.removeprefix(f"{PACKAGE}."): round(record.self_us / 1000, 2)
+            for record in records
+            if record.module.startswith(PACKAGE)
+        },
+        "heavy_dependencies": sorted(
+            heavy
+            for heavy in HEAVY
+            if any(module.split(".")[0] == heavy for module in loaded)
+        ),
+        "slowest_ms": {
+            record.module: round(record.cumulative_us / 1000, 1)
+            for record in sorted(records, key=lambda r: r.cumulative_us, reverse=True)[
+                :top
+            ]
+        },
+    }
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--platforms", nargs="*", default=PLATFORMS, choices=PLATFORMS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument(
+        "--no-preload",
+        action="store_true",
+        help="don't import the modules Home Assistant has already loaded first",
+    )
+    args = parser.parse_args()
+
+    scenarios = {"integration": [PACKAGE]}
+    scenarios.update(
+        {platform: [PACKAGE, f"{PACKAGE}.{platform}"] for platform in args.platforms}
+    )
+    report = {}
+    for scenario, modules in scenarios.items():
+        # The fastest run is the least disturbed by the rest of the system
+        runs = [
+            measure(modules, preload=not args.no_preload) for _ in range(args.repeat)
+        ]
+        best = min(runs, key=lambda records: sum(r.self_us for r in records))
+        report[scenario] = summarize(best, args.top)
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Memory held by the integration per device type.
+
+For every device kind a fresh Home Assistant is set up against the fake cloud
+with ``--count`` devices of only that kind. The report shows the memory
+allocated during setup that is still alive afterwards (tracemalloc), the
+number of entities, and how many wyzeapy ``Device`` objects are alive per
+device, which shows whether entities share one device object or each keep
+their own copy.
+
+    python -m benchmarks.bench_memory --count 100 --kinds camera plug bulb
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import tracemalloc
+
+from wyzeapy.types import Device
+
+from .common import (
+    async_add_entry,
+    ensure_loaded,
+    async_start_hass,
+    entities_per_platform,
+    print_report,
+)
+from .fake_cloud import (
+    DEVICE_KINDS,
+    FakeWyzeCloud,
+    SyntheticAccount,
+    redirect_wyze_traffic,
+)
+
+
+def _live_devices() -> int:
+    """Return the number of wyzeapy device objects alive."""
+    gc.collect()
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, Device))
+
+
+async def async_measure(kind: str, count: int) -> dict:
+    """Set up ``count`` devices of ``kind`` and measure what stays allocated."""
+    cloud = FakeWyzeCloud(SyntheticAccount({kind: count}))
+    base_url = await cloud.start()
+    try:
+        with redirect_wyze_traffic(base_url):
+            async with async_start_hass() as hass:
+                entry = await async_add_entry(hass)
+                devices_before = _live_devices()
+                tracemalloc.start()
+                before = tracemalloc.take_snapshot()
+                await hass.config_entries.async_setup(entry.entry_id)
+                await hass.async_block_till_done()
+                ensure_loaded(entry)
+                gc.collect()
+                after = tracemalloc.take_snapshot()
+                tracemalloc.stop()
+                retained = sum(
+                    stat.size_diff for stat in after.compare_to(before, "filename")
+                )
+                devices = _live_devices() - devices_before
+                entities = entities_per_platform(hass)
+                await hass.config_entries.async_unload(entry.entry_id)
+    finally:
+        await cloud.stop()
+
+    total_entities = sum(entities.values())
+    return {
+        "devices": count,
+        "entities": total_entities,
+        "retained_kib": round(retained / 1024, 1),
+        "retained_bytes_per_device": retained // count if count else None,
+        "retained_bytes_per_entity": (
+            retained // total_entities if total_entities else None
+        ),
+        "device_objects_per_device": round(devices / count, 2) if count else None,
+        "entities_per_platform": entities,
+    }
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Measure every requested kind."""
+    print_report({kind: await async_measure(kind, args.count) for kind in args.kinds})
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=50)
+    parser.add_argument(
+        "--kinds", nargs="*", default=list(DEVICE_KINDS), choices=list(DEVICE_KINDS)
+    )
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
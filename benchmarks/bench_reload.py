@@ -0,0 +1,132 @@
+"""Reload time and what a reload leaves behind.
+
+The entry is set up against the fake cloud and then reloaded ``--cycles``
+times. After every cycle the harness records how long the reload took, how
+many asyncio tasks are alive, how many sockets the process has open, the
+memory allocated since the first setup that is still alive (tracemalloc) and
+the number of live wyzeapy ``Device`` objects. If unload releases everything
+the entry started, all of these stay flat across cycles; a steady climb is a
+leak, and the report includes its slope per cycle.
+
+    python -m benchmarks.bench_reload --devices camera=5 plug=10 --cycles 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import time
+import tracemalloc
+
+from wyzeapy.types import Device
+
+from .common import (
+    async_add_entry,
+    ensure_loaded,
+    async_start_hass,
+    open_sockets,
+    parse_counts,
+    print_report,
+)
+from .fake_cloud import (
+    DEVICE_KINDS,
+    FakeWyzeCloud,
+    SyntheticAccount,
+    redirect_wyze_traffic,
+)
+
+DEFAULT_DEVICES = ["camera=5", "plug=10", "outdoor_plug=2", "bulb=10", "lock=1"]
+
+
+def _live_devices() -> int:
+    """Return the number of wyzeapy device objects alive."""
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, Device))
+
+
+def _sample() -> dict[str, int]:
+    gc.collect()
+    return {
+        "tasks": len(asyncio.all_tasks()),
+        "sockets": open_sockets(),
+        "retained_kib": tracemalloc.get_traced_memory()[0] // 1024,
+        "devices": _live_devices(),
+    }
+
+
+def _slope(values: list[int]) -> float:
+    """Return the least squares slope of ``values`` per cycle."""
+    count = len(values)
+    if count < 2:
+        return 0.0
+    mean_x = (count - 1) / 2
+    mean_y = sum(values) / count
+    numerator = sum((x - mean_x) * (y - mean_y) for x, y in enumerate(values))
+    denominator = sum((x - mean_x) ** 2 for x in range(count))
+    return round(numerator / denominator, 3)
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Set the entry up, reload it repeatedly and report each cycle."""
+    cloud = FakeWyzeCloud(SyntheticAccount(parse_counts(args.devices)))
+    base_url = await cloud.start()
+    samples = []
+    reload_ms = []
+    try:
+        with redirect_wyze_traffic(base_url):
+            async with async_start_hass() as hass:
+                entry = await async_add_entry(hass)
+                await hass.config_entries.async_setup(entry.entry_id)
+                await hass.async_block_till_done()
+                ensure_loaded(entry)
+                tracemalloc.start()
+                baseline = _sample()
+                for _ in range(args.cycles):
+                    start = time.perf_counter()
+                    await hass.config_entries.async_reload(entry.entry_id)
+                    await hass.async_block_till_done()
+                    reload_ms.append((time.perf_counter() - start) * 1000)
+                    ensure_loaded(entry)
+                    samples.append(_sample())
+                tracemalloc.stop()
+                await hass.config_entries.async_unload(entry.entry_id)
+    finally:
+        await cloud.stop()
+
+    reload_ms.sort()
+    report = {
+        "cycles": args.cycles,
+        "reload_ms": {
+            "p50": round(reload_ms[len(reload_ms) // 2], 1),
+            "max": round(reload_ms[-1], 1),
+        },
+        "baseline": baseline,
+        "last": samples[-1],
+        "growth_per_cycle": {
+            key: _slope([sample[key] for sample in samples]) for key in baseline
+        },
+    }
+    if args.per_cycle:
+        report["per_cycle"] = samples
+    print_report(report)
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--devices",
+        nargs="*",
+        default=DEFAULT_DEVICES,
+        metavar="KIND=COUNT",
+        help=f"devices per kind, kinds: {', '.join(DEVICE_KINDS)}",
+    )
+    parser.add_argument("--cycles", type=int, default=50)
+    parser.add_argument(
+        "--per-cycle", action="store_true", help="include every cycle's sample"
+    )
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
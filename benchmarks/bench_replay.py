@@ -0,0 +1,121 @@
+"""Record a real account into a cassette, or replay one and measure setup.
+
+Recording needs the account credentials in ``WYZE_USERNAME``,
+``WYZE_PASSWORD``, ``WYZE_KEY_ID`` and ``WYZE_API_KEY`` and talks to the real
+Wyze cloud once; the anonymized cassette can then be shared and replayed
+offline with the recorded response times:
+
+    python -m benchmarks.bench_replay record cassettes/account.json.gz
+    python -m benchmarks.bench_replay replay cassettes/account.json.gz --speed 1
+
+Replay reports the duration of ``async_setup_entry`` (including the platform
+setups it forwards to), peak traced memory, and the API calls made per
+endpoint and per integration module.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+
+from .cassette import Cassette
+from .common import (
+    ENTRY_DATA,
+    Stopwatch,
+    async_add_entry,
+    ensure_loaded,
+    async_start_hass,
+    entities_per_platform,
+    print_report,
+)
+
+
+def _credentials() -> dict[str, str]:
+    """Return the account credentials from the environment."""
+    try:
+        return {
+            "username": os.environ["WYZE_USERNAME"],
+            "password": os.environ["WYZE_PASSWORD"],
+            "key_id": os.environ["WYZE_KEY_ID"],
+            "api_key": os.environ["WYZE_API_KEY"],
+        }
+    except KeyError as err:
+        raise SystemExit(f"{err.args[0]} must be set to record a cassette") from err
+
+
+async def async_record(args: argparse.Namespace) -> None:
+    """Set up the integration against the real cloud and record the traffic."""
+    cassette = Cassette(args.cassette)
+    with cassette.record():
+        async with async_start_hass() as hass:
+            entry = await async_add_entry(hass, _credentials())
+            await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            ensure_loaded(entry)
+            await hass.config_entries.async_unload(entry.entry_id)
+    print_report(
+        {
+            "cassette": str(cassette.path),
+            "interactions": len(cassette.interactions),
+            "per_endpoint": dict(cassette.calls.most_common()),
+        }
+    )
+
+
+async def async_replay(args: argparse.Namespace) -> None:
+    """Replay a cassette and measure the setup."""
+    cassette = Cassette(args.cassette)
+    report: dict = {}
+    with cassette.replay(speed=args.speed):
+        async with async_start_hass() as hass:
+            entry = await async_add_entry(hass, ENTRY_DATA)
+            with Stopwatch(trace_memory=not args.no_memory) as setup:
+                await hass.config_entries.async_setup(entry.entry_id)
+                await hass.async_block_till_done()
+            ensure_loaded(entry)
+            report = {
+                "cassette": str(cassette.path),
+                "speed": args.speed,
+                "state": entry.state.value,
+                "setup_wall_s": round(setup.wall, 3),
+                "setup_cpu_s": round(setup.cpu, 3),
+                "peak_memory_mib": (
+                    round(setup.peak_memory / 2**20, 2)
+                    if setup.peak_memory is not None
+                    else None
+                ),
+                "api_calls": sum(cassette.calls.values()),
+                "api_calls_by_module": dict(cassette.calls_by_origin.most_common()),
+                "per_endpoint": dict(cassette.calls.most_common()),
+                "unmatched": dict(cassette.misses),
+                "entities": entities_per_platform(hass),
+            }
+            await hass.config_entries.async_unload(entry.entry_id)
+    print_report(report)
+
+
+def main() -> None:
+    """Parse the arguments and run."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    record = commands.add_parser("record", help="record a real account")
+    record.add_argument("cassette")
+    replay = commands.add_parser("replay", help="replay a cassette")
+    replay.add_argument("cassette")
+    replay.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="scale of the recorded response times, 0 to disable",
+    )
+    replay.add_argument(
+        "--no-memory", action="store_true", help="skip tracemalloc (faster)"
+    )
+    args = parser.parse_args()
+    runner = async_record if args.command == "record" else async_replay
+    asyncio.run(runner(args))
+
+
+if __name__ == "__main__":
+    main()
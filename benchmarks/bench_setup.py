@@ -0,0 +1,142 @@
+"""Set up the integration against the fake Wyze cloud and measure it.
+
+Reports the time ``async_setup_entry`` takes for a synthetic account, the
+requests it made per endpoint, and the CPU time and requests of forced poll
+cycles (one ``homeassistant.update_entity`` over every Wyze entity plus a poll
+of the camera event pipeline).
+
+    python -m benchmarks.bench_setup --devices camera=20 plug=40 bulb=30 \
+        --latency 0.05 --jitter 0.02 --error-rate 0.01 --cycles 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from homeassistant.helpers import entity_registry as er
+
+from .common import (
+    DOMAIN,
+    Stopwatch,
+    async_add_entry,
+    ensure_loaded,
+    async_start_hass,
+    entities_per_platform,
+    parse_counts,
+    print_report,
+)
+from .fake_cloud import (
+    DEVICE_KINDS,
+    FakeWyzeCloud,
+    FaultProfile,
+    SyntheticAccount,
+    redirect_wyze_traffic,
+)
+
+DEFAULT_DEVICES = ["camera=5", "plug=10", "outdoor_plug=2", "bulb=10", "lock=1"]
+
+
+async def async_poll_cycle(hass, entry_id: str) -> None:
+    """Refresh every Wyze entity once and poll the event pipeline."""
+    entity_ids = [
+        entry.entity_id
+        for entry in er.async_entries_for_config_entry(er.async_get(hass), entry_id)
+        if hass.states.get(entry.entity_id) is not None
+    ]
+    if entity_ids:
+        await hass.services.async_call(
+            "homeassistant",
+            "update_entity",
+            {"entity_id": entity_ids},
+            blocking=True,
+        )
+    entry_data = hass.data.get(DOMAIN, {}).get(entry_id, {})
+    if (pipeline := entry_data.get("event_pipeline")) is not None:
+        await pipeline.async_poll()
+    await hass.async_block_till_done()
+
+
+async def async_main(args: argparse.Namespace) -> None:
+    """Run the benchmark."""
+    account = SyntheticAccount(parse_counts(args.devices))
+    cloud = FakeWyzeCloud(
+        account,
+        FaultProfile(
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            rate_limit_rate=args.rate_limit_rate,
+            seed=args.seed,
+        ),
+    )
+    base_url = await cloud.start()
+    report: dict = {"devices": account.counts}
+    try:
+        with redirect_wyze_traffic(base_url):
+            async with async_start_hass() as hass:
+                entry = await async_add_entry(hass)
+                with Stopwatch() as setup:
+                    await hass.config_entries.async_setup(entry.entry_id)
+                    await hass.async_block_till_done()
+                ensure_loaded(entry)
+                report["setup"] = {
+                    "state": entry.state.value,
+                    "wall_s": round(setup.wall, 3),
+                    "cpu_s": round(setup.cpu, 3),
+                    "requests": sum(cloud.requests.values()),
+                    "injected_faults": dict(cloud.injected),
+                    "per_endpoint": cloud.endpoint_counts(),
+                    "unhandled_endpoints": dict(cloud.unknown),
+                    "entities": entities_per_platform(hass),
+                }
+
+                cycles = []
+                for _ in range(args.cycles):
+                    cloud.reset_counts()
+                    with Stopwatch() as cycle:
+                        await async_poll_cycle(hass, entry.entry_id)
+                    cycles.append(
+                        {
+                            "wall_s": round(cycle.wall, 3),
+                            "cpu_s": round(cycle.cpu, 3),
+                            "requests": sum(cloud.requests.values()),
+                        }
+                    )
+                if cycles:
+                    report["poll_cycles"] = {
+                        "cycles": cycles,
+                        "mean_cpu_s": round(
+                            sum(cycle["cpu_s"] for cycle in cycles) / len(cycles), 4
+                        ),
+                        "mean_requests": sum(cycle["requests"] for cycle in cycles)
+                        / len(cycles),
+                        "per_endpoint_last": cloud.endpoint_counts(),
+                    }
+                await hass.config_entries.async_unload(entry.entry_id)
+    finally:
+        await cloud.stop()
+    print_report(report)
+
+
+def main() -> None:
+    """Parse the arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--devices",
+        nargs="*",
+        default=DEFAULT_DEVICES,
+        metavar="KIND=COUNT",
+        help=f"devices per kind, kinds: {', '.join(DEVICE_KINDS)}",
+    )
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cycles", type=int, default=3)
+    asyncio.run(async_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""Record and replay Wyze cloud traffic at the ``WyzeAuthLib`` boundary.
+
+Every request wyzeapy makes goes through ``WyzeAuthLib.post/put/get/patch/
+delete`` (plus ``refresh`` for the token). :class:`Cassette` patches those
+methods: while recording it forwards to the real cloud and stores the
+anonymized request, the JSON response and how long it took; while replaying it
+answers from the cassette after sleeping for the recorded duration, so a
+production sized account can be reproduced without network access.
+
+Anonymization replaces credentials, tokens, addresses and nicknames, and maps
+every device mac (and lock uuid) to a stable pseudonym everywhere it appears,
+including inside urls and request bodies. Replayed requests are matched on
+method, url and the anonymized body with volatile fields (timestamps,
+signatures, nonces) removed; if nothing matches exactly the next interaction
+recorded for the same url is used.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter, defaultdict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+import copy
+import gzip
+import json
+from pathlib import Path
+import re
+import time
+import traceback
+from typing import Any
+from unittest import mock
+
+import aiohttp
+from wyzeapy.wyze_auth_lib import WyzeAuthLib
+from yarl import URL
+
+CASSETTE_VERSION = 1
+# The integration routes requests through its shared connection pool by
+# replacing the auth lib's request methods; the cassette keeps wyzeapy's own
+# so its patches see every request.
+POOL_ATTACH = "custom_components.wyzeapi.http_pool.WyzeAccountHttp.async_attach"
+HTTP_METHODS = ("post", "put", "get", "patch", "delete")
+REFRESH_URL = "https://api.wyzecam.com/app/user/refresh_token"
+
+# Values replaced wholesale.
+SECRET_FIELDS = {
+    "access_token",
+    "accessToken",
+    "refresh_token",
+    "email",
+    "password",
+    "user_id",
+    "userId",
+    "keyid",
+    "apikey",
+    "key_id",
+    "api_key",
+    "phone_id",
+    "credential",
+    "username",
+    "ip",
+    "IP",
+    "ssid",
+    "sn",
+    "signaling_url",
+    "enr",
+    "p2p_id",
+    "hardware_id",
+    "sms_session_id",
+}
+# Free-form names replaced by a generic label.
+NAME_FIELDS = {"nickname", "name", "device_name"}
+# Fields whose value identifies a device.
+MAC_FIELDS = {"mac", "device_mac", "parent_device_mac", "deviceMac", "uuid"}
+# Request fields that change between runs and are ignored when matching.
+VOLATILE_FIELDS = {"ts", "nonce", "signature2", "sign", "sc", "sv", "app_ver"}
+# Media links are signed and expire; only the path is kept.
+_SIGNED_URL_RE = re.compile(r"(https?://[^\s\"?]+)\?[^\s\"]*")
+
+# Where in the integration a request was made, from the calling frames.
+_PLATFORM_FRAME_RE = re.compile(r"custom_components[/\\]wyzeapi[/\\](\w+)\.py$")
+
+
+def request_origin() -> str:
+    """Return the integration module whose code led to the current request."""
+    for frame in reversed(traceback.extract_stack()):
+        if match := _PLATFORM_FRAME_RE.search(frame.filename):
+            return match.group(1)
+    return "wyzeapy"
+
+
+class Anonymizer:
+    """Consistently replaces identifying values in requests and responses."""
+
+    def __init__(self) -> None:
+        """Initialize an empty mapping."""
+        self._macs: dict[str, str] = {}
+        self._names: dict[str, str] = {}
+        self._devices = 0
+
+    def _register_mac(self, mac: str) -> None:
+        if not mac or mac in self._macs:
+            return
+        self._devices += 1
+        self._macs[mac] = f"MAC{self._devices:06d}"
+        # Locks are addressed by the last part of their mac
+        if "." in mac:
+            self._macs.setdefault(mac.rsplit(".", 1)[-1], f"UUID{self._devices:06d}")
+
+    def _collect(self, data: Any) -> None:
+        if isinstance(data, dict):
+            for key, value in data.items():
+                if key in MAC_FIELDS and isinstance(value, str):
+                    self._register_mac(value)
+                else:
+                    self._collect(value)
+        elif isinstance(data, list):
+            for item in data:
+                self._collect(item)
+
+    def _replace(self, value: str) -> str:
+        value = _SIGNED_URL_RE.sub(r"\1", value)
+        for real in sorted(self._macs, key=len, reverse=True):
+            if real in value:
+                value = value.replace(real, self._macs[real])
+        return value
+
+    def _walk(self, data: Any, key: str | None = None) -> Any:
+        if isinstance(data, dict):
+            return {k: self._walk(v, k) for k, v in data.items()}
+        if isinstance(data, list):
+            return [self._walk(item, key) for item in data]
+        if key in SECRET_FIELDS and data not in (None, ""):
+            return "REDACTED" if isinstance(data, str) else data
+        if key in NAME_FIELDS and isinstance(data, str):
+            if data not in self._names:
+                self._names[data] = f"Device {len(self._names) + 1}"
+            return self._names[data]
+        if isinstance(data, str):
+            return self._replace(data)
+        return data
+
+    def anonymize(self, data: Any) -> Any:
+        """Return an anonymized deep copy of ``data``."""
+        self._collect(data)
+        return self._walk(copy.deepcopy(data))
+
+    def url(self, url: str) -> str:
+        """Return ``url`` with device identifiers replaced."""
+        return self._replace(str(url))
+
+
+def match_key(method: str, url: str, body: Any) -> str:
+    """Return the key used to match a replayed request to a recording."""
+
+    def _strip(data: Any) -> Any:
+        if isinstance(data, dict):
+            return {k: _strip(v) for k, v in data.items() if k not in VOLATILE_FIELDS}
+        if isinstance(data, list):
+            return [_strip(item) for item in data]
+        return data
+
+    return f"{method.upper()} {url} {json.dumps(_strip(body), sort_keys=True)}"
+
+
+class Cassette:
+    """A recording of Wyze cloud interactions."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the cassette stored at ``path`` (``.gz`` is compressed)."""
+        self.path = Path(path)
+        self.interactions: list[dict[str, Any]] = []
+        self.calls: Counter[str] = Counter()
+        self.calls_by_origin: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self._anonymizer = Anonymizer()
+
+    def load(self) -> None:
+        """Read the cassette from disk."""
+        opener = gzip.open if self.path.suffix == ".gz" else open
+        with opener(self.path, "rt", encoding="utf-8") as handle:
+            content = json.load(handle)
+        if content.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version in {self.path}")
+        self.interactions = content["interactions"]
+
+    def save(self) -> None:
+        """Write the cassette to disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        opener = gzip.open if self.path.suffix == ".gz" else open
+        with opener(self.path, "wt", encoding="utf-8") as handle:
+            json.dump(
+                {"version": CASSETTE_VERSION, "interactions": self.interactions},
+                handle,
+                indent=1,
+            )
+
+    def _count(self, method: str, url: str) -> None:
+        endpoint = f"{method.upper()} {URL(url).host}{URL(url).path}"
+        self.calls[endpoint] += 1
+        self.calls_by_origin[request_origin()] += 1
+
+    @contextmanager
+    def record(self) -> Iterator[Cassette]:
+        """Forward requests to the cloud and record them."""
+        originals = {name: getattr(WyzeAuthLib, name) for name in HTTP_METHODS}
+        anonymizer = self._anonymizer
+
+        def _recorder(name: str):
+            original = originals[name]
+
+            async def _request(auth_lib, url, *args, **kwargs):
+                self._count(name, url)
+                body = kwargs.get("json") or kwargs.get("data") or kwargs.get("params")
+                started = time.monotonic()
+                response = await original(auth_lib, url, *args, **kwargs)
+                duration = time.monotonic() - started
+                response_copy = anonymizer.anonymize(response)
+                anonymous_url = anonymizer.url(url)
+                self.interactions.append(
+                    {
+                        "method": name,
+                        "url": anonymous_url,
+                        "key": match_key(
+                            name, anonymous_url, anonymizer.anonymize(body)
+                        ),
+                        "duration": round(duration, 4),
+                        "response": response_copy,
+                    }
+                )
+                return response
+
+            return _request
+
+        with (
+            mock.patch.multiple(
+                WyzeAuthLib, **{name: _recorder(name) for name in HTTP_METHODS}
+            ),
+            mock.patch(POOL_ATTACH),
+        ):
+            yield self
+        self.save()
+
+    @contextmanager
+    def replay(self, speed: float = 1.0) -> Iterator[Cassette]:
+        """Answer requests from the cassette without touching the network.
+
+        ``speed`` scales the recorded durations (0 disables the delays).
+        Requests for any other host through aiohttp fail as if offline.
+        """
+        if not self.interactions:
+            self.load()
+        by_key: dict[str, deque[dict[str, Any]]] = defaultdict(deque)
+        by_url: dict[str, deque[dict[str, Any]]] = defaultdict(deque)
+        for interaction in self.interactions:
+            by_key[interaction["key"]].append(interaction)
+            by_url[interaction["url"]].append(interaction)
+
+        def _next(queue: deque[dict[str, Any]]) -> dict[str, Any]:
+            # Keep the last recording around for repeated polls
+            return queue.popleft() if len(queue) > 1 else queue[0]
+
+        def _player(name: str):
+            async def _request(auth_lib, url, *args, **kwargs):
+                self._count(name, url)
+                body = kwargs.get("json") or kwargs.get("data") or kwargs.get("params")
+                key = match_key(name, url, body)
+                if queue := by_key.get(key):
+                    interaction = _next(queue)
+                elif queue := by_url.get(str(url)):
+                    interaction = _next(queue)
+                else:
+                    self.misses[f"{name.upper()} {url}"] += 1
+                    raise aiohttp.ClientConnectionError(f"No recording for {url}")
+                if speed:
+                    await asyncio.sleep(interaction["duration"] * speed)
+                return copy.deepcopy(interaction["response"])
+
+            return _request
+
+        async def _refresh(auth_lib) -> None:
+            self._count("post", REFRESH_URL)
+            auth_lib.token.expired = False
+
+        original_request = aiohttp.ClientSession._request  # noqa: SLF001
+
+        async def _offline_request(session, method, str_or_url, *args, **kwargs):
+            host = URL(str(str_or_url)).host
+            if host not in ("127.0.0.1", "localhost"):
+                self.misses[f"{method} {host}"] += 1
+                raise aiohttp.ClientConnectionError(f"Offline replay: {host}")
+            return await original_request(session, method, str_or_url, *args, **kwargs)
+
+        with (
+            mock.patch.multiple(
+                WyzeAuthLib,
+                refresh=_refresh,
+                **{name: _player(name) for name in HTTP_METHODS},
+            ),
+            mock.patch.object(aiohttp.ClientSession, "_request", _offline_request),
+            mock.patch(POOL_ATTACH),
+        ):
+            yield self
@@ -0,0 +1,190 @@
+"""Helpers shared by the benchmark harnesses.
+
+:func:`async_start_hass` boots a minimal Home Assistant instance in a
+temporary config directory with this repository's ``custom_components``
+linked in, the same way the core test fixtures do, so the integration can be
+set up through the regular config entry machinery. The HTTP server the
+integration's dependencies need listens on a free localhost port.
+
+Every harness checks with :func:`ensure_loaded` that the entry actually
+loaded and exits non-zero otherwise, so a broken setup never produces a
+report.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import json
+import os
+from pathlib import Path
+import socket
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+
+from homeassistant import config_entries, loader
+from homeassistant.auth import auth_manager_from_config
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    category_registry as cr,
+    device_registry as dr,
+    entity,
+    entity_registry as er,
+    floor_registry as fr,
+    issue_registry as ir,
+    label_registry as lr,
+)
+from homeassistant.setup import async_setup_component
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DOMAIN = "wyzeapi"
+
+ENTRY_DATA = {
+    "username": "bench@example.com",
+    "password": "bench-password",
+    "key_id": "bench-key-id",
+    "api_key": "bench-api-key",
+}
+
+
+@asynccontextmanager
+async def async_start_hass(
+    config_dir: str | None = None,
+) -> AsyncIterator[HomeAssistant]:
+    """Yield a running Home Assistant with the Wyze integration available."""
+    with tempfile.TemporaryDirectory(prefix="wyzeapi-bench-") as tmp:
+        config_dir = config_dir or tmp
+        custom = Path(config_dir, "custom_components")
+        if not custom.exists():
+            custom.symlink_to(REPO_ROOT / "custom_components", target_is_directory=True)
+        if config_dir not in sys.path:
+            sys.path.insert(0, config_dir)
+
+        hass = HomeAssistant(config_dir)
+        hass.config.skip_pip = True
+        await hass.config.async_set_time_zone("UTC")
+        hass.auth = await auth_manager_from_config(hass, [], [])
+        entity.async_setup(hass)
+        loader.async_setup(hass)
+        await ar.async_load(hass)
+        await cr.async_load(hass)
+        await dr.async_load(hass)
+        await er.async_load(hass)
+        await fr.async_load(hass)
+        await ir.async_load(hass)
+        await lr.async_load(hass)
+        hass.config_entries = config_entries.ConfigEntries(hass, {})
+        await hass.config_entries.async_initialize()
+        await hass.async_start()
+        await async_setup_component(hass, "homeassistant", {})
+        await async_setup_component(
+            hass,
+            "http",
+            {"http": {"server_host": ["127.0.0.1"], "server_port": _free_port()}},
+        )
+        await async_setup_component(hass, "bluetooth", {})
+        try:
+            yield hass
+        finally:
+            await hass.async_stop(force=True)
+
+
+def _free_port() -> int:
+    """Return a localhost TCP port nothing listens on."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def ensure_loaded(entry: config_entries.ConfigEntry) -> None:
+    """Exit with an error unless ``entry`` is loaded."""
+    if entry.state is not ConfigEntryState.LOADED:
+        raise SystemExit(
+            f"The Wyze entry did not load ({entry.state.value}), see the log"
+        )
+
+
+async def async_add_entry(
+    hass: HomeAssistant, data: dict[str, Any] | None = None
+) -> config_entries.ConfigEntry:
+    """Add a Wyze config entry without setting it up."""
+    entry = config_entries.ConfigEntry(
+        version=1,
+        minor_version=1,
+        domain=DOMAIN,
+        title="bench",
+        data=data or ENTRY_DATA,
+        options={},
+        source=config_entries.SOURCE_USER,
+        unique_id=None,
+        discovery_keys={},
+    )
+    hass.config_entries._entries[entry.entry_id] = entry  # noqa: SLF001
+    return entry
+
+
+def entities_per_platform(hass: HomeAssistant) -> dict[str, int]:
+    """Return the number of Wyze entities per platform."""
+    counts: dict[str, int] = {}
+    for entry in er.async_get(hass).entities.values():
+        if entry.platform == DOMAIN:
+            counts[entry.domain] = counts.get(entry.domain, 0) + 1
+    return dict(sorted(counts.items()))
+
+
+class Stopwatch:
+    """Wall clock, CPU time and (optionally) peak traced memory of a block."""
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        """Initialize the stopwatch."""
+        self._trace_memory = trace_memory
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak_memory: int | None = None
+
+    def __enter__(self) -> Stopwatch:
+        """Start measuring."""
+        if self._trace_memory:
+            tracemalloc.start()
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Stop measuring."""
+        self.wall = time.perf_counter() - self._wall
+        self.cpu = time.process_time() - self._cpu
+        if self._trace_memory:
+            self.peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+
+def open_sockets() -> int:
+    """Return the number of sockets the process has open, -1 if unknown."""
+    try:
+        return sum(
+            1
+            for fd in os.listdir("/proc/self/fd")
+            if os.readlink(f"/proc/self/fd/{fd}").startswith("socket:")
+        )
+    except OSError:  # not Linux, or the fd closed while listing
+        return -1
+
+
+def print_report(report: dict[str, Any]) -> None:
+    """Print a benchmark report as JSON."""
+    print(json.dumps(report, indent=2, sort_keys=False, default=str))
+
+
+def parse_counts(pairs: list[str]) -> dict[str, int]:
+    """Parse ``kind=count`` arguments."""
+    counts = {}
+    for pair in pairs:
+        kind, _, count = pair.partition("=")
+        counts[kind] = int(count)
+    return counts
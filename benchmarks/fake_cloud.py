@@ -0,0 +1,436 @@
+"""Local stand-in for the Wyze cloud endpoints used by wyzeapy.
+
+``FakeWyzeCloud`` serves a synthetic account over plain HTTP on localhost.
+:func:`redirect_wyze_traffic` rewrites every aiohttp request aimed at a Wyze
+host (``*.wyze.com``/``*.wyzecam.com``) to ``http://127.0.0.1:<port>/<host>/<path>``,
+so wyzeapy and the integration run unmodified against it.
+
+Latency, jitter, server errors and HTTP 429 responses can be injected per
+request, and every request is counted per endpoint so benchmarks can report
+how many calls an operation needed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import json
+import random
+import time
+from typing import Any
+from unittest import mock
+
+import aiohttp
+from aiohttp import web
+from yarl import URL
+
+WYZE_DOMAINS = ("wyze.com", "wyzecam.com")
+MEDIA_HOST = "media.wyzecam.com"
+
+# A 1x1 baseline JPEG, served for every screenshot and thumbnail.
+TINY_JPEG = bytes.fromhex(
+    "ffd8ffe000104a46494600010100000100010000ffdb004300080606070605080707070909080a0c"
+    "140d0c0b0b0c1912130f141d1a1f1e1d1a1c1c20242e2720222c231c1c2837292c30313434341f27"
+    "393d38323c2e333432ffc0000b080001000101011100ffc4001f0000010501010101010100000000"
+    "000000000102030405060708090a0bffc400b5100002010303020403050504040000017d01020300"
+    "041105122131410613516107227114328191a1082342b1c11552d1f02433627282090a161718191a"
+    "25262728292a3435363738393a434445464748494a535455565758595a636465666768696a737475"
+    "767778797a838485868788898a92939495969798999aa2a3a4a5a6a7a8a9aab2b3b4b5b6b7b8b9ba"
+    "c2c3c4c5c6c7c8c9cad2d3d4d5d6d7d8d9dae1e2e3e4e5e6e7e8e9eaf1f2f3f4f5f6f7f8f9faffda"
+    "0008010100003f00fbd3ffd9"
+)
+
+# kind -> (product_type, product_model, extra device_params)
+DEVICE_KINDS: dict[str, tuple[str, str, dict[str, Any]]] = {
+    "camera": ("Camera", "WYZE_CAKP2JFUS", {"power_switch": 1, "ip": "10.0.0.2"}),
+    "plug": ("Plug", "WLPP1CFH", {"switch_state": 1}),
+    "outdoor_plug": ("OutdoorPlug", "WLPPO", {"switch_state": 1}),
+    "bulb": ("Light", "WLPA19", {"switch_state": 1}),
+    "contact_sensor": ("ContactSensor", "DWS3U", {"open_close_state": 0}),
+    "motion_sensor": ("MotionSensor", "PIR3U", {"motion_state": 0}),
+    "lock": ("Lock", "YD.LO1", {}),
+    "irrigation": ("Common", "BS_WK1", {}),
+}
+
+
+@dataclass(slots=True)
+class FaultProfile:
+    """Faults injected into every request."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    # Probability of answering with HTTP 500
+    error_rate: float = 0.0
+    # Probability of answering with HTTP 429
+    rate_limit_rate: float = 0.0
+    seed: int = 0
+
+
+@dataclass(slots=True)
+class SyntheticAccount:
+    """A generated account with ``counts[kind]`` devices of each kind."""
+
+    counts: dict[str, int]
+    events_per_camera: int = 3
+    devices: list[dict[str, Any]] = field(default_factory=list)
+    properties: dict[str, dict[str, str]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        """Generate the device list."""
+        serial = 0
+        for kind, count in self.counts.items():
+            product_type, model, params = DEVICE_KINDS[kind]
+            for index in range(count):
+                serial += 1
+                mac = f"{model}_{serial:06X}"
+                self.devices.append(
+                    {
+                        "mac": mac,
+                        "nickname": f"{kind.replace('_', ' ').title()} {index + 1}",
+                        "product_type": product_type,
+                        "product_model": model,
+                        "conn_state": 1,
+                        "push_switch": 1,
+                        "parent_device_mac": "",
+                        "firmware_ver": "1.0.0",
+                        "device_params": {
+                            **params,
+                            "camera_thumbnails": {
+                                "thumbnails_url": f"https://{MEDIA_HOST}/thumb/{mac}.jpg",
+                                "thumbnails_ts": int(time.time() * 1000),
+                            },
+                        },
+                    }
+                )
+                self.properties[mac] = {"P3": "1", "P5": "1", "P1047": "1"}
+
+    def by_mac(self, mac: str) -> dict[str, Any] | None:
+        """Return the device with ``mac``."""
+        return next((device for device in self.devices if device["mac"] == mac), None)
+
+    def events(self) -> list[dict[str, Any]]:
+        """Return recent events for every camera, newest first."""
+        now = int(time.time() * 1000)
+        events = []
+        for device in self.devices:
+            if device["product_type"] != "Camera":
+                continue
+            for index in range(self.events_per_camera):
+                ts = now - index * 60_000
+                events.append(
+                    {
+                        "event_id": f"{device['mac']}-{ts // 60_000}",
+                        "device_mac": device["mac"],
+                        "device_model": device["product_model"],
+                        "event_ts": ts,
+                        "event_category": 1,
+                        "event_value": "1",
+                        "tag_list": [],
+                        "file_list": [
+                            {
+                                "type": 1,
+                                "url": f"https://{MEDIA_HOST}/shot/{device['mac']}/{ts}.jpg",
+                                "ai_tag_list": [101],
+                            },
+                            {
+                                "type": 2,
+                                "url": f"https://{MEDIA_HOST}/clip/{device['mac']}/{ts}.mp4",
+                                "ai_tag_list": [101],
+                            },
+                        ],
+                    }
+                )
+        events.sort(key=lambda event: event["event_ts"], reverse=True)
+        return events
+
+
+def _ok(data: Any = None) -> dict[str, Any]:
+    """Return a standard successful response."""
+    return {"code": "1", "msg": "SUCCESS", "data": {} if data is None else data}
+
+
+Handler = Callable[[dict[str, Any], web.Request], Any]
+
+
+class FakeWyzeCloud:
+    """aiohttp application emulating the Wyze cloud for a synthetic account."""
+
+    def __init__(
+        self, account: SyntheticAccount, faults: FaultProfile | None = None
+    ) -> None:
+        """Initialize the server."""
+        self.account = account
+        self.faults = faults or FaultProfile()
+        self._random = random.Random(self.faults.seed)
+        self.requests: Counter[str] = Counter()
+        self.injected: Counter[str] = Counter()
+        self.unknown: Counter[str] = Counter()
+        self._runner: web.AppRunner | None = None
+        self.base_url: str | None = None
+        self._handlers: dict[str, Handler] = {
+            "auth-prod.api.wyze.com/api/user/login": self._login,
+            "api.wyzecam.com/app/user/refresh_token": self._refresh_token,
+            "api.wyzecam.com/app/v2/home_page/get_object_list": self._object_list,
+            "api.wyzecam.com/app/v2/device/get_property_list": self._property_list,
+            "api.wyzecam.com/app/v2/device/set_property": self._set_property,
+            "api.wyzecam.com/app/v2/device/get_event_list": self._event_list,
+            "api.wyzecam.com/app/v2/plug/usage_record_list": self._usage_records,
+            "app.wyzecam.com/app/v4/camera/get-streams": self._streams,
+            "wyze-platform-service.wyzecam.com/app/v2/platform/get_user_profile": (
+                lambda body, request: _ok({"notification": True})
+            ),
+            "wyze-membership-service.wyzecam.com/platform/v2/membership/"
+            "get_plan_binding_list_by_user": lambda body, request: _ok([]),
+            "yd-saas-toc.wyzecam.com/openapi/lock/v1/info": self._lock_info,
+            "wyze-lockwood-service.wyzecam.com/plugin/irrigation/get_iot_prop": (
+                self._irrigation_props
+            ),
+            "wyze-lockwood-service.wyzecam.com/plugin/irrigation/zone": (
+                self._irrigation_zones
+            ),
+            f"{MEDIA_HOST}": self._media,
+        }
+
+    def endpoint_counts(self) -> dict[str, int]:
+        """Return the request count per endpoint, busiest first."""
+        return dict(self.requests.most_common())
+
+    def reset_counts(self) -> None:
+        """Reset the request counters."""
+        self.requests.clear()
+        self.injected.clear()
+        self.unknown.clear()
+
+    async def start(self) -> str:
+        """Start listening on a free localhost port and return the base url."""
+        app = web.Application()
+        app.router.add_route("*", "/{host}/{path:.*}", self._dispatch)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+        self.base_url = f"http://127.0.0.1:{port}"
+        return self.base_url
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _dispatch(self, request: web.Request) -> web.StreamResponse:
+        """Apply the fault profile and route to the endpoint handler."""
+        host = request.match_info["host"]
+        path = request.match_info["path"].lstrip("/")
+        endpoint = f"{host}/{path}"
+        self.requests[endpoint] = self.requests[endpoint] + 1
+
+        delay = self.faults.latency + self._random.uniform(0, self.faults.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+        roll = self._random.random()
+        if roll < self.faults.rate_limit_rate:
+            self.injected["429"] += 1
+            return web.json_response(
+                {"code": "429", "msg": "Too Many Requests"}, status=429
+            )
+        if roll < self.faults.rate_limit_rate + self.faults.error_rate:
+            self.injected["500"] += 1
+            return web.Response(status=500, text="Internal Server Error")
+
+        handler = self._handlers.get(endpoint) or self._handlers.get(host)
+        if handler is None:
+            self.unknown[endpoint] += 1
+            if host == "yd-saas-toc.wyzecam.com":
+                return web.json_response({"ErrNo": 0})
+            if "lockwood" in host or "earth" in host or "sirius" in host:
+                return web.json_response({"code": 1, "msg": "", "data": {"props": {}}})
+            if host.startswith("devicemgmt"):
+                return web.json_response(
+                    {"status": 200, "data": {"capabilities": []}, "response": {}}
+                )
+            return web.json_response(_ok())
+
+        body: dict[str, Any] = {}
+        if request.can_read_body:
+            try:
+                body = await request.json()
+            except (json.JSONDecodeError, aiohttp.ContentTypeError):
+                body = dict(await request.post())
+        body.update(request.query)
+        result = handler(body, request)
+        if isinstance(result, Awaitable):
+            result = await result
+        if isinstance(result, web.StreamResponse):
+            return result
+        return web.json_response(result)
+
+    def _login(self, body: dict[str, Any], request: web.Request) -> dict[str, Any]:
+        return {
+            "access_token": "fake-access",
+            "refresh_token": "fake-refresh",
+            "user_id": "fake-user",
+        }
+
+    def _refresh_token(
+        self, body: dict[str, Any], request: web.Request
+    ) -> dict[str, Any]:
+        return _ok({"access_token": "fake-access", "refresh_token": "fake-refresh"})
+
+    def _object_list(
+        self, body: dict[str, Any], request: web.Request
+    ) -> dict[str, Any]:
+        return _ok({"device_list": self.account.devices})
+
+    def _property_list(
+        self, body: dict[str, Any], request: web.Request
+    ) -> dict[str, Any]:
+        properties = self.account.properties.get(body.get("device_mac", ""), {})
+        return _ok(
+            {
+                "property_list": [
+                    {"pid": pid, "value": value} for pid, value in properties.items()
+                ]
+            }
+        )
+
+    def _set_property(
+        self, body: dict[str, Any], request: web.Request
+    ) -> dict[str, Any]:
+        mac = body.get("device_mac", "")
+        if mac in self.account.properties and "pid" in body:
+            self.account.properties[mac][body["pid"]] = str(body.get("pvalue"))
+        return _ok()
+
+    def _event_list(self, body: dict[str, Any], request: web.Request) -> dict[str, Any]:
+        count = int(body.get("count", 20))
+        begin = body.get("begin_time", 0)
+        end = body.get("end_time", float("inf"))
+        events = [
+            event
+            for event in self.account.events()
+            if begin <= event["event_ts"] <= end
+        ]
+        return _ok({"event_list": events[:count]})
+
+    def _usage_records(
+        self, body: dict[str, Any], request: web.Request
+    ) -> dict[str, Any]:
+        now = time.time()
+        day = int(now // 86400) * 86400
+        hour = int(now % 86400 // 3600)
+        today = [12 if offset <= hour else 0 for offset in range(24)]
+        return _ok(
+            {
+                "usage_record_list": [
+                    {"date_time": (day - 86400) * 1000, "data": json.dumps([12] * 24)},
+                    {"date_time": day * 1000, "data": json.dumps(today)},
+                ]
+            }
+        )
+
+    def _streams(self, body: dict[str, Any], request: web.Request) -> dict[str, Any]:
+        return _ok(
+            [
+                {
+                    "property": {
+                        "iot-device::iot-state": 1,
+                        "iot-device::iot-power": 1,
+                    },
+                    "params": {
+                        "signaling_url": "wss://127.0.0.1:1/fake-signaling",
+                        "ice_servers": [
+                            {
+                                "url": "stun:127.0.0.1:3478",
+                                "username": "",
+                                "credential": "",
+                            }
+                        ],
+                    },
+                }
+            ]
+        )
+
+    def _lock_info(self, body: dict[str, Any], request: web.Request) -> dict[str, Any]:
+        return {
+            "ErrNo": 0,
+            "device": {
+                "uuid": body.get("uuid"),
+                "onoff_line": 1,
+                "door_open_status": 0,
+                "trash_mode": 0,
+                "power": 80,
+                "keypad": {"power": 90},
+                "locker_status": {"hardlock": 1},
+            },
+        }
+
+    def _irrigation_props(
+        self, body: dict[str, Any], request: web.Request
+    ) -> dict[str, Any]:
+        return {
+            "code": 1,
+            "data": {
+                "props": {
+                    "iot_state": "connected",
+                    "RSSI": -60,
+                    "IP": "10.0.0.9",
+                    "sn": "SN0001",
+                    "ssid": "bench",
+                }
+            },
+        }
+
+    def _irrigation_zones(
+        self, body: dict[str, Any], request: web.Request
+    ) -> dict[str, Any]:
+        return {
+            "code": 1,
+            "data": {
+                "zones": [
+                    {
+                        "zone_number": number,
+                        "name": f"Zone {number}",
+                        "enabled": True,
+                        "zone_id": f"zone-{number}",
+                        "smart_duration": 600,
+                    }
+                    for number in range(1, 5)
+                ]
+            },
+        }
+
+    def _media(self, body: dict[str, Any], request: web.Request) -> web.Response:
+        return web.Response(
+            body=TINY_JPEG,
+            content_type="image/jpeg",
+            headers={"ETag": '"fake"'},
+        )
+
+
+def _is_wyze_host(host: str | None) -> bool:
+    """Return True if ``host`` belongs to the Wyze cloud."""
+    return host is not None and any(
+        host == domain or host.endswith(f".{domain}") for domain in WYZE_DOMAINS
+    )
+
+
+@contextmanager
+def redirect_wyze_traffic(base_url: str) -> Iterator[None]:
+    """Send every aiohttp request for a Wyze host to the fake cloud."""
+    original = aiohttp.ClientSession._request  # noqa: SLF001
+    base = URL(base_url)
+
+    async def _request(self, method, str_or_url, *args, **kwargs):
+        url = URL(str_or_url)
+        if _is_wyze_host(url.host):
+            url = base.with_path(f"/{url.host}{url.path}").with_query(url.query)
+            kwargs.pop("ssl", None)
+        return await original(self, method, url, *args, **kwargs)
+
+    with mock.patch.object(aiohttp.ClientSession, "_request", _request):
+        yield
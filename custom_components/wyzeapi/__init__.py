@@ -2,19 +2,38 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import partial
+import importlib
 import logging
+import sys
+import time
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
 from aiohttp.client_exceptions import ClientConnectorError
-from homeassistant.config_entries import ConfigEntry, ConfigEntryNotReady, SOURCE_IMPORT
-from homeassistant.const import CONF_USERNAME, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigEntryNotReady,
+    ConfigEntryState,
+    SOURCE_IMPORT,
+)
+from homeassistant.const import (
+    CONF_USERNAME,
+    CONF_PASSWORD,
+    EVENT_HOMEASSISTANT_STOP,
+)
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.check_config import HomeAssistantConfig
-from homeassistant.components import bluetooth
 from wyzeapy import Wyzeapy
 from wyzeapy.exceptions import AccessTokenError
-from wyzeapy.wyze_auth_lib import Token
+from wyzeapy.services.base_service import BaseService
+from wyzeapy.services.bulb_service import BulbService
+from wyzeapy.services.camera_service import Camera
+from wyzeapy.services.lock_service import Lock, LockService
+from wyzeapy.types import Device, DeviceTypes
+from wyzeapy.wyze_auth_lib import Token, WyzeAuthLib
 
 from .const import (
     DOMAIN,
@@ -24,29 +43,68 @@ from .const import (
     REFRESH_TIME,
     WYZE_NOTIFICATION_TOGGLE,
     BULB_LOCAL_CONTROL,
+    CLIP_ARCHIVE,
+    CLIP_ARCHIVE_QUOTA,
+    CLIP_ARCHIVE_TAGS,
+    DEFAULT_CLIP_ARCHIVE,
+    DEFAULT_CLIP_ARCHIVE_QUOTA,
     DEFAULT_LOCAL_CONTROL,
+    DEFAULT_MOTION_HOLD_TIME,
     KEY_ID,
     API_KEY,
+    CLIP_ARCHIVER,
+    EVENT_PIPELINE,
+    LOCK_BOLT_MODELS,
+    MOTION_HOLD_TIME,
+)
+from .capabilities import async_load_platforms, loaded_platforms
+from .device_store import UPDATE_LOOP, async_get_device_store
+from .discovery import INVENTORY_WATCHER, WyzeInventoryWatcher
+from .http_pool import (
+    ACCOUNT_HTTP,
+    WyzeAccountHttp,
+    async_close_http_pool,
+    async_get_http_pool,
 )
-from .coordinator import WyzeLockBoltCoordinator
+from .local_mode import (
+    INVENTORY_CACHE,
+    LOCAL_MODE,
+    LOCAL_PLATFORMS,
+    WyzeInventoryCache,
+    WyzeLocalMode,
+    retry_delays,
+)
+from .login_handoff import async_pop_login, async_store_login
 from .token_manager import TokenManager
+from .token_refresh import TOKEN_REFRESHER, WyzeTokenRefresher
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.check_config import HomeAssistantConfig
+    from wyzeapy.services.camera_service import CameraService
+
+    from .coordinator import WyzeLockBoltCoordinator
+
+# The camera event pipeline (and its sqlite index and clip archiver) and the
+# Lock Bolt coordinator (bleak, pycryptodome) are imported when an account has
+# cameras or a Lock Bolt, not when the integration is loaded.
 
-PLATFORMS = [
-    "light",
-    "switch",
-    "lock",
-    "climate",
-    "alarm_control_panel",
-    "sensor",
-    "binary_sensor",
-    "siren",
-    "cover",
-    "number",
-    "button",
-    "camera",
-]  # Fixme: Re add scene
 _LOGGER = logging.getLogger(__name__)
 
+# Key under hass.data[DOMAIN][entry_id] holding the options the entry runs with.
+APPLIED_OPTIONS = "applied_options"
+# Options the running entry picks up without a reload: the lights and motion
+# sensors read theirs on use and the clip archiver is reconfigured in place.
+# Changing any other option reloads the entry.
+LIVE_OPTIONS = frozenset(
+    {
+        BULB_LOCAL_CONTROL,
+        MOTION_HOLD_TIME,
+        CLIP_ARCHIVE,
+        CLIP_ARCHIVE_QUOTA,
+        CLIP_ARCHIVE_TAGS,
+    }
+)
+
 
 # noinspection PyUnusedLocal
 async def async_setup(
@@ -97,15 +155,39 @@ async def async_setup(
     return True
 
 
-# noinspection DuplicatedCode
-async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
-    """Set up Wyze Home Assistant Integration from a config entry."""
+async def _async_import(hass: HomeAssistant, module: str) -> ModuleType:
+    """Import one of the integration's modules without blocking the loop."""
+    return await hass.async_add_import_executor_job(
+        importlib.import_module, f"{__package__}.{module}"
+    )
 
-    hass.data.setdefault(DOMAIN, {})
 
-    key_id = config_entry.data.get(KEY_ID)
-    api_key = config_entry.data.get(API_KEY)
+class _SetupTimer:
+    """Wall clock time of each phase of an entry setup."""
+
+    def __init__(self) -> None:
+        """Start timing."""
+        self._started = self._last = time.monotonic()
+        self.phases: dict[str, float] = {}
+
+    def mark(self, phase: str) -> None:
+        """Record the time since the previous mark as ``phase``."""
+        now = time.monotonic()
+        self.phases[phase] = now - self._last
+        self._last = now
+
+    def log(self, what: str) -> None:
+        """Log the phase breakdown."""
+        _LOGGER.debug(
+            "%s took %.2fs (%s)",
+            what,
+            time.monotonic() - self._started,
+            ", ".join(f"{phase} {took:.2f}s" for phase, took in self.phases.items()),
+        )
+
 
+async def _async_prepare_ssl_context(hass: HomeAssistant) -> None:
+    """Build wyzeapy's SSL context in the executor."""
     # Pre-build wyzeapy's SSL context (certifi + pinned DigiCert Global Root
     # CA) off the event loop. Mozilla/certifi removed that root in 2026 but
     # Wyze's API chain is still anchored to it, so both aiohttp's default
@@ -122,16 +204,53 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
             "fail on systems whose CA store dropped DigiCert Global Root CA"
         )
 
-    client = await Wyzeapy.create()
-    token = None
-    if config_entry.data.get(ACCESS_TOKEN):
-        token = Token(
-            config_entry.data.get(ACCESS_TOKEN),
-            config_entry.data.get(REFRESH_TOKEN),
-            float(config_entry.data.get(REFRESH_TIME)),
-        )
-    a_tkn_manager = TokenManager(hass, config_entry)
-    client.register_for_token_callback(a_tkn_manager.token_callback)
+
+def _options(config_entry: ConfigEntry) -> dict[str, Any]:
+    """Return the entry's options with the defaults filled in."""
+    return {
+        BULB_LOCAL_CONTROL: config_entry.options.get(
+            BULB_LOCAL_CONTROL, DEFAULT_LOCAL_CONTROL
+        ),
+        MOTION_HOLD_TIME: config_entry.options.get(
+            MOTION_HOLD_TIME, DEFAULT_MOTION_HOLD_TIME
+        ),
+        CLIP_ARCHIVE: config_entry.options.get(CLIP_ARCHIVE, DEFAULT_CLIP_ARCHIVE),
+        CLIP_ARCHIVE_QUOTA: config_entry.options.get(
+            CLIP_ARCHIVE_QUOTA, DEFAULT_CLIP_ARCHIVE_QUOTA
+        ),
+        CLIP_ARCHIVE_TAGS: config_entry.options.get(CLIP_ARCHIVE_TAGS, {}),
+    }
+
+
+def _archive_filters(options: dict[str, Any]) -> dict[str, set[int]]:
+    """Return the clip archive's AI tag filters by camera mac."""
+    return {
+        mac: {int(tag) for tag in tags}
+        for mac, tags in options[CLIP_ARCHIVE_TAGS].items()
+    }
+
+
+def _stored_token(config_entry: ConfigEntry) -> Token | None:
+    """Return the token persisted in the entry's data, if any."""
+    if not config_entry.data.get(ACCESS_TOKEN):
+        return None
+    return Token(
+        config_entry.data.get(ACCESS_TOKEN),
+        config_entry.data.get(REFRESH_TOKEN),
+        float(config_entry.data.get(REFRESH_TIME)),
+    )
+
+
+async def _async_login(
+    hass: HomeAssistant, config_entry: ConfigEntry, token_manager: TokenManager
+) -> Wyzeapy:
+    """Create a client and log in with the entry's credentials."""
+    key_id = config_entry.data.get(KEY_ID)
+    api_key = config_entry.data.get(API_KEY)
+
+    _, client = await asyncio.gather(_async_prepare_ssl_context(hass), Wyzeapy.create())
+    token = _stored_token(config_entry)
+    client.register_for_token_callback(token_manager.token_callback)
     # We should probably try/catch here to invalidate the login credentials and throw a notification if we cannot get
     # a login with the token
     try:
@@ -150,33 +269,365 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
         )
         _LOGGER.error(e)
         raise ConfigEntryAuthFailed("Unable to login, please re-login.") from None
+    return client
+
 
+# noinspection DuplicatedCode
+async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
+    """Set up Wyze Home Assistant Integration from a config entry.
+
+    Only login and the device inventory are on the critical path; steps that
+    don't depend on each other run concurrently, and Lock Bolt initialization,
+    the camera event pipeline and the stale device cleanup continue in the
+    background once the platforms are forwarded. Every service's device list
+    is seeded from the inventory, so the platforms don't fetch it again.
+    """
+
+    hass.data.setdefault(DOMAIN, {})
+    timer = _SetupTimer()
+
+    a_tkn_manager = TokenManager(hass, config_entry)
+    # Tokens still waiting to be written are written on unload and shutdown
+    config_entry.async_on_unload(a_tkn_manager.async_flush)
+    config_entry.async_on_unload(
+        hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, a_tkn_manager.async_flush)
+    )
+    cache = WyzeInventoryCache(hass, config_entry.entry_id)
+    handoff = async_pop_login(hass, config_entry.data.get(CONF_USERNAME))
+    if handoff is not None:
+        # The config flow logged in moments ago; reuse its session
+        client = handoff.client
+        client.register_for_token_callback(a_tkn_manager.token_callback)
+        # Its login happened before the callback existed; store that token too
+        if (token := client._auth_lib.token) is not None:  # noqa: SLF001
+            await a_tkn_manager.token_callback(token)
+    else:
+        try:
+            client = await _async_login(hass, config_entry, a_tkn_manager)
+        except ConfigEntryNotReady:
+            if not await _async_setup_local_mode(
+                hass, config_entry, cache, a_tkn_manager
+            ):
+                raise
+            return True
+    # Requests share the process wide connection pool from here on
+    account_http = WyzeAccountHttp(await async_get_http_pool(hass))
+    account_http.async_attach(client._auth_lib)  # noqa: SLF001
+    timer.mark("login")
+
+    options = _options(config_entry)
+    if options != config_entry.options:
+        # Fill in options added after the entry was created
+        hass.config_entries.async_update_entry(config_entry, options=options)
     hass.data[DOMAIN][config_entry.entry_id] = {
         CONF_CLIENT: client,
         "key_id": KEY_ID,
         "api_key": API_KEY,
         "coordinators": {},
+        INVENTORY_CACHE: cache,
+        APPLIED_OPTIONS: options,
+        ACCOUNT_HTTP: account_http,
     }
-    await setup_coordinators(hass, config_entry, client)
+    refresher = WyzeTokenRefresher(hass, config_entry, client)
+    hass.data[DOMAIN][config_entry.entry_id][TOKEN_REFRESHER] = refresher
+    refresher.async_start()
+    config_entry.async_on_unload(refresher.async_stop)
+    config_entry.async_on_unload(
+        config_entry.add_update_listener(options_update_listener)
+    )
 
-    options_dict = {
-        BULB_LOCAL_CONTROL: config_entry.options.get(
-            BULB_LOCAL_CONTROL, DEFAULT_LOCAL_CONTROL
+    camera_service = await client.camera_service
+    if handoff is not None and handoff.inventory is not None:
+        inventory, hms_service, _ = (
+            handoff.inventory,
+            await client.hms_service,
+            await cache.async_load(),
         )
-    }
-    hass.config_entries.async_update_entry(config_entry, options=options_dict)
+    else:
+        inventory, hms_service, _ = await asyncio.gather(
+            camera_service.get_object_list(), client.hms_service, cache.async_load()
+        )
+    hms_id = hms_service.hms_id
+    services = await _async_device_services(client)
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+    @callback
+    def _async_set_inventory(devices: list[Device]) -> None:
+        cache.async_set_inventory(devices)
+        _seed_device_lists(services, devices)
 
-    mac_addresses = await client.unique_device_ids
+    _async_set_inventory(inventory)
+    timer.mark("inventory")
 
-    mac_addresses.add(WYZE_NOTIFICATION_TOGGLE)
+    await setup_coordinators(hass, config_entry, client, inventory)
+    await async_load_platforms(hass, config_entry, inventory, hms_id is not None)
+    timer.mark("platforms")
 
-    hms_service = await client.hms_service
-    hms_id = hms_service.hms_id
+    store = async_get_device_store(hass, config_entry.entry_id)
+    if cameras := [
+        store.device(Camera(device.raw_dict))
+        for device in inventory
+        if device.type is DeviceTypes.CAMERA
+    ]:
+        config_entry.async_create_background_task(
+            hass,
+            _async_start_event_pipeline(hass, config_entry, camera_service, cameras),
+            f"{DOMAIN} event pipeline {config_entry.entry_id}",
+        )
+
+    watcher = WyzeInventoryWatcher(
+        hass,
+        config_entry,
+        camera_service,
+        inventory,
+        on_added=partial(_async_devices_added, hass, config_entry, client),
+        on_removed=partial(_async_devices_removed, hass, config_entry),
+        on_inventory=_async_set_inventory,
+    )
+    hass.data[DOMAIN][config_entry.entry_id][INVENTORY_WATCHER] = watcher
+    watcher.async_start()
+
+    mac_addresses = {device.mac for device in inventory}
+    mac_addresses.add(WYZE_NOTIFICATION_TOGGLE)
     if hms_id is not None:
         mac_addresses.add(hms_id)
+    config_entry.async_create_background_task(
+        hass,
+        _async_remove_stale_devices(hass, config_entry, mac_addresses),
+        f"{DOMAIN} device cleanup {config_entry.entry_id}",
+    )
+
+    timer.log(f"Setup of {config_entry.title or config_entry.entry_id}")
+    return True
+
+
+async def _async_device_services(client: Wyzeapy) -> list[BaseService]:
+    """Return the client's services that list the account's devices."""
+    return list(
+        await asyncio.gather(
+            client.bulb_service,
+            client.switch_service,
+            client.camera_service,
+            client.thermostat_service,
+            client.lock_service,
+            client.sensor_service,
+            client.irrigation_service,
+            client.wall_switch_service,
+        )
+    )
+
+
+@callback
+def _seed_device_lists(services: list[BaseService], devices: list[Device]) -> None:
+    """Give every service the current inventory of its own account.
+
+    Their ``get_*`` methods fetch the device list on first use and keep it,
+    and until then read the list wyzeapy shares across all accounts.
+    """
+    for service in services:
+        service._devices = list(devices)  # noqa: SLF001
+
+
+async def _async_setup_local_mode(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    cache: WyzeInventoryCache,
+    token_manager: TokenManager,
+) -> bool:
+    """Start the local capable devices from the cache while the cloud is down.
+
+    Returns False if there is nothing that works without the cloud.
+    """
+    await cache.async_load()
+    bulbs = (
+        cache.bulbs()
+        if config_entry.options.get(BULB_LOCAL_CONTROL, DEFAULT_LOCAL_CONTROL)
+        else []
+    )
+    bolts = cache.lock_bolts()
+    if not bulbs and not bolts:
+        return False
 
+    # Services for local control; nothing is sent to the cloud until a
+    # command falls back to it, with the stored token
+    auth_lib = await WyzeAuthLib.create(
+        config_entry.data.get(CONF_USERNAME),
+        config_entry.data.get(CONF_PASSWORD),
+        config_entry.data.get(KEY_ID),
+        config_entry.data.get(API_KEY),
+        token=_stored_token(config_entry),
+        token_callback=token_manager.token_callback,
+    )
+    account_http = WyzeAccountHttp(await async_get_http_pool(hass))
+    account_http.async_attach(auth_lib)
+    local = WyzeLocalMode(BulbService(auth_lib), LockService(auth_lib), bulbs)
+    hass.data[DOMAIN][config_entry.entry_id] = {
+        "coordinators": {},
+        INVENTORY_CACHE: cache,
+        LOCAL_MODE: local,
+        APPLIED_OPTIONS: _options(config_entry),
+        ACCOUNT_HTTP: account_http,
+    }
+    config_entry.async_on_unload(
+        config_entry.add_update_listener(options_update_listener)
+    )
+    for coordinator, (_, info) in zip(
+        await _async_create_bolt_coordinators(
+            hass, config_entry, local.lock_service, [lock for lock, _ in bolts]
+        ),
+        bolts,
+    ):
+        coordinator.restore_lock_info(info)
+
+    _LOGGER.warning(
+        "Wyze cloud unreachable; running %d bulbs and %d Lock Bolts locally "
+        "until it is back",
+        len(bulbs),
+        len(hass.data[DOMAIN][config_entry.entry_id]["coordinators"]),
+    )
+    await async_load_platforms(
+        hass,
+        config_entry,
+        [*bulbs, *(lock for lock, _ in bolts)],
+        only=LOCAL_PLATFORMS,
+    )
+    config_entry.async_create_background_task(
+        hass,
+        _async_retry_cloud_login(hass, config_entry, local),
+        f"{DOMAIN} cloud login retry {config_entry.entry_id}",
+    )
+    return True
+
+
+async def _async_retry_cloud_login(
+    hass: HomeAssistant, config_entry: ConfigEntry, local: WyzeLocalMode
+) -> None:
+    """Retry the login with a backoff and reload the entry once it works."""
+    for delay in retry_delays():
+        await asyncio.sleep(delay)
+        local.login_attempts += 1
+        token_manager = TokenManager(hass, config_entry)
+        try:
+            client = await _async_login(hass, config_entry, token_manager)
+        except ConfigEntryNotReady:
+            _LOGGER.debug("Wyze cloud still unreachable, next try in %.0fs", delay)
+            continue
+        except ConfigEntryAuthFailed:
+            config_entry.async_start_reauth(hass)
+            return
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.warning("Wyze login failed: %s", err)
+            continue
+        # The setup after the reload registers its own token callback
+        client.unregister_for_token_callback(token_manager.token_callback)
+        token_manager.async_flush()
+        async_store_login(hass, config_entry.data.get(CONF_USERNAME), client)
+        _LOGGER.info("Wyze cloud reachable again, reloading")
+        hass.config_entries.async_schedule_reload(config_entry.entry_id)
+        return
+
+
+async def _async_start_event_pipeline(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    camera_service: CameraService,
+    cameras: list[Camera],
+) -> None:
+    """Start the camera event pipeline (and the clip archiver, if enabled)."""
+    timer = _SetupTimer()
+    events = await _async_import(hass, "events")
+    event_index = await _async_import(hass, "event_index")
+    timer.mark("import")
+    pipeline = events.WyzeCameraEventPipeline(
+        hass,
+        config_entry,
+        camera_service,
+        await event_index.async_get_event_index(hass),
+    )
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    entry_data[EVENT_PIPELINE] = pipeline
+    if entry_data[APPLIED_OPTIONS][CLIP_ARCHIVE]:
+        # Subscribe before the pipeline replays events missed while down
+        await _async_start_clip_archiver(hass, config_entry, cameras)
+    await pipeline.async_start(cameras)
+    timer.mark("start")
+    timer.log("Camera event pipeline start")
+
+
+async def _async_start_clip_archiver(
+    hass: HomeAssistant, config_entry: ConfigEntry, cameras: list[Camera]
+) -> None:
+    """Start archiving the clips of ``cameras``."""
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    options = entry_data[APPLIED_OPTIONS]
+    archive = await _async_import(hass, "archive")
+    archiver = archive.WyzeClipArchiver(
+        hass,
+        config_entry.entry_id,
+        options[CLIP_ARCHIVE_QUOTA] * 1024 * 1024,
+        _archive_filters(options),
+    )
+    entry_data[CLIP_ARCHIVER] = archiver
+    await archiver.async_start(cameras)
+
+
+async def _async_devices_added(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    client: Wyzeapy,
+    devices: list[Device],
+) -> None:
+    """Set up what devices added while running need besides their entities."""
+    await setup_coordinators(hass, config_entry, client, devices)
+    if not (
+        cameras := [
+            Camera(device.raw_dict)
+            for device in devices
+            if device.type is DeviceTypes.CAMERA
+        ]
+    ):
+        return
+    store = async_get_device_store(hass, config_entry.entry_id)
+    cameras = [store.device(camera) for camera in cameras]
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    if (pipeline := entry_data.get(EVENT_PIPELINE)) is not None:
+        pipeline.async_add_cameras(cameras)
+        return
+    config_entry.async_create_background_task(
+        hass,
+        _async_start_event_pipeline(
+            hass,
+            config_entry,
+            await client.camera_service,
+            cameras,
+        ),
+        f"{DOMAIN} event pipeline {config_entry.entry_id}",
+    )
+
+
+@callback
+async def _async_devices_removed(
+    hass: HomeAssistant, config_entry: ConfigEntry, macs: set[str]
+) -> None:
+    """Drop what devices removed while running left behind."""
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    # Lock Bolt coordinators hold a BLE connection and background tasks
+    coordinators = [
+        coordinator
+        for mac in macs
+        if (coordinator := entry_data["coordinators"].pop(mac, None)) is not None
+    ]
+    await asyncio.gather(
+        *(coordinator.async_shutdown() for coordinator in coordinators),
+        return_exceptions=True,
+    )
+    if (pipeline := entry_data.get(EVENT_PIPELINE)) is not None:
+        pipeline.async_remove_cameras(macs)
+
+
+async def _async_remove_stale_devices(
+    hass: HomeAssistant, config_entry: ConfigEntry, mac_addresses: set[str]
+) -> None:
+    """Remove devices of the entry that are no longer on the account."""
     device_registry = dr.async_get(hass)
     for device in dr.async_entries_for_config_entry(
         device_registry, config_entry.entry_id
@@ -190,43 +641,192 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
                     "%s is not in the mac_addresses list, removing the entry", mac
                 )
                 device_registry.async_remove_device(device.id)
-    return True
 
 
 async def options_update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
-    """Handle options update."""
-    _LOGGER.debug("Updated options")
-    entry_data = config_entry.as_dict().get("data")
-    hass.config_entries.async_update_entry(
-        config_entry,
-        data=entry_data,
-    )
-    _LOGGER.debug("Reload entry: " + config_entry.entry_id)
-    await hass.config_entries.async_reload(config_entry.entry_id)
+    """Apply changed options to the running entry, reloading only if needed."""
+    if (entry_data := hass.data[DOMAIN].get(config_entry.entry_id)) is None:
+        return
+    options = _options(config_entry)
+    applied = entry_data[APPLIED_OPTIONS]
+    # The listener also runs for data updates, e.g. a refreshed token
+    if not (changed := {key for key in options if options[key] != applied[key]}):
+        return
+    entry_data[APPLIED_OPTIONS] = options
+    if changed - LIVE_OPTIONS or (
+        # Which bulbs run locally without the cloud is decided at setup
+        LOCAL_MODE in entry_data and BULB_LOCAL_CONTROL in changed
+    ):
+        _LOGGER.debug("Options %s changed, reloading", ", ".join(sorted(changed)))
+        hass.config_entries.async_schedule_reload(config_entry.entry_id)
+        return
+
+    _LOGGER.debug("Applying options %s", ", ".join(sorted(changed)))
+    if (pipeline := entry_data.get(EVENT_PIPELINE)) is None:
+        # No cameras, or the pipeline is still starting and reads the options
+        return
+    archiver = entry_data.get(CLIP_ARCHIVER)
+    if not options[CLIP_ARCHIVE]:
+        if archiver is not None:
+            del entry_data[CLIP_ARCHIVER]
+            await archiver.async_stop()
+    elif archiver is None:
+        await _async_start_clip_archiver(hass, config_entry, pipeline.cameras)
+    else:
+        await archiver.async_configure(
+            options[CLIP_ARCHIVE_QUOTA] * 1024 * 1024, _archive_filters(options)
+        )
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
 
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    if (pipeline := entry_data.get(EVENT_PIPELINE)) is not None:
+        await pipeline.async_stop()
+    if (archiver := entry_data.get(CLIP_ARCHIVER)) is not None:
+        await archiver.async_stop()
+
+    if not await hass.config_entries.async_unload_platforms(
+        entry, loaded_platforms(hass, entry)
+    ):
+        return False
 
+    # The entities are gone; drop what they shared: the Lock Bolt BLE
+    # connections, the client and its services, the device store and caches
+    coordinators = entry_data.get("coordinators", {}).values()
+    await asyncio.gather(
+        *(coordinator.async_shutdown() for coordinator in coordinators),
+        return_exceptions=True,
+    )
+    hass.data[DOMAIN].pop(entry.entry_id, None)
+
+    if not any(
+        other.state is ConfigEntryState.LOADED
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.entry_id != entry.entry_id
+    ):
+        await _async_release_domain(hass)
+    return True
+
+
+def _loaded_module(name: str) -> ModuleType | None:
+    """Return one of the integration's modules if something imported it."""
+    return sys.modules.get(f"{__package__}.{name}")
+
+
+async def _async_release_domain(hass: HomeAssistant) -> None:
+    """Release what the entries shared, once the last one is unloaded."""
+    if (energy := _loaded_module("energy")) is not None:
+        await energy.async_release_energy_ledgers(hass)
+    if (event_index := _loaded_module("event_index")) is not None:
+        await event_index.async_close_event_index(hass)
+    _reset_wyzeapy_update_manager(hass)
+    await async_close_http_pool(hass)
+
+
+def _reset_wyzeapy_update_manager(hass: HomeAssistant) -> None:
+    """Reset wyzeapy's process wide update loop after the last unload.
+
+    Every entity has deregistered its device through ``unregister_updater``
+    by now, but wyzeapy 0.5 has no public way to stop the loop: it only
+    marks removed updaters, and ``start_update_manager`` never starts the
+    loop again once it ran, so the next setup would get no updates. This is
+    the one place that touches wyzeapy's private update state. It only acts
+    on a loop the integration started itself, and checks the layout first
+    so it does nothing if a wyzeapy release changed it.
+    """
+    if (task := hass.data[DOMAIN].get(UPDATE_LOOP)) is None:
+        return
+    manager = getattr(BaseService, "_update_manager", None)
+    if not (
+        hasattr(BaseService, "_update_loop")
+        and isinstance(getattr(BaseService, "_updater_dict", None), dict)
+        and isinstance(getattr(manager, "updaters", None), list)
+        and isinstance(getattr(manager, "removed_updaters", None), list)
+    ):
+        _LOGGER.debug("Unknown wyzeapy update manager layout, not resetting it")
+        return
+    if any(
+        not any(updater is removed for removed in manager.removed_updaters)
+        for updater in manager.updaters
+    ):
+        _LOGGER.debug("wyzeapy still has registered updaters, not resetting it")
+        return
+
+    del hass.data[DOMAIN][UPDATE_LOOP]
+    task.cancel()
+    BaseService._update_loop = None
+    manager.updaters.clear()
+    manager.removed_updaters.clear()
+    BaseService._updater_dict.clear()
+
+
+async def _async_create_bolt_coordinators(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    lock_service: LockService,
+    locks: list[Lock],
+) -> list[WyzeLockBoltCoordinator]:
+    """Create the Bluetooth coordinators of ``locks``, if Bluetooth works."""
+    if not locks:
+        return []
+    from homeassistant.components import bluetooth
 
-async def setup_coordinators(
-    hass: HomeAssistant, config_entry: ConfigEntry, client: Wyzeapy
-):
-    """Set up coordinators for Wyze devices that require Bluetooth."""
     # Check if Bluetooth is active and functioning
     if bluetooth.async_scanner_count(hass, connectable=True) == 0:
         _LOGGER.info(
             "Bluetooth is not active or no scanners available. Skipping WyzeLockBoltCoordinator setup."
         )
+        return []
+
+    coordinator_module = await _async_import(hass, "coordinator")
+    coordinators = hass.data[DOMAIN][config_entry.entry_id].setdefault(
+        "coordinators", {}
+    )
+    created = []
+    for lock in locks:
+        coordinator = coordinator_module.WyzeLockBoltCoordinator(
+            hass, lock_service, lock
+        )
+        coordinators[lock.mac] = coordinator
+        created.append(coordinator)
+    return created
+
+
+async def setup_coordinators(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    client: Wyzeapy,
+    inventory: list[Device],
+):
+    """Set up coordinators for Wyze devices that require Bluetooth.
+
+    The lock info (BLE address and token) of each Lock Bolt is fetched in the
+    background; the lock platform adds the entity once it is known.
+    """
+    bolts = [
+        Lock(device.raw_dict)
+        for device in inventory
+        if device.product_model in LOCK_BOLT_MODELS
+    ]
+    if not bolts:
         return
+    cache: WyzeInventoryCache = hass.data[DOMAIN][config_entry.entry_id][
+        INVENTORY_CACHE
+    ]
+    for coordinator in await _async_create_bolt_coordinators(
+        hass, config_entry, await client.lock_service, bolts
+    ):
+        coordinator.async_load_lock_info(config_entry).add_done_callback(
+            partial(_cache_lock_info, cache, coordinator)
+        )
 
-    lock_service = await client.lock_service
-    for lock in await lock_service.get_locks():
-        if lock.product_model == "YD_BT1":
-            coordinators = hass.data[DOMAIN][config_entry.entry_id].setdefault(
-                "coordinators", {}
-            )
-            coordinators[lock.mac] = WyzeLockBoltCoordinator(hass, lock_service, lock)
-            await coordinators[lock.mac].update_lock_info()
+
+@callback
+def _cache_lock_info(
+    cache: WyzeInventoryCache, coordinator: WyzeLockBoltCoordinator, task: asyncio.Task
+) -> None:
+    """Remember the lock info once loaded, for starting without the cloud."""
+    if not task.cancelled() and task.result():
+        cache.async_set_lock_info(coordinator.lock)
@@ -0,0 +1,274 @@
+"""Optional archiving of camera event clips to local storage.
+
+Event videos (``file_list`` entries of type 2) are signed links that expire
+shortly after the event, so clips have to be fetched as soon as the event
+pipeline reports them. Downloads are streamed to disk in chunks, at most a few
+at a time across all accounts, and interrupted transfers are resumed with a
+``Range`` request. Archived clips are kept under
+``<config>/wyzeapi_clips/<entry_id>/<mac>``, so each entry's quota only
+counts (and evicts) its own clips, and the oldest are deleted once the disk
+quota is exceeded.
+
+Each camera can be limited to events carrying one of a set of AI tags (see
+``event_index.AI_TAG_NAMES``); cameras without a filter archive every event.
+"""
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass
+import logging
+import os
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from aiohttp import ClientError, ClientTimeout
+from wyzeapy.services.camera_service import Camera
+from wyzeapy.types import Event
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import DOMAIN
+from .event_index import event_ai_tags
+from .events import camera_event_signal
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key under hass.data[DOMAIN] holding the download semaphore shared by entries.
+CLIP_DOWNLOADS = "clip_downloads"
+ARCHIVE_DIR = f"{DOMAIN}_clips"
+MAX_CONCURRENT_DOWNLOADS = 2
+MAX_ATTEMPTS = 3
+CHUNK_SIZE = 64 * 1024
+DOWNLOAD_TIMEOUT = ClientTimeout(total=None, sock_connect=10, sock_read=30)
+_PARTIAL_SUFFIX = ".part"
+
+
+@dataclass(slots=True)
+class ArchivedClip:
+    """A clip stored on disk."""
+
+    path: Path
+    size: int
+    mtime: float
+
+
+def _clip_video_url(event: Event) -> str | None:
+    """Return the video url of ``event``, if any."""
+    for resource in getattr(event, "file_list", None) or []:
+        if resource.get("type") == 2 and resource.get("url"):
+            return resource["url"]
+    return None
+
+
+def clip_name(event_ts: int, event_id: str) -> str:
+    """Return the file name of the archived clip of an event."""
+    return f"{event_ts}_{event_id}.mp4"
+
+
+def find_clip(root: Path, mac: str, event_ts: int, event_id: str) -> Path | None:
+    """Return the archived clip of an event in any entry's archive, if any."""
+    return next(root.glob(f"*/{mac}/{clip_name(event_ts, event_id)}"), None)
+
+
+def _migrate(root: Path, directory: Path, macs: Iterable[str]) -> None:
+    """Move clips archived under ``root/<mac>`` by older versions into place."""
+    for mac in macs:
+        if (legacy := root / mac).is_dir() and not (directory / mac).exists():
+            directory.mkdir(parents=True, exist_ok=True)
+            legacy.rename(directory / mac)
+
+
+def _scan(directory: Path) -> list[ArchivedClip]:
+    """Return the archived clips below ``directory``, oldest first."""
+    clips = []
+    if directory.is_dir():
+        for path in directory.glob("*/*.mp4"):
+            stat = path.stat()
+            clips.append(ArchivedClip(path, stat.st_size, stat.st_mtime))
+        # Transfers interrupted by a restart can't be resumed; the link expired
+        for path in directory.glob(f"*/*{_PARTIAL_SUFFIX}"):
+            path.unlink(missing_ok=True)
+    clips.sort(key=lambda clip: clip.mtime)
+    return clips
+
+
+def _open_partial(path: Path) -> tuple[int, BinaryIO]:
+    """Open ``path`` for appending and return its current size and handle."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handle = path.open("ab")
+    return handle.tell(), handle
+
+
+def _complete(partial: Path, path: Path) -> os.stat_result:
+    """Move a finished download into place and return its stat."""
+    partial.replace(path)
+    return path.stat()
+
+
+class WyzeClipArchiver:
+    """Downloads event clips of one config entry to local storage."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        quota: int,
+        filters: dict[str, set[int]] | None = None,
+    ) -> None:
+        """Initialize the archiver.
+
+        ``quota`` is the disk budget in bytes of the entry's clips,
+        ``filters`` maps a camera mac to the AI tags whose events are
+        archived.
+        """
+        self._hass = hass
+        self._root = Path(hass.config.path(ARCHIVE_DIR))
+        self._directory = self._root / entry_id
+        self._quota = quota
+        self._filters = filters or {}
+        self._clips: list[ArchivedClip] = []
+        self._used = 0
+        self._tasks: set[asyncio.Task] = set()
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._semaphore: asyncio.Semaphore = hass.data.setdefault(
+            DOMAIN, {}
+        ).setdefault(CLIP_DOWNLOADS, asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS))
+        self.archived = 0
+        self.failed = 0
+        self.evicted = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the archive counters."""
+        return {
+            "clips": len(self._clips),
+            "bytes": self._used,
+            "quota": self._quota,
+            "downloading": len(self._tasks),
+            "archived": self.archived,
+            "failed": self.failed,
+            "evicted": self.evicted,
+        }
+
+    async def async_start(self, cameras: Iterable[Camera]) -> None:
+        """Load the existing archive and start following camera events."""
+        cameras = list(cameras)
+        await self._hass.async_add_executor_job(
+            _migrate, self._root, self._directory, [camera.mac for camera in cameras]
+        )
+        self._clips = await self._hass.async_add_executor_job(_scan, self._directory)
+        self._used = sum(clip.size for clip in self._clips)
+        for camera in cameras:
+            self._unsubs.append(
+                async_dispatcher_connect(
+                    self._hass,
+                    camera_event_signal(camera.mac),
+                    self._async_handle_event,
+                )
+            )
+        await self._async_enforce_quota()
+
+    async def async_stop(self) -> None:
+        """Stop following events and abort downloads in flight."""
+        while self._unsubs:
+            self._unsubs.pop()()
+        for task in self._tasks:
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def async_configure(
+        self, quota: int, filters: dict[str, set[int]] | None = None
+    ) -> None:
+        """Change the disk budget and filters, evicting clips over the budget."""
+        self._quota = quota
+        self._filters = filters or {}
+        await self._async_enforce_quota()
+
+    @callback
+    def _async_handle_event(self, camera: Camera, event: Event) -> None:
+        """Queue the clip of ``event`` if it passes the camera's filter."""
+        if (url := _clip_video_url(event)) is None:
+            return
+        wanted = self._filters.get(camera.mac)
+        if wanted and not wanted & event_ai_tags(event):
+            return
+        path = self._directory / camera.mac / clip_name(event.event_ts, event.event_id)
+        task = self._hass.async_create_background_task(
+            self._async_archive(url, path), f"{DOMAIN} archive {event.event_id}"
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _async_archive(self, url: str, path: Path) -> None:
+        """Download one clip, retrying with resume, and enforce the quota."""
+        partial = path.with_suffix(_PARTIAL_SUFFIX)
+        async with self._semaphore:
+            for attempt in range(MAX_ATTEMPTS):
+                try:
+                    await self._async_download(url, partial)
+                    break
+                except (ClientError, TimeoutError, OSError) as err:
+                    _LOGGER.debug(
+                        "Clip download attempt %s for %s failed: %s",
+                        attempt + 1,
+                        path.name,
+                        err,
+                    )
+                    if attempt + 1 < MAX_ATTEMPTS:
+                        await asyncio.sleep(2**attempt)
+            else:
+                self.failed += 1
+                await self._hass.async_add_executor_job(
+                    lambda: partial.unlink(missing_ok=True)
+                )
+                return
+
+        stat = await self._hass.async_add_executor_job(_complete, partial, path)
+        self._clips.append(ArchivedClip(path, stat.st_size, stat.st_mtime))
+        self._used += stat.st_size
+        self.archived += 1
+        await self._async_enforce_quota()
+
+    async def _async_download(self, url: str, partial: Path) -> None:
+        """Stream ``url`` into ``partial``, resuming from its current size."""
+        offset, handle = await self._hass.async_add_executor_job(_open_partial, partial)
+        try:
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            session = async_get_clientsession(self._hass)
+            async with session.get(
+                url, headers=headers, timeout=DOWNLOAD_TIMEOUT
+            ) as response:
+                if response.status == 416:
+                    # Everything was received before the connection dropped
+                    return
+                response.raise_for_status()
+                if offset and response.status != 206:
+                    # The server ignored the range; start over
+                    await self._hass.async_add_executor_job(handle.truncate, 0)
+                    await self._hass.async_add_executor_job(handle.seek, 0)
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    await self._hass.async_add_executor_job(handle.write, chunk)
+        finally:
+            await self._hass.async_add_executor_job(handle.close)
+
+    async def _async_enforce_quota(self) -> None:
+        """Delete the oldest clips until the archive fits the quota."""
+        evict: list[Path] = []
+        while self._clips and self._used > self._quota:
+            clip = self._clips.pop(0)
+            self._used -= clip.size
+            evict.append(clip.path)
+        if not evict:
+            return
+        self.evicted += len(evict)
+
+        def _remove() -> None:
+            for path in evict:
+                path.unlink(missing_ok=True)
+                if not any(path.parent.iterdir()):
+                    os.rmdir(path.parent)
+
+        await self._hass.async_add_executor_job(_remove)
@@ -2,29 +2,51 @@
 This module describes the connection between Home Assistant and Wyze for the Sensors
 """
 
+import asyncio
 import logging
 import time
 from typing import Callable, List, Any
 
+from aiohttp import ClientError
+
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorDeviceClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_ATTRIBUTION, EntityCategory
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
 from wyzeapy import Wyzeapy, CameraService, SensorService
+from wyzeapy.exceptions import AccessTokenError, UnknownApiError
 from wyzeapy.services.camera_service import Camera
 from wyzeapy.services.irrigation_service import Irrigation, IrrigationService
 from wyzeapy.services.sensor_service import Sensor
-from wyzeapy.types import DeviceTypes
+from wyzeapy.types import Device, DeviceTypes, Event
+from .capabilities import is_irrigation
+from .device_store import WyzeDeviceStore, async_get_device_store, device_signal
+from .discovery import async_register_device_adder
+from .events import camera_event_signal
 from .irrigation import WyzeIrrigationEntity, WyzeIrrigationZoneEntity
 from .token_manager import token_exception_handler
 
-from .const import DOMAIN, CONF_CLIENT
+from .const import (
+    DOMAIN,
+    CONF_CLIENT,
+    DEFAULT_MOTION_HOLD_TIME,
+    MOTION_HOLD_TIME,
+)
 
 _LOGGER = logging.getLogger(__name__)
 ATTRIBUTION = "Data provided by Wyze"
+# Seconds between two rounds of contact and motion sensor updates. The
+# sensors poll in a loop of their own: on wyzeapy's shared update manager,
+# which makes one request per second for every device in the process, a
+# handful of sensors at this rate would slow all other devices down.
+SENSOR_POLL_INTERVAL = 5
+# Seconds between updates of a camera.
+CAMERA_UPDATE_INTERVAL = 30
 
 
 @token_exception_handler
@@ -47,50 +69,147 @@ async def async_setup_entry(
 
     sensor_service = await client.sensor_service
     camera_service = await client.camera_service
-
-    cameras = [
-        WyzeCameraMotion(camera_service, camera)
-        for camera in await camera_service.get_cameras()
-    ]
-    sensors = [
-        WyzeSensor(sensor_service, sensor)
-        for sensor in await sensor_service.get_sensors()
-    ]
-
-    async_add_entities(cameras, True)
-    async_add_entities(sensors, True)
-
-    # Irrigation (Wyze Sprinkler Controller) binary sensors
     irrigation_service = await client.irrigation_service
-    irrigation_entities: List[Any] = []
-    for device in await irrigation_service.get_irrigations():
-        device = await irrigation_service.update(device)
-        # Device-level smart-skip (weather intelligence) status
-        irrigation_entities.extend(
-            [
-                WyzeIrrigationSkipBinarySensor(
-                    irrigation_service, device, "skip_rain", "Rain Skip", "mdi:weather-rainy"
-                ),
-                WyzeIrrigationSkipBinarySensor(
-                    irrigation_service, device, "skip_wind", "Wind Skip", "mdi:weather-windy"
-                ),
-                WyzeIrrigationSkipBinarySensor(
-                    irrigation_service, device, "skip_low_temp", "Freeze Skip", "mdi:snowflake"
-                ),
-                WyzeIrrigationSkipBinarySensor(
-                    irrigation_service, device, "skip_saturation", "Saturation Skip", "mdi:water-alert"
-                ),
-                WyzeIrrigationSchedulesEnabled(irrigation_service, device),
-            ]
-        )
-        # Per-zone running status
-        for zone in device.zones:
-            if zone.enabled:
-                irrigation_entities.append(
-                    WyzeIrrigationZoneRunning(irrigation_service, device, zone)
-                )
+    store = async_get_device_store(hass, config_entry.entry_id)
+    poller = WyzeSensorPoller(hass, config_entry, sensor_service, store)
+
+    async def _async_add_devices(devices: List[Device]) -> None:
+        cameras = [
+            WyzeCameraMotion(
+                camera_service,
+                store.device(Camera(device.raw_dict)),
+                config_entry,
+                store,
+            )
+            for device in devices
+            if device.type is DeviceTypes.CAMERA
+        ]
+        sensors = [
+            WyzeSensor(store.device(Sensor(device.raw_dict)), poller)
+            for device in devices
+            if device.type in (DeviceTypes.MOTION_SENSOR, DeviceTypes.CONTACT_SENSOR)
+        ]
+
+        async_add_entities(cameras, True)
+        async_add_entities(sensors, True)
+
+        # Irrigation (Wyze Sprinkler Controller) binary sensors
+        irrigation_entities: List[Any] = []
+        for device in devices:
+            if not is_irrigation(device):
+                continue
+            device = await irrigation_service.update(Irrigation(device.raw_dict))
+            # Device-level smart-skip (weather intelligence) status
+            irrigation_entities.extend(
+                [
+                    WyzeIrrigationSkipBinarySensor(
+                        irrigation_service,
+                        device,
+                        "skip_rain",
+                        "Rain Skip",
+                        "mdi:weather-rainy",
+                    ),
+                    WyzeIrrigationSkipBinarySensor(
+                        irrigation_service,
+                        device,
+                        "skip_wind",
+                        "Wind Skip",
+                        "mdi:weather-windy",
+                    ),
+                    WyzeIrrigationSkipBinarySensor(
+                        irrigation_service,
+                        device,
+                        "skip_low_temp",
+                        "Freeze Skip",
+                        "mdi:snowflake",
+                    ),
+                    WyzeIrrigationSkipBinarySensor(
+                        irrigation_service,
+                        device,
+                        "skip_saturation",
+                        "Saturation Skip",
+                        "mdi:water-alert",
+                    ),
+                    WyzeIrrigationSchedulesEnabled(irrigation_service, device),
+                ]
+            )
+            # Per-zone running status
+            for zone in device.zones:
+                if zone.enabled:
+                    irrigation_entities.append(
+                        WyzeIrrigationZoneRunning(irrigation_service, device, zone)
+                    )
+
+        async_add_entities(irrigation_entities, True)
+
+    await _async_add_devices(
+        [
+            *await camera_service.get_cameras(),
+            *await sensor_service.get_sensors(),
+            *await irrigation_service.get_irrigations(),
+        ]
+    )
+    async_register_device_adder(hass, config_entry, "binary_sensor", _async_add_devices)
+
+
+class WyzeSensorPoller:
+    """Updates one entry's contact and motion sensors in a loop of its own.
+
+    The loop runs as a background task of the config entry, so it ends with
+    the entry, and stops once the last sensor is removed.
+    """
 
-    async_add_entities(irrigation_entities, True)
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        sensor_service: SensorService,
+        store: WyzeDeviceStore,
+    ) -> None:
+        """Initialize the poller."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._sensor_service = sensor_service
+        self._store = store
+        self._sensors: dict[str, Sensor] = {}
+        self._task: asyncio.Task | None = None
+
+    @callback
+    def async_add(self, sensor: Sensor) -> None:
+        """Start updating ``sensor``."""
+        self._sensors[sensor.mac] = sensor
+        if self._task is None:
+            self._task = self._config_entry.async_create_background_task(
+                self._hass,
+                self._async_poll(),
+                f"{DOMAIN} sensor poll {self._config_entry.entry_id}",
+            )
+
+    @callback
+    def async_remove(self, mac: str) -> None:
+        """Stop updating the sensor with ``mac``."""
+        self._sensors.pop(mac, None)
+        if not self._sensors and self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_poll(self) -> None:
+        """Update every sensor, pause, and start over."""
+        while True:
+            for mac, sensor in list(self._sensors.items()):
+                try:
+                    updated = await self._sensor_service.update(sensor)
+                except (
+                    AccessTokenError,
+                    UnknownApiError,
+                    ClientError,
+                    TimeoutError,
+                ) as err:
+                    _LOGGER.debug("Unable to update %s: %s", sensor.nickname, err)
+                    continue
+                if mac in self._sensors:
+                    self._store.async_refresh(mac, updated)
+            await asyncio.sleep(SENSOR_POLL_INTERVAL)
 
 
 class WyzeSensor(BinarySensorEntity):
@@ -98,21 +217,24 @@ class WyzeSensor(BinarySensorEntity):
     A representation of the WyzeSensor for use in Home Assistant
     """
 
-    def __init__(self, sensor_service: SensorService, sensor: Sensor):
+    def __init__(self, sensor: Sensor, poller: WyzeSensorPoller):
         """Initializes the class"""
-        self._sensor_service = sensor_service
         self._sensor = sensor
-        self._last_event = int(str(int(time.time())) + "000")
+        self._poller = poller
 
     async def async_added_to_hass(self) -> None:
         """Registers for updates when the entity is added to Home Assistant"""
-        await self._sensor_service.register_for_updates(
-            self._sensor, self.process_update
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, device_signal(self._sensor.mac), self.process_update
+            )
         )
+        self._poller.async_add(self._sensor)
 
     async def async_will_remove_from_hass(self) -> None:
-        await self._sensor_service.deregister_for_updates(self._sensor)
+        self._poller.async_remove(self._sensor.mac)
 
+    @callback
     def process_update(self, sensor: Sensor):
         """
         This function processes an update for the Wyze Sensor
@@ -120,7 +242,7 @@ class WyzeSensor(BinarySensorEntity):
         :param sensor: The sensor with the updated values
         """
         self._sensor = sensor
-        self.schedule_update_ha_state()
+        self.async_write_ha_state()
 
     @property
     def device_info(self):
@@ -178,14 +300,27 @@ class WyzeSensor(BinarySensorEntity):
 class WyzeCameraMotion(BinarySensorEntity):
     """
     A representation of the Wyze Camera for use as a binary sensor in Home Assistant
-    """
 
-    _is_on = False
-    _last_event = time.time() * 1000
+    Motion turns on as soon as a new event is seen (from the entry's event
+    pipeline or a camera update) and clears once the configured hold time has
+    passed since the event, independent of the polling cadence.
+    """
 
-    def __init__(self, camera_service: CameraService, camera: Camera):
+    def __init__(
+        self,
+        camera_service: CameraService,
+        camera: Camera,
+        config_entry: ConfigEntry,
+        store: WyzeDeviceStore,
+    ):
         self._camera_service = camera_service
         self._camera = camera
+        self._config_entry = config_entry
+        self._store = store
+        self._is_on = False
+        # wyzeapy seeds last_event_ts with the creation time, so only later events count
+        self._last_event_ts = camera.last_event_ts
+        self._unsub_clear: CALLBACK_TYPE | None = None
 
     @property
     def device_info(self):
@@ -225,6 +360,7 @@ class WyzeCameraMotion(BinarySensorEntity):
             ATTR_ATTRIBUTION: ATTRIBUTION,
             "device model": self._camera.product_model,
             "mac": self.unique_id,
+            "last_event_ts": self._last_event_ts,
         }
 
     @property
@@ -232,30 +368,68 @@ class WyzeCameraMotion(BinarySensorEntity):
         return BinarySensorDeviceClass.MOTION
 
     async def async_added_to_hass(self) -> None:
-        await self._camera_service.register_for_updates(
-            self._camera, self.process_update
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                camera_event_signal(self._camera.mac),
+                self._handle_camera_event,
+            )
+        )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                device_signal(self._camera.mac),
+                self._async_handle_camera_update,
+            )
+        )
+        await self._store.async_register_updater(
+            self._camera_service, self._camera, CAMERA_UPDATE_INTERVAL
         )
 
     async def async_will_remove_from_hass(self) -> None:
-        await self._camera_service.deregister_for_updates(self._camera)
-
-    @token_exception_handler
-    def process_update(self, camera: Camera) -> None:
-        """
-        Is called by the update worker for events to update the values in this sensor
-
-        :param camera: An updated version of the current camera
-        """
+        self._cancel_clear()
+        self._store.async_deregister_updater(self._camera.mac)
+
+    def _cancel_clear(self) -> None:
+        if self._unsub_clear is not None:
+            self._unsub_clear()
+            self._unsub_clear = None
+
+    @callback
+    def _async_motion_event(self, event_ts: int) -> None:
+        """Turn on for a new event and (re)schedule the clear."""
+        if not event_ts or event_ts <= self._last_event_ts:
+            return
+        self._last_event_ts = event_ts
+        hold_time = self._config_entry.options.get(
+            MOTION_HOLD_TIME, DEFAULT_MOTION_HOLD_TIME
+        )
+        remaining = hold_time - (time.time() - event_ts / 1000)
+        if remaining <= 0:
+            # The event is older than the hold time (e.g. replayed after a restart)
+            return
+        self._is_on = True
+        self._cancel_clear()
+        self._unsub_clear = async_call_later(self.hass, remaining, self._async_clear)
+        self.async_write_ha_state()
+
+    @callback
+    def _async_clear(self, _now) -> None:
+        """Clear motion once the hold time has elapsed."""
+        self._unsub_clear = None
+        self._is_on = False
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_camera_event(self, camera: Camera, event: Event) -> None:
+        """Handle a new event from the entry's event pipeline."""
+        self._async_motion_event(event.event_ts)
+
+    @callback
+    def _async_handle_camera_update(self, camera: Camera) -> None:
         self._camera = camera
-
-        if camera.last_event_ts > self._last_event:
-            self._is_on = True
-            self._last_event = camera.last_event_ts
-        else:
-            self._is_on = False
-            self._last_event = camera.last_event_ts
-
-        self.schedule_update_ha_state()
+        self._async_motion_event(camera.last_event_ts)
+        self.async_write_ha_state()
 
 
 class WyzeIrrigationZoneRunning(WyzeIrrigationZoneEntity, BinarySensorEntity):
@@ -287,7 +461,13 @@ class WyzeIrrigationZoneRunning(WyzeIrrigationZoneEntity, BinarySensorEntity):
             "zone_id": getattr(self._zone, "zone_id", None),
             "remaining_time_seconds": getattr(self._zone, "remaining_time", 0),
         }
-        for key in ("crop_type", "soil_type", "nozzle_type", "exposure_type", "slope_type"):
+        for key in (
+            "crop_type",
+            "soil_type",
+            "nozzle_type",
+            "exposure_type",
+            "slope_type",
+        ):
             value = getattr(self._zone, key, None)
             if value is not None:
                 attrs[key] = value
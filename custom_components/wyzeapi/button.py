@@ -8,6 +8,7 @@ from aiohttp.client_exceptions import ClientConnectionError
 from wyzeapy import Wyzeapy
 from wyzeapy.services.irrigation_service import Irrigation, IrrigationService, Zone
 from wyzeapy.services.switch_service import Switch
+from wyzeapy.types import Device, DeviceTypes
 
 from homeassistant.components.button import ButtonDeviceClass, ButtonEntity
 from homeassistant.config_entries import ConfigEntry
@@ -18,12 +19,13 @@ from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_registry import EntityCategory
 
-from .const import CONF_CLIENT, DOMAIN, RESET_BUTTON_PRESSED
+from .capabilities import is_irrigation
+from .const import CONF_CLIENT, DOMAIN, OUTDOOR_PLUGS, RESET_BUTTON_PRESSED
+from .discovery import async_register_device_adder
 from .token_manager import token_exception_handler
 
 _LOGGER = logging.getLogger(__name__)
 ATTRIBUTION = "Data provided by Wyze"
-OUTDOOR_PLUGS = ["WLPPO"]
 
 
 @token_exception_handler
@@ -45,37 +47,44 @@ async def async_setup_entry(
     irrigation_service = await client.irrigation_service
     switch_service = await client.switch_service
 
-    # Get all irrigation devices
-    irrigation_devices = await irrigation_service.get_irrigations()
+    async def _async_add_devices(devices: list[Device]) -> None:
+        # Create a button entity for each zone in each irrigation device
+        buttons = []
+        for device in devices:
+            if not is_irrigation(device):
+                continue
+            # Update the device to get its zones
+            device = await irrigation_service.update(Irrigation(device.raw_dict))
+            # Add a button entity for each enabled zone in the irrigation device
+            buttons.extend(
+                [
+                    WyzeIrrigationZoneButton(irrigation_service, device, zone)
+                    for zone in device.zones
+                    if zone.enabled
+                ]
+            )
+            # Add device-level control buttons (one per device, not per zone)
+            buttons.append(WyzeIrrigationStopAllButton(irrigation_service, device))
+            buttons.append(WyzeIrrigationPauseButton(irrigation_service, device))
+            buttons.append(WyzeIrrigationResumeButton(irrigation_service, device))
 
-    # Create a button entity for each zone in each irrigation device
-    buttons = []
-    for device in irrigation_devices:
-        # Update the device to get its zones
-        device = await irrigation_service.update(device)
-        # Add a button entity for each enabled zone in the irrigation device
         buttons.extend(
             [
-                WyzeIrrigationZoneButton(irrigation_service, device, zone)
-                for zone in device.zones
-                if zone.enabled
+                WyzePowerSensorResetButton(Switch(device.raw_dict))
+                for device in devices
+                if device.type in (DeviceTypes.PLUG, DeviceTypes.OUTDOOR_PLUG)
+                and device.product_model in OUTDOOR_PLUGS
             ]
         )
-        # Add device-level control buttons (one per device, not per zone)
-        buttons.append(WyzeIrrigationStopAllButton(irrigation_service, device))
-        buttons.append(WyzeIrrigationPauseButton(irrigation_service, device))
-        buttons.append(WyzeIrrigationResumeButton(irrigation_service, device))
+        async_add_entities(buttons, True)
 
-    plugs = await switch_service.get_switches()
-    buttons.extend(
+    await _async_add_devices(
         [
-            WyzePowerSensorResetButton(plug)
-            for plug in plugs
-            if plug.product_model in OUTDOOR_PLUGS
+            *await irrigation_service.get_irrigations(),
+            *await switch_service.get_switches(),
         ]
     )
-
-    async_add_entities(buttons, True)
+    async_register_device_adder(hass, config_entry, "button", _async_add_devices)
 
 
 class WyzeIrrigationZoneButton(ButtonEntity):
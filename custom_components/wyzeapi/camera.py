@@ -3,7 +3,7 @@
 import base64
 import json
 import asyncio
-from dataclasses import asdict
+import importlib
 from collections.abc import Callable
 from typing import Any
 import logging
@@ -25,15 +25,44 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.util.ssl import get_default_context
 from propcache.api import cached_property
 from webrtc_models import RTCConfiguration, RTCIceCandidateInit, RTCIceServer
-from websockets.asyncio.client import connect as websocket_connect
 from wyzeapy import Wyzeapy, CameraService
 from wyzeapy.services.camera_service import Camera
+from wyzeapy.types import Device, DeviceTypes, Event
 
 from .const import CAMERA_UPDATED, CONF_CLIENT, DOMAIN
+from .device_store import async_get_device_store
+from .discovery import async_register_device_adder
+from .events import camera_event_signal
+from .snapshot import (
+    SNAPSHOT_CACHE,
+    SNAPSHOT_PREFETCHER,
+    REVALIDATE_AFTER,
+    WyzeSnapshotCache,
+    WyzeSnapshotPrefetcher,
+    snapshot_source,
+)
+from .stream_stats import (
+    STAGE_ANSWER,
+    STAGE_FIRST_CANDIDATE,
+    STAGE_OFFER_SENT,
+    STAGE_SIGNALING_CONNECTED,
+    STAGE_STREAM_INFO,
+    CameraStreamStats,
+    StreamStartTrace,
+    async_get_stream_statistics,
+)
 from .token_manager import token_exception_handler
 
 _LOGGER = logging.getLogger(__name__)
 
+# Client id of the camera on the Kinesis signaling channel
+KVS_RECIPIENT_CLIENT_ID = "ada06f08-87f4-4e13-b699-e82db8517ae5"
+_UFRAG_RE = re.compile(r"ufrag (\w{4})")
+_SDP_DIRECTION_RE = re.compile(
+    "m=(?P<kind>audio|video|application)(.|\n)+?"
+    "a=(?P<direction>sendrecv|sendonly|recvonly|inactive)(\r|\n|\r\n)"
+)
+
 
 @token_exception_handler
 async def async_setup_entry(
@@ -52,39 +81,77 @@ async def async_setup_entry(
     _LOGGER.debug("Creating new Wyze camera component")
     client: Wyzeapy = hass.data[DOMAIN][config_entry.entry_id][CONF_CLIENT]
     camera_service = await client.camera_service
-    camera_devices = await camera_service.get_cameras()
+    store = async_get_device_store(hass, config_entry.entry_id)
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    if SNAPSHOT_CACHE not in entry_data:
+        entry_data[SNAPSHOT_CACHE] = WyzeSnapshotCache(hass)
+        entry_data[SNAPSHOT_PREFETCHER] = WyzeSnapshotPrefetcher(
+            hass, entry_data[SNAPSHOT_CACHE]
+        )
+    snapshot_cache = entry_data[SNAPSHOT_CACHE]
+    prefetcher = entry_data[SNAPSHOT_PREFETCHER]
+    stream_stats = async_get_stream_statistics(hass, config_entry.entry_id)
+
+    async def _async_add_devices(devices: list[Device]) -> None:
+        # Create a camera entity for each camera device
+        cameras = []
+        for device in devices:
+            if device.type is not DeviceTypes.CAMERA:
+                continue
+            # Update the device to get its zones
+            device = await camera_service.update(store.device(Camera(device.raw_dict)))
+            cameras.extend(
+                [
+                    WyzeCamera(
+                        camera_service,
+                        device,
+                        snapshot_cache,
+                        prefetcher,
+                        stream_stats.camera(device.mac),
+                    )
+                ]
+            )
 
-    # Create a camera entity for each camera device
-    cameras = []
-    for device in camera_devices:
-        # Update the device to get its zones
-        device = await camera_service.update(device)
-        cameras.extend([WyzeCamera(camera_service, device)])
+        for camera in cameras:
+            # Pre-seed the ICE server config by fetching it during setup, so the
+            # frontend can collect ICE servers before the offer
+            try:
+                await camera.config_fetch()
+            except Exception as e:
+                # Don't block startup if the config fetch fails, but log the error
+                _LOGGER.warning(
+                    "Error fetching WebRTC session configuration for camera %s: %s",
+                    camera.name,
+                    e,
+                )
 
-    for camera in cameras:
-        # Pre-seed the ICE server config by fetching it during setup, so the frontend can collect ICE servers before the offer
-        try:
-            await camera.config_fetch()
-        except Exception as e:
-            # Don't block startup if the config fetch fails, but log the error
-            _LOGGER.warning(
-                "Error fetching WebRTC session configuration for camera %s: %s",
-                camera.name,
-                e,
-            )
+        async_add_entities(cameras, True)
 
+    await _async_add_devices(await camera_service.get_cameras())
+    async_register_device_adder(hass, config_entry, "camera", _async_add_devices)
     _LOGGER.debug("Wyze camera component setup complete")
-    async_add_entities(cameras, True)
 
 
 class WyzeCamera(CameraEntity):
     """Representation of a Wyze Camera."""
 
-    def __init__(self, camera_service: CameraService, camera: Camera):
+    def __init__(
+        self,
+        camera_service: CameraService,
+        camera: Camera,
+        snapshot_cache: WyzeSnapshotCache,
+        prefetcher: WyzeSnapshotPrefetcher,
+        stream_stats: CameraStreamStats,
+    ):
         """Initialize the camera."""
         super().__init__()
         self._camera_service = camera_service
         self._camera = camera
+        self._snapshot_cache = snapshot_cache
+        self._prefetcher = prefetcher
+        self._stream_stats = stream_stats
+        # Newest event delivered by the event pipeline, used for stills
+        self._latest_event: Event | None = None
         self.name = camera.nickname
         self._attr_unique_id = camera.mac
         self.brand = "Wyze"
@@ -142,6 +209,34 @@ class WyzeCamera(CameraEntity):
                 self.handle_camera_update,
             )
         )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                camera_event_signal(self._camera.mac),
+                self._handle_camera_event,
+            )
+        )
+        self.async_on_remove(
+            self._prefetcher.async_add_camera(
+                self._camera.mac, lambda: (self._camera, self._latest_event)
+            )
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Close the WebRTC sessions still open."""
+        sessions = list(self.sessions.values())
+        self.sessions.clear()
+        self._pending_candidates.clear()
+        await asyncio.gather(
+            *(session.async_close() for session in sessions), return_exceptions=True
+        )
+
+    @callback
+    def _handle_camera_event(self, camera: Camera, event: Event) -> None:
+        """Remember the newest event so its screenshot becomes the still."""
+        if self._latest_event is None or event.event_ts >= self._latest_event.event_ts:
+            self._latest_event = event
+            self._prefetcher.async_request(self._camera.mac)
 
     @property
     def is_on(self) -> bool:
@@ -178,8 +273,22 @@ class WyzeCamera(CameraEntity):
         self, width: int | None = None, height: int | None = None
     ) -> bytes | None:
         """Return bytes of camera image.
-        Currently not implemented"""
-        return None
+
+        Wyze has no live snapshot endpoint, so this serves the newest of the
+        cloud thumbnail and the latest event screenshot. While the prefetcher
+        keeps the still fresh it is served from the cache without revalidation.
+        """
+        if (source := snapshot_source(self._camera, self._latest_event)) is None:
+            return None
+        url, timestamp = source
+        return await self._snapshot_cache.async_get_image(
+            self._camera.mac,
+            url,
+            timestamp,
+            width,
+            height,
+            max_age=None if self._prefetcher.active else REVALIDATE_AFTER,
+        )
 
     def _async_get_webrtc_client_configuration(self) -> WebRTCClientConfiguration:
         """Return the WebRTC client configuration for this camera, including ICE servers."""
@@ -220,27 +329,39 @@ class WyzeCamera(CameraEntity):
 
         # Always fetch a truly fresh config so the signaling URL and ICE servers
         # are never stale — KVS signed URLs are single-use and short-lived.
-        config = await self._camera_service.get_stream_info(self._camera)
+        trace = self._stream_stats.start(session_id)
+        try:
+            config = await self._camera_service.get_stream_info(self._camera)
+        except Exception:
+            trace.fail("stream_info_error")
+            trace.async_finish()
+            raise
+        trace.mark(STAGE_STREAM_INFO)
 
         # Update cached config with the new ICE servers
         self._cached_config = config
         _LOGGER.debug("Fresh config for offer on camera %s: %s", self.name, config)
 
-        self.sessions[session_id] = WyzeCameraWebRTCSession(
-            session_id, self, send_message, config
-        )
-        await self.sessions[session_id].send_offer(offer_sdp)
+        session = WyzeCameraWebRTCSession(session_id, self, send_message, config, trace)
+        self.sessions[session_id] = session
 
         pending = self._pending_candidates.pop(session_id, None)
         if pending:
             _LOGGER.debug(
-                "Flushing %d buffered ICE candidates for camera %s session %s",
+                "Queueing %d buffered ICE candidates for camera %s session %s",
                 len(pending),
                 self.name,
                 session_id,
             )
             for cand in pending:
-                await self.sessions[session_id].send_candidate(cand)
+                session.queue_candidate(cand)
+
+        try:
+            await session.send_offer(offer_sdp)
+        except Exception:
+            trace.fail("signaling_error")
+            trace.async_finish()
+            raise
 
     async def async_on_webrtc_candidate(
         self, session_id: str, candidate: RTCIceCandidateInit
@@ -255,7 +376,7 @@ class WyzeCamera(CameraEntity):
             )
             return
 
-        await self.sessions[session_id].send_candidate(candidate)
+        self.sessions[session_id].queue_candidate(candidate)
 
     def close_webrtc_session(self, session_id: str) -> None:
         """Close a WebRTC session and clean up resources."""
@@ -276,6 +397,7 @@ class WyzeCameraWebRTCSession:
         camera: WyzeCamera,
         callback: WebRTCSendMessage,
         config: dict,
+        trace: StreamStartTrace,
     ):
         self.session_id = session_id
         self.camera = camera
@@ -288,8 +410,12 @@ class WyzeCameraWebRTCSession:
         self.config = config
         self.sdp_offer = None
         self.sdp_answer = None
-        # Set once connect() succeeds; send_candidate waits on this instead of reconnecting
-        self._connected = asyncio.Event()
+        # Encoded ICE candidates waiting to be sent; flushed back-to-back once
+        # the offer is out, since KVS drops candidates that precede it
+        self._outbox: list[str] = []
+        self._offer_sent = False
+        self._flush_task: asyncio.Task | None = None
+        self.trace = trace
 
     async def connect(self):
         """Establish the WebSocket connection to the KVS signaling URL.
@@ -305,7 +431,11 @@ class WyzeCameraWebRTCSession:
             if "%25" not in signaling_url:
                 break
             signaling_url = signaling_url.replace("%25", "%")
-        self.websocket = await websocket_connect(
+        # websockets is only needed once a stream is started
+        websockets_client = await self.camera.hass.async_add_import_executor_job(
+            importlib.import_module, "websockets.asyncio.client"
+        )
+        self.websocket = await websockets_client.connect(
             signaling_url, ssl=get_default_context(), logger=_LOGGER
         )
         _LOGGER.debug(
@@ -313,8 +443,8 @@ class WyzeCameraWebRTCSession:
             self.camera.name,
             self.session_id,
         )
-        self._connected.set()
-        asyncio.create_task(self.run_loop())
+        self.trace.mark(STAGE_SIGNALING_CONNECTED)
+        self.task = asyncio.create_task(self.run_loop())
 
     async def send_offer(self, offer_sdp: str):
         """Send an SDP offer to the Kinesis Video Streams signaling channel."""
@@ -329,7 +459,7 @@ class WyzeCameraWebRTCSession:
         offer = {"type": "offer", "sdp": offer_sdp}
         payload = {
             "action": "SDP_OFFER",
-            "recipientClientId": "ada06f08-87f4-4e13-b699-e82db8517ae5",
+            "recipientClientId": KVS_RECIPIENT_CLIENT_ID,
             "messagePayload": base64.b64encode(
                 json.dumps(offer, separators=(",", ":")).encode()
             ).decode(),
@@ -343,49 +473,75 @@ class WyzeCameraWebRTCSession:
             str_payload,
         )
         await self.websocket.send(str_payload)
+        self.trace.mark(STAGE_OFFER_SENT)
+        self._offer_sent = True
+        self._schedule_flush()
 
-    async def send_candidate(self, candidate: RTCIceCandidateInit):
-        """Send an ICE candidate to the Kinesis Video Streams signaling channel."""
-        # Take RTCIceCandidateInit, convert it to the format in the messagePayload above, and send it to the client using the callback
-        # Wait for send_offer to establish the connection — never reconnect (KVS URLs are single-use)
-        try:
-            await asyncio.wait_for(self._connected.wait(), timeout=10.0)
-        except asyncio.TimeoutError as exc:
-            raise ConnectionError(
-                "WebSocket connection not established within timeout"
-            ) from exc
-        if self.websocket is None:
-            raise ConnectionError("WebSocket connection not established")
-        candidate_dict = asdict(candidate)
+    def queue_candidate(self, candidate: RTCIceCandidateInit) -> None:
+        """Queue an ICE candidate for the Kinesis Video Streams signaling channel."""
         candidate_payload = {
-            "candidate": candidate_dict["candidate"],
-            "sdpMid": candidate_dict["sdp_mid"],
-            "sdpMLineIndex": candidate_dict["sdp_m_line_index"],
-            "usernameFragment": candidate_dict["user_fragment"],
+            "candidate": candidate.candidate,
+            "sdpMid": candidate.sdp_mid,
+            "sdpMLineIndex": candidate.sdp_m_line_index,
+            "usernameFragment": candidate.user_fragment,
         }
-        match = re.search(r"ufrag (\w{4})", candidate_payload["candidate"])
+        match = _UFRAG_RE.search(candidate.candidate)
         if match is not None:
             candidate_payload["usernameFragment"] = match.group(1)
         payload = {
             "action": "ICE_CANDIDATE",
-            "recipientClientId": "ada06f08-87f4-4e13-b699-e82db8517ae5",
+            "recipientClientId": KVS_RECIPIENT_CLIENT_ID,
             "messagePayload": base64.b64encode(
                 json.dumps(candidate_payload, separators=(",", ":")).encode()
             ).decode(),
         }
-        str_payload = json.dumps(payload)
-        _LOGGER.debug(
-            "Sending ICE candidate for camera %s with session ID %s: %s",
-            self.camera.name,
-            self.session_id,
-            str_payload,
-        )
-        await self.websocket.send(str_payload)
+        self._outbox.append(json.dumps(payload))
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        """Start sending queued candidates unless a flush is already running."""
+        if self._offer_sent and self._outbox and self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush())
+
+    async def _flush(self) -> None:
+        """Send every queued candidate back-to-back."""
+        try:
+            while self._outbox and self.websocket is not None:
+                batch, self._outbox = self._outbox, []
+                _LOGGER.debug(
+                    "Sending %d ICE candidates for camera %s with session ID %s",
+                    len(batch),
+                    self.camera.name,
+                    self.session_id,
+                )
+                for str_payload in batch:
+                    await self.websocket.send(str_payload)
+        except Exception as e:
+            self.trace.fail("candidate_send_error")
+            _LOGGER.debug(
+                "Unable to send ICE candidates for camera %s session %s: %s",
+                self.camera.name,
+                self.session_id,
+                e,
+            )
+        finally:
+            self._flush_task = None
 
     def close_connection(self):
         """Close the WebSocket connection to the Kinesis Video Streams signaling channel."""
         if self.close is not None:
             self.close()
+        self.trace.async_finish()
+
+    async def async_close(self) -> None:
+        """Close the session and wait until its tasks and websocket are done."""
+        tasks = [task for task in (self._flush_task, self.task) if task is not None]
+        for task in tasks:
+            task.cancel()
+        if self.websocket is not None:
+            await self.websocket.close()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.trace.async_finish()
 
     def force_correct_sdp_answer(self) -> None:
         """Force the sdp response to have the valid answer.
@@ -396,18 +552,10 @@ class WyzeCameraWebRTCSession:
         """
         _LOGGER.debug("Attempt to fix sdp answer...")
         if isinstance(self.sdp_answer, str) and isinstance(self.sdp_offer, str):
-            sdp_kinds = ["audio", "video", "application"]
-            sdp_directions = ["sendrecv", "sendonly", "recvonly", "inactive"]
-            sdp_pattern = (
-                "m=(?P<kind>{})(.|\n)+?a=(?P<direction>{})(\r|\n|\r\n)".format(
-                    "|".join(sdp_kinds), "|".join(sdp_directions)
-                )
-            )
-
-            sdp_direction_offers = re.finditer(sdp_pattern, self.sdp_offer)
+            sdp_direction_offers = _SDP_DIRECTION_RE.finditer(self.sdp_offer)
 
             for offer in sdp_direction_offers:
-                sdp_answers = re.finditer(sdp_pattern, self.sdp_answer)
+                sdp_answers = _SDP_DIRECTION_RE.finditer(self.sdp_answer)
                 for answer in sdp_answers:
                     if (
                         offer.group("kind") == answer.group("kind")
@@ -480,6 +628,7 @@ class WyzeCameraWebRTCSession:
                             sdp_m_line_index=candidate_data.get("sdpMLineIndex"),
                             user_fragment=candidate_data.get("usernameFragment"),
                         )
+                        self.trace.mark(STAGE_FIRST_CANDIDATE)
                         self.callback(WebRTCCandidate(candidate=rtccandidate))
                     case "SDP_ANSWER":
                         # Decode messagePayload (base64 JSON with "type"/"sdp" keys) → extract sdp string
@@ -491,6 +640,7 @@ class WyzeCameraWebRTCSession:
                             sdp = answer_str
                         self.sdp_answer = sdp
                         self.force_correct_sdp_answer()
+                        self.trace.mark(STAGE_ANSWER)
                         self.callback(WebRTCAnswer(answer=self.sdp_answer))
                     case "STATUS_RESPONSE" | "GO_AWAY" | "RECONNECT_ICE_SERVER":
                         _LOGGER.debug(
@@ -507,6 +657,7 @@ class WyzeCameraWebRTCSession:
                             data,
                         )
         except Exception as e:
+            self.trace.fail("signaling_error")
             _LOGGER.error(
                 "run_loop error for camera %s session %s: %s",
                 self.camera.name,
@@ -0,0 +1,159 @@
+"""Decide which platforms a Wyze account needs.
+
+Forwarding a platform imports its module and runs its ``async_setup_entry``,
+which acquires services and fetches device lists from the cloud even when the
+account has nothing for it (no thermostat, no HMS, no garage controller...).
+:func:`plan_platforms` derives the platforms worth loading from the device
+inventory using the same model rules the platforms apply when creating
+entities, and :func:`async_load_platforms` forwards only those, remembering
+what is loaded so platforms can be added later when new devices show up.
+"""
+
+from collections.abc import Iterable
+import logging
+
+from wyzeapy.types import Device, DeviceTypes
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DOMAIN,
+    GARAGE_DOOR_DONGLE,
+    IRRIGATION_MODELS,
+    OUTDOOR_PLUGS,
+    SIREN_UNSUPPORTED,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+PLATFORMS = [
+    "light",
+    "switch",
+    "lock",
+    "climate",
+    "alarm_control_panel",
+    "sensor",
+    "binary_sensor",
+    "siren",
+    "cover",
+    "number",
+    "button",
+    "camera",
+]  # Fixme: Re add scene
+
+# Key under hass.data[DOMAIN][entry_id] holding the set of loaded platforms.
+LOADED_PLATFORMS = "loaded_platforms"
+
+# Platforms with entities that don't belong to a device (the account wide
+# notification switch); they are always loaded.
+ALWAYS_LOADED = frozenset({"switch"})
+
+BULB_TYPES = (DeviceTypes.LIGHT, DeviceTypes.MESH_LIGHT, DeviceTypes.LIGHTSTRIP)
+_SENSOR_TYPES = (DeviceTypes.CONTACT_SENSOR, DeviceTypes.MOTION_SENSOR)
+
+
+def _dongle(camera: Device) -> str | None:
+    """Return the model of the accessory plugged into ``camera``."""
+    return (getattr(camera, "device_params", None) or {}).get("dongle_product_model")
+
+
+def camera_light_kind(camera: Device) -> str | None:
+    """Return the kind of light built into or attached to ``camera``, if any."""
+    if camera.product_model == "HL_BC":
+        # Wyze Bulb Cam has integrated light
+        return "bulbcam"
+    if (
+        camera.product_model == "WYZE_CAKP2JFUS"
+        and _dongle(camera) == "HL_CFL"
+        or camera.product_model in ("LD_CFP", "HL_CFL2")  # Floodlight v2
+    ):
+        return "floodlight"
+    if (
+        camera.product_model in ("WYZE_CAKP2JFUS", "HL_CAM4")
+        and _dongle(camera) == "HL_CAM3SS"
+    ):
+        # Cam v3 with lamp socket accessory
+        return "lampsocket"
+    if camera.product_model == "AN_RSCW":
+        # Battery cam pro (integrated spotlight)
+        return "spotlight"
+    return None
+
+
+def has_garage_door(camera: Device) -> bool:
+    """Return True if a garage door controller is attached to ``camera``."""
+    return _dongle(camera) == GARAGE_DOOR_DONGLE
+
+
+def is_irrigation(device: Device) -> bool:
+    """Return True for sprinkler controllers."""
+    return device.type is DeviceTypes.IRRIGATION and any(
+        model in device.product_model for model in IRRIGATION_MODELS
+    )
+
+
+def plan_platforms(devices: Iterable[Device], has_hms: bool = False) -> set[str]:
+    """Return the platforms that will create entities for ``devices``."""
+    platforms = set(ALWAYS_LOADED)
+    if has_hms:
+        platforms.add("alarm_control_panel")
+    for device in devices:
+        device_type = device.type
+        if device_type is DeviceTypes.CAMERA:
+            # Power/motion/notification switches, motion binary sensor and
+            # stream statistics sensor exist for every camera
+            platforms.update(("camera", "binary_sensor", "sensor"))
+            if device.product_model not in SIREN_UNSUPPORTED:
+                platforms.add("siren")
+            if camera_light_kind(device) is not None:
+                platforms.add("light")
+            if has_garage_door(device):
+                platforms.add("cover")
+        elif device_type in BULB_TYPES:
+            platforms.add("light")
+        elif device_type in (DeviceTypes.PLUG, DeviceTypes.OUTDOOR_PLUG):
+            if device.product_model in OUTDOOR_PLUGS:
+                platforms.update(("sensor", "button"))
+        elif device_type is DeviceTypes.LOCK:
+            platforms.update(("lock", "sensor"))
+        elif device_type is DeviceTypes.THERMOSTAT:
+            platforms.add("climate")
+        elif device_type in _SENSOR_TYPES:
+            platforms.add("binary_sensor")
+        elif is_irrigation(device):
+            platforms.update(("sensor", "binary_sensor", "number", "button"))
+    return platforms
+
+
+async def async_load_platforms(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    devices: Iterable[Device],
+    has_hms: bool = False,
+    only: Iterable[str] | None = None,
+) -> set[str]:
+    """Forward the planned platforms that aren't loaded yet; return those.
+
+    ``only`` limits the platforms considered.
+    """
+    loaded: set[str] = hass.data[DOMAIN][config_entry.entry_id].setdefault(
+        LOADED_PLATFORMS, set()
+    )
+    new = plan_platforms(devices, has_hms) - loaded
+    if only is not None:
+        new &= set(only)
+    if not new:
+        return new
+    ordered = [platform for platform in PLATFORMS if platform in new]
+    _LOGGER.debug("Loading platforms %s", ", ".join(ordered))
+    loaded.update(new)
+    await hass.config_entries.async_forward_entry_setups(config_entry, ordered)
+    return new
+
+
+def loaded_platforms(hass: HomeAssistant, config_entry: ConfigEntry) -> list[str]:
+    """Return the platforms forwarded for ``config_entry``."""
+    entry_data = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {})
+    loaded = entry_data.get(LOADED_PLATFORMS, ())
+    return [platform for platform in PLATFORMS if platform in loaded]
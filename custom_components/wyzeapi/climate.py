@@ -35,6 +35,9 @@ from wyzeapy.services.thermostat_service import (
     HVACState,
     HVACMode as WyzeHVACMode,
 )
+from wyzeapy.types import Device, DeviceTypes
+from .device_store import async_start_update_manager
+from .discovery import async_register_device_adder
 from .token_manager import token_exception_handler
 
 from .const import DOMAIN, CONF_CLIENT
@@ -63,12 +66,17 @@ async def async_setup_entry(
     client: Wyzeapy = hass.data[DOMAIN][config_entry.entry_id][CONF_CLIENT]
 
     thermostat_service = await client.thermostat_service
-    thermostats = [
-        WyzeThermostat(thermostat_service, thermostat)
-        for thermostat in await thermostat_service.get_thermostats()
-    ]
 
-    async_add_entities(thermostats, True)
+    async def _async_add_devices(devices: List[Device]) -> None:
+        thermostats = [
+            WyzeThermostat(thermostat_service, Thermostat(device.raw_dict))
+            for device in devices
+            if device.type is DeviceTypes.THERMOSTAT
+        ]
+        async_add_entities(thermostats, True)
+
+    await _async_add_devices(await thermostat_service.get_thermostats())
+    async_register_device_adder(hass, config_entry, "climate", _async_add_devices)
 
 
 class WyzeThermostat(ClimateEntity):
@@ -384,7 +392,7 @@ class WyzeThermostat(ClimateEntity):
         """Subscribe to update events."""
         self._thermostat.callback_function = self.async_update_callback
         self._thermostat_service.register_updater(self._thermostat, 30)
-        await self._thermostat_service.start_update_manager()
+        await async_start_update_manager(self.hass, self._thermostat_service)
         return await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self) -> None:
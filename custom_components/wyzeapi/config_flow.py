@@ -10,6 +10,7 @@ from homeassistant import config_entries
 from homeassistant.const import CONF_USERNAME, CONF_PASSWORD, CONF_ACCESS_TOKEN
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
 from wyzeapy import Wyzeapy, exceptions
 
 from .const import (
@@ -18,10 +19,20 @@ from .const import (
     REFRESH_TOKEN,
     REFRESH_TIME,
     BULB_LOCAL_CONTROL,
+    CLIP_ARCHIVE,
+    CLIP_ARCHIVE_QUOTA,
+    CLIP_ARCHIVE_TAGS,
+    CONF_CLIENT,
+    DEFAULT_CLIP_ARCHIVE,
+    DEFAULT_CLIP_ARCHIVE_QUOTA,
     DEFAULT_LOCAL_CONTROL,
+    DEFAULT_MOTION_HOLD_TIME,
     KEY_ID,
     API_KEY,
+    MOTION_HOLD_TIME,
 )
+from .event_index import AI_TAG_NAMES
+from .login_handoff import async_store_login
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -55,6 +66,19 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if not self.client:
             self.client = await Wyzeapy.create()
 
+    async def _async_hand_off_client(self, username: str) -> None:
+        """Pass the logged in client to the setup of the entry.
+
+        The device list is prefetched as well; failing to get it only means
+        the setup fetches it itself.
+        """
+        inventory = None
+        try:
+            inventory = await (await self.client.camera_service).get_object_list()
+        except Exception as err:  # noqa: BLE001
+            _LOGGER.debug("Could not prefetch the device list: %s", err)
+        async_store_login(self.hass, username, self.client, inventory)
+
     async def async_step_user(
         self, user_input: Optional[dict[str, any]] = None
     ) -> dict[str, Any]:
@@ -87,6 +111,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.user_params[API_KEY] = user_input[API_KEY]
             return await self.async_step_2fa()
         else:
+            await self._async_hand_off_client(user_input[CONF_USERNAME])
             if self.hass.config_entries.async_entries(DOMAIN):
                 for entry in self.hass.config_entries.async_entries(DOMAIN):
                     self.hass.config_entries.async_update_entry(entry, data=user_input)
@@ -117,6 +142,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             self.user_params[ACCESS_TOKEN] = token.access_token
             self.user_params[REFRESH_TOKEN] = token.refresh_token
             self.user_params[REFRESH_TIME] = token.refresh_time
+            await self._async_hand_off_client(self.user_params[CONF_USERNAME])
             if self.hass.config_entries.async_entries(DOMAIN):
                 for entry in self.hass.config_entries.async_entries(DOMAIN):
                     self.hass.config_entries.async_update_entry(
@@ -156,10 +182,17 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 class OptionsFlowHandler(config_entries.OptionsFlow):
     """Handle an option flow for Wyze."""
 
+    def __init__(self) -> None:
+        """Initialize the options flow."""
+        self._options: dict[str, Any] = {}
+
     async def async_step_init(self, user_input=None):
         """Handle options flow."""
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            self._options = {**self.config_entry.options, **user_input}
+            if user_input[CLIP_ARCHIVE]:
+                return await self.async_step_clip_archive()
+            return self.async_create_entry(title="", data=self._options)
 
         data_schema = vol.Schema(
             {
@@ -168,11 +201,66 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     default=self.config_entry.options.get(
                         BULB_LOCAL_CONTROL, DEFAULT_LOCAL_CONTROL
                     ),
-                ): bool
+                ): bool,
+                vol.Optional(
+                    MOTION_HOLD_TIME,
+                    default=self.config_entry.options.get(
+                        MOTION_HOLD_TIME, DEFAULT_MOTION_HOLD_TIME
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                vol.Optional(
+                    CLIP_ARCHIVE,
+                    default=self.config_entry.options.get(
+                        CLIP_ARCHIVE, DEFAULT_CLIP_ARCHIVE
+                    ),
+                ): bool,
+                vol.Optional(
+                    CLIP_ARCHIVE_QUOTA,
+                    default=self.config_entry.options.get(
+                        CLIP_ARCHIVE_QUOTA, DEFAULT_CLIP_ARCHIVE_QUOTA
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=100)),
             }
         )
         return self.async_show_form(step_id="init", data_schema=data_schema)
 
+    async def async_step_clip_archive(self, user_input=None):
+        """Choose which AI tags to archive for each camera."""
+        if user_input is not None:
+            self._options[CLIP_ARCHIVE_TAGS] = {
+                mac: tags for mac, tags in user_input.items() if tags
+            }
+            return self.async_create_entry(title="", data=self._options)
+
+        entry_data = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        if entry_data is None or CONF_CLIENT not in entry_data:
+            # Not loaded, or running locally without the cloud
+            return self.async_create_entry(title="", data=self._options)
+        camera_service = await entry_data[CONF_CLIENT].camera_service
+        cameras = await camera_service.get_cameras()
+        if not cameras:
+            return self.async_create_entry(title="", data=self._options)
+
+        current = self.config_entry.options.get(CLIP_ARCHIVE_TAGS, {})
+        tag_choices = {str(tag): name for tag, name in AI_TAG_NAMES.items()}
+        data_schema = vol.Schema(
+            {
+                vol.Optional(
+                    camera.mac, default=current.get(camera.mac, [])
+                ): cv.multi_select(tag_choices)
+                for camera in cameras
+            }
+        )
+        return self.async_show_form(
+            step_id="clip_archive",
+            data_schema=data_schema,
+            description_placeholders={
+                "cameras": ", ".join(
+                    f"{camera.mac} = {camera.nickname}" for camera in cameras
+                )
+            },
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
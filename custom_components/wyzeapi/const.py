@@ -13,15 +13,54 @@ WYZE_NOTIFICATION_TOGGLE = f"{DOMAIN}.wyze.notification.toggle"
 
 LOCK_UPDATED = f"{DOMAIN}.lock_updated"
 CAMERA_UPDATED = f"{DOMAIN}.camera_updated"
+CAMERA_EVENT_RECEIVED = f"{DOMAIN}.camera_event_received"
 LIGHT_UPDATED = f"{DOMAIN}.light_updated"
 COVER_UPDATED = f"{DOMAIN}.cover_updated"
 IRRIGATION_UPDATED = f"{DOMAIN}.irrigation_updated"
+ENERGY_UPDATED = f"{DOMAIN}.energy_updated"
+STREAM_STATS_UPDATED = f"{DOMAIN}.stream_stats_updated"
+DEVICE_UPDATED = f"{DOMAIN}.device_updated"
 RESET_BUTTON_PRESSED = f"{DOMAIN}.reset_button_pressed"
 # EVENT NAMES
 WYZE_CAMERA_EVENT = "wyze_camera_event"
 
+# Keys under hass.data[DOMAIN][entry_id] holding the entry's camera event
+# pipeline and clip archiver; kept here so the entry can be unloaded without
+# importing the camera modules.
+EVENT_PIPELINE = "event_pipeline"
+CLIP_ARCHIVER = "clip_archiver"
+
 BULB_LOCAL_CONTROL = "bulb_local_control"
 DEFAULT_LOCAL_CONTROL = True
+MOTION_HOLD_TIME = "motion_hold_time"
+DEFAULT_MOTION_HOLD_TIME = 60
+CLIP_ARCHIVE = "clip_archive"
+DEFAULT_CLIP_ARCHIVE = False
+# Disk quota of the clip archive in MB
+CLIP_ARCHIVE_QUOTA = "clip_archive_quota"
+DEFAULT_CLIP_ARCHIVE_QUOTA = 2048
+# Per-camera AI tags to archive, keyed by mac
+CLIP_ARCHIVE_TAGS = "clip_archive_tags"
+
+# Device models with special handling, shared by the platforms and the planner
+CAMERAS_WITH_BATTERIES = ["WVOD1", "HL_WCO2", "AN_RSCW", "GW_BE1"]
+OUTDOOR_PLUGS = ["WLPPO"]
+OUTDOOR_PLUG_INDIVUAL_OUTLETS = "WLPPO-SUB"
+IRRIGATION_MODELS = ["BS_WK1"]
+LOCK_BOLT_MODELS = ["YD_BT1"]
+MOTION_SWITCH_UNSUPPORTED = [
+    "GW_BE1",
+    "GW_GC1",
+    "GW_GC2",
+]  # Video doorbell pro, OG, OG 3x Telephoto
+POWER_SWITCH_UNSUPPORTED = ["GW_BE1"]  # Video doorbell pro (device has no off function)
+NOTIFICATION_SWITCH_UNSUPPORTED = {
+    "GW_GC1",
+    "GW_GC2",
+}  # OG and OG 3x Telephoto models currently unsupported due to InvalidSignature2 error
+# The campan v1, v2 camera, and video doorbell pro don't have sirens
+SIREN_UNSUPPORTED = ["WYZECP1_JEF", "WYZEC1-JZ", "GW_BE1"]
+GARAGE_DOOR_DONGLE = "HL_CGDC"
 
 # Yunding (YD) is the provider for Wyze Lock Bolt
 YDBLE_LOCK_STATE_UUID = "00002220-0000-6b63-6f6c-2e6b636f6f6c"
@@ -1,6 +1,7 @@
 import asyncio
 import binascii
 import logging
+import time
 from datetime import datetime, timedelta
 from typing import Dict
 
@@ -9,12 +10,14 @@ from bleak.exc import BleakCharacteristicNotFoundError
 from bleak_retry_connector import establish_connection
 
 from homeassistant.components import bluetooth
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import PlatformNotReady
+from homeassistant.exceptions import ConfigEntryAuthFailed, PlatformNotReady
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from wyzeapy.services.lock_service import LockService, Lock
 
 from .const import YDBLE_LOCK_STATE_UUID, YDBLE_UART_RX_UUID, YDBLE_UART_TX_UUID
+from .local_mode import retry_delays
 from .token_manager import token_exception_handler
 from .ydble_utils import (
     decrypt_ecb,
@@ -49,16 +52,91 @@ class WyzeLockBoltCoordinator(DataUpdateCoordinator):
         self._mac = None
         self._bleak_client = None
         self._current_command = None
+        self._info_task: asyncio.Task | None = None
+        self._disconnect_tasks: set[asyncio.Task] = set()
         # Initialize data to prevent errors during setup
         self.data = {"state": None, "timestamp": None}
 
+    @property
+    def lock(self) -> Lock:
+        """Return the lock."""
+        return self._lock
+
     @token_exception_handler
     async def update_lock_info(self):
         self._lock = await self._lock_service.update(self._lock)
+        self._set_mac()
+
+    def restore_lock_info(self, info: dict) -> None:
+        """Use lock info cached from an earlier update_lock_info()."""
+        self._lock.raw_dict = info["raw_dict"]
+        self._lock.ble_id = info["ble_id"]
+        self._lock.ble_token = info["ble_token"]
+        self._set_mac()
+
+    def _set_mac(self) -> None:
         mac = self._lock.raw_dict["hardware_info"]["mac"]
         # The mac is stored reverse ordered and no colon, e.g. mac="ab8967452301"
         self._mac = ":".join(mac[i - 2 : i] for i in range(12, 0, -2)).upper()
 
+    @property
+    def info_task(self) -> asyncio.Task | None:
+        """Return the task loading the lock info, if it was started."""
+        return self._info_task
+
+    def async_load_lock_info(self, config_entry: ConfigEntry) -> asyncio.Task:
+        """Load the lock info in the background and return the task.
+
+        Failures are retried with a growing delay. The task's result is True
+        once the BLE address and token are known, False if the credentials
+        were rejected.
+        """
+
+        async def _load() -> bool:
+            started = time.monotonic()
+            delays = retry_delays()
+            while True:
+                try:
+                    await self.update_lock_info()
+                except ConfigEntryAuthFailed:
+                    config_entry.async_start_reauth(self.hass)
+                    return False
+                except Exception as err:  # noqa: BLE001
+                    delay = next(delays)
+                    _LOGGER.warning(
+                        "Could not load info of Lock Bolt %s, retrying in %.0fs: %s",
+                        self._lock.nickname,
+                        delay,
+                        err,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                break
+            _LOGGER.debug(
+                "Loaded info of Lock Bolt %s in %.2fs",
+                self._lock.nickname,
+                time.monotonic() - started,
+            )
+            return True
+
+        self._info_task = config_entry.async_create_background_task(
+            self.hass, _load(), f"Wyze Lock Bolt info {self._uuid}"
+        )
+        return self._info_task
+
+    async def async_shutdown(self) -> None:
+        """Stop refreshing, cancel pending work and drop the BLE connection."""
+        await super().async_shutdown()
+        tasks = [*self._disconnect_tasks]
+        if self._info_task is not None:
+            tasks.append(self._info_task)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._bleak_client and self._bleak_client.is_connected:
+            await self._bleak_client.disconnect()
+        self._bleak_client = None
+
     async def _async_update_data(self):
         """Fetch the latest data from BLE device."""
         # Skip if running a command
@@ -95,7 +173,9 @@ class WyzeLockBoltCoordinator(DataUpdateCoordinator):
             )
 
         # disconnect in 10 seconds in case of error
-        asyncio.create_task(self._disconnect(delay=10))
+        task = asyncio.create_task(self._disconnect(delay=10))
+        self._disconnect_tasks.add(task)
+        task.add_done_callback(self._disconnect_tasks.discard)
 
         context = {"command": command, "stage": 0}
 
@@ -7,7 +7,7 @@ from typing import Any, Callable, List
 from wyzeapy import Wyzeapy, CameraService
 from wyzeapy.services.camera_service import Camera
 from wyzeapy.exceptions import AccessTokenError, ParameterError, UnknownApiError
-from wyzeapy.types import DeviceTypes
+from wyzeapy.types import Device, DeviceTypes
 
 import homeassistant.components.cover
 from homeassistant.config_entries import ConfigEntry
@@ -19,7 +19,10 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.components.cover import CoverDeviceClass, CoverEntityFeature
 
 
+from .capabilities import has_garage_door
 from .const import CAMERA_UPDATED, CONF_CLIENT, DOMAIN
+from .device_store import async_get_device_store
+from .discovery import async_register_device_adder
 from .token_manager import token_exception_handler
 
 _LOGGER = logging.getLogger(__name__)
@@ -44,13 +47,18 @@ async def async_setup_entry(
     _LOGGER.debug("""Creating new WyzeApi cover component""")
     client: Wyzeapy = hass.data[DOMAIN][config_entry.entry_id][CONF_CLIENT]
     camera_service = await client.camera_service
-    cameras: List[Camera] = await camera_service.get_cameras()
-    garages = []
-    for camera in cameras:
-        if camera.device_params["dongle_product_model"] == "HL_CGDC":
-            garages.append(WyzeGarageDoor(camera_service, camera))
-
-    async_add_entities(garages, True)
+    store = async_get_device_store(hass, config_entry.entry_id)
+
+    async def _async_add_devices(devices: List[Device]) -> None:
+        garages = [
+            WyzeGarageDoor(camera_service, store.device(Camera(device.raw_dict)))
+            for device in devices
+            if device.type is DeviceTypes.CAMERA and has_garage_door(device)
+        ]
+        async_add_entities(garages, True)
+
+    await _async_add_devices(await camera_service.get_cameras())
+    async_register_device_adder(hass, config_entry, "cover", _async_add_devices)
 
 
 class WyzeGarageDoor(homeassistant.components.cover.CoverEntity, ABC):
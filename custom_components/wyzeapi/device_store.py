@@ -0,0 +1,196 @@
+"""Central per-device state shared by all entities of a Wyze device.
+
+Every platform asks wyzeapy for its devices, and each ``get_cameras()`` /
+``get_switches()`` call returns fresh ``Device`` objects, each carrying every
+key of the device's ``raw_dict`` as an attribute. A camera ends up wrapped by
+as many objects as there are platforms with entities for it.
+
+The store keeps exactly one canonical ``Device`` per mac for a config entry;
+platforms pass the objects they got through :meth:`WyzeDeviceStore.device`
+and all entities of a device share the result. Next to it the store keeps a
+:class:`DeviceState`, a ``__slots__`` projection of only the fields entities
+read, which is refreshed and dispatched whenever the device changes.
+
+Background updates go through :meth:`WyzeDeviceStore.async_register_updater`,
+which (like the irrigation and energy updaters) registers a single library
+updater per device with a reference count, so the one ``callback_function``
+slot of a device is never fought over by several entities. Every updater of
+the integration starts wyzeapy's update loop through
+:func:`async_start_update_manager`, which keeps hold of the loop's task.
+"""
+
+import asyncio
+import logging
+from typing import Any, TypeVar
+
+from wyzeapy.types import Device
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import DEVICE_UPDATED, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key under hass.data[DOMAIN][entry_id] holding the entry's store, and under
+# hass.data[DOMAIN] holding wyzeapy's update loop task if the integration
+# started it.
+DEVICE_STORE = "device_store"
+UPDATE_LOOP = "update_loop"
+
+_DeviceT = TypeVar("_DeviceT", bound=Device)
+
+
+def device_signal(mac: str) -> str:
+    """Return the per-device dispatcher signal name."""
+    return f"{DEVICE_UPDATED}-{mac}"
+
+
+async def async_start_update_manager(hass: HomeAssistant, service: Any) -> None:
+    """Start wyzeapy's process wide update loop and keep its task.
+
+    wyzeapy creates the task without handing it out and only on the first
+    call, so it is picked out as the one task that call added.
+    """
+    before = asyncio.all_tasks()
+    await service.start_update_manager()
+    if started := asyncio.all_tasks() - before:
+        hass.data.setdefault(DOMAIN, {})[UPDATE_LOOP] = started.pop()
+
+
+def _param(params: dict[str, Any], key: str) -> str | None:
+    """Return a device parameter as a string, or None if it is unset."""
+    value = params.get(key)
+    return str(value) if value not in (None, "") else None
+
+
+class DeviceState:
+    """Compact projection of the device fields entities read."""
+
+    __slots__ = (
+        "available",
+        "battery",
+        "floodlight",
+        "ip",
+        "mac",
+        "motion",
+        "music_mode",
+        "nickname",
+        "notify",
+        "on",
+        "product_model",
+        "product_type",
+        "rssi",
+        "siren",
+        "ssid",
+    )
+
+    def __init__(self, device: Device) -> None:
+        """Project ``device``."""
+        self.mac: str = device.mac
+        self.update(device)
+
+    def update(self, device: Device) -> None:
+        """Refresh the projection from ``device``."""
+        params = getattr(device, "device_params", None) or {}
+        self.nickname: str = device.nickname
+        self.product_model: str = device.product_model
+        self.product_type: str = device.product_type
+        self.available: bool = bool(device.available)
+        self.on: bool | None = getattr(device, "on", None)
+        self.motion: bool | None = getattr(device, "motion", None)
+        self.notify: bool | None = getattr(device, "notify", None)
+        self.siren: bool | None = getattr(device, "siren", None)
+        self.floodlight: bool | None = getattr(device, "floodlight", None)
+        self.music_mode: bool | None = getattr(device, "music_mode", None)
+        self.battery = _param(params, "electricity")
+        self.ip = _param(params, "ip")
+        self.rssi = _param(params, "rssi")
+        self.ssid = _param(params, "ssid")
+
+
+class WyzeDeviceStore:
+    """Canonical devices and their projected state for one config entry."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._hass = hass
+        self._devices: dict[str, Device] = {}
+        self._states: dict[str, DeviceState] = {}
+        self._updaters: dict[str, dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of devices in the store."""
+        return len(self._devices)
+
+    def device(self, device: _DeviceT) -> _DeviceT:
+        """Return the canonical object for ``device``'s mac, adopting it if new."""
+        if (canonical := self._devices.get(device.mac)) is not None:
+            return canonical  # type: ignore[return-value]
+        self._devices[device.mac] = device
+        self._states[device.mac] = DeviceState(device)
+        return device
+
+    def state(self, mac: str) -> DeviceState:
+        """Return the projected state of ``mac``."""
+        return self._states[mac]
+
+    @callback
+    def async_refresh(self, mac: str, updated: Device | None = None) -> None:
+        """Take in ``updated`` (if given), re-project and notify the entities.
+
+        The library may hand back a different object than the one it was
+        given; its attributes are copied onto the canonical device so every
+        entity keeps pointing at the same object.
+        """
+        canonical = self._devices[mac]
+        if updated is not None and updated is not canonical:
+            canonical.__dict__.update(updated.__dict__)
+        self._states[mac].update(canonical)
+        async_dispatcher_send(self._hass, device_signal(mac), canonical)
+
+    async def async_register_updater(
+        self, service: Any, device: Device, interval: int
+    ) -> None:
+        """Ensure exactly one background updater exists for ``device``."""
+        device = self.device(device)
+        if (entry := self._updaters.get(device.mac)) is not None:
+            entry["count"] += 1
+            return
+
+        mac = device.mac
+
+        @callback
+        def _dispatch(updated: Device) -> None:
+            self.async_refresh(mac, updated)
+
+        device.callback_function = _dispatch
+        service.register_updater(device, interval)
+        await async_start_update_manager(self._hass, service)
+        self._updaters[mac] = {"count": 1, "service": service}
+
+    @callback
+    def async_deregister_updater(self, mac: str) -> None:
+        """Drop one reference to a device's updater, tearing it down at zero."""
+        if (entry := self._updaters.get(mac)) is None:
+            return
+        entry["count"] -= 1
+        if entry["count"] <= 0:
+            try:
+                entry["service"].unregister_updater(self._devices[mac])
+            except Exception as err:  # pragma: no cover - defensive cleanup
+                _LOGGER.debug("Error unregistering updater of %s: %s", mac, err)
+            del self._updaters[mac]
+
+    def stats(self) -> dict[str, Any]:
+        """Return the store size for diagnostics."""
+        return {"devices": len(self._devices), "updaters": len(self._updaters)}
+
+
+@callback
+def async_get_device_store(hass: HomeAssistant, entry_id: str) -> WyzeDeviceStore:
+    """Return the device store of a config entry."""
+    entry_data = hass.data[DOMAIN][entry_id]
+    if (store := entry_data.get(DEVICE_STORE)) is None:
+        store = entry_data[DEVICE_STORE] = WyzeDeviceStore(hass)
+    return store
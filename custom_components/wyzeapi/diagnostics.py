@@ -0,0 +1,53 @@
+"""Diagnostics support for Wyze."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    ACCESS_TOKEN,
+    API_KEY,
+    CLIP_ARCHIVER,
+    DOMAIN,
+    EVENT_PIPELINE,
+    KEY_ID,
+    REFRESH_TOKEN,
+)
+from .device_store import DEVICE_STORE
+from .discovery import INVENTORY_WATCHER
+from .http_pool import ACCOUNT_HTTP
+from .local_mode import LOCAL_MODE
+from .snapshot import SNAPSHOT_CACHE, SNAPSHOT_PREFETCHER
+from .stream_stats import STREAM_STATS
+from .token_refresh import TOKEN_REFRESHER
+
+TO_REDACT = {ACCESS_TOKEN, API_KEY, CONF_PASSWORD, CONF_USERNAME, KEY_ID, REFRESH_TOKEN}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id, {})
+    diagnostics: dict[str, Any] = {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+    }
+    if (stream_stats := entry_data.get(STREAM_STATS)) is not None:
+        diagnostics["stream_starts"] = stream_stats.as_dict()
+    for key, name in (
+        (DEVICE_STORE, "device_store"),
+        (SNAPSHOT_CACHE, "snapshot_cache"),
+        (SNAPSHOT_PREFETCHER, "snapshot_prefetcher"),
+        (EVENT_PIPELINE, "event_pipeline"),
+        (CLIP_ARCHIVER, "clip_archive"),
+        (LOCAL_MODE, "local_mode"),
+        (INVENTORY_WATCHER, "inventory_watcher"),
+        (TOKEN_REFRESHER, "token_refresh"),
+        (ACCOUNT_HTTP, "http"),
+    ):
+        if (component := entry_data.get(key)) is not None:
+            diagnostics[name] = component.stats()
+    return diagnostics
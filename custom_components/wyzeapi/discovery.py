@@ -0,0 +1,205 @@
+"""Pick up devices added to or removed from the account while running.
+
+Without this, a device added in the Wyze app only shows up after the entry is
+reloaded, which sets every platform up again. :class:`WyzeInventoryWatcher`
+instead fetches the device list periodically (a single request) and diffs it
+against the previous one by mac and product model:
+
+* new devices get their platforms forwarded if none was loaded yet; on
+  platforms that are loaded, the device adder the platform registered
+  during its setup (:func:`async_register_device_adder`) builds the
+  entities of the new devices only and adds them with the platform's own
+  ``async_add_entities``, without repeating the rest of the setup,
+* removed devices are removed from the device registry, which removes their
+  entities,
+* renamed devices get their new nickname in the device registry.
+
+Entities of devices that didn't change are left alone.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import timedelta
+import logging
+from typing import Any
+
+from aiohttp.client_exceptions import ClientError
+from wyzeapy.exceptions import UnknownApiError
+from wyzeapy.services.camera_service import CameraService
+from wyzeapy.types import Device
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.event import async_track_time_interval
+
+from .capabilities import (
+    PLATFORMS,
+    async_load_platforms,
+    loaded_platforms,
+    plan_platforms,
+)
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key under hass.data[DOMAIN][entry_id] holding the entry's watcher.
+INVENTORY_WATCHER = "inventory_watcher"
+# Key under hass.data[DOMAIN][entry_id] holding the device adder of each
+# loaded platform.
+DEVICE_ADDERS = "device_adders"
+DISCOVERY_INTERVAL = timedelta(minutes=10)
+
+DeviceAdder = Callable[[list[Device]], Awaitable[None]]
+
+
+@callback
+def async_register_device_adder(
+    hass: HomeAssistant, config_entry: ConfigEntry, platform: str, adder: DeviceAdder
+) -> None:
+    """Let the watcher add the entities of new devices to ``platform``.
+
+    ``adder`` builds the platform's entities for the devices it is given,
+    skipping the devices the platform has none for, and adds them with the
+    ``async_add_entities`` the platform was set up with.
+    """
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    entry_data.setdefault(DEVICE_ADDERS, {})[platform] = adder
+
+
+class WyzeInventoryWatcher:
+    """Keeps the entities of an entry in line with the account's devices."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        camera_service: CameraService,
+        inventory: Iterable[Device],
+        on_added: Callable[[list[Device]], Awaitable[None]],
+        on_removed: Callable[[set[str]], Awaitable[None]],
+        on_inventory: Callable[[list[Device]], None],
+    ) -> None:
+        """Initialize the watcher with the inventory the entry was set up with."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._camera_service = camera_service
+        self._on_added = on_added
+        self._on_removed = on_removed
+        self._on_inventory = on_inventory
+        self._known = self._summarize(inventory)
+        self._polling = False
+        self.added = 0
+        self.removed = 0
+        self.renamed = 0
+
+    @staticmethod
+    def _summarize(inventory: Iterable[Device]) -> dict[str, tuple[str, str]]:
+        return {
+            device.mac: (device.product_model, device.nickname) for device in inventory
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """Return the watcher state for diagnostics."""
+        return {
+            "devices": len(self._known),
+            "added": self.added,
+            "removed": self.removed,
+            "renamed": self.renamed,
+        }
+
+    @callback
+    def async_start(self) -> None:
+        """Start diffing the inventory periodically until the entry unloads."""
+        self._config_entry.async_on_unload(
+            async_track_time_interval(
+                self._hass,
+                self.async_poll,
+                DISCOVERY_INTERVAL,
+                name=f"{DOMAIN} device discovery",
+                cancel_on_shutdown=True,
+            )
+        )
+
+    async def async_poll(self, now=None) -> None:
+        """Fetch the device list and apply the differences."""
+        if self._polling:
+            return
+        self._polling = True
+        try:
+            inventory = await self._camera_service.get_object_list()
+            await self.async_apply(inventory)
+        except (UnknownApiError, ClientError, TimeoutError) as err:
+            _LOGGER.debug("Unable to fetch the device list: %s", err)
+        finally:
+            self._polling = False
+
+    async def async_apply(self, inventory: list[Device]) -> None:
+        """Add, remove and rename devices according to ``inventory``."""
+        current = self._summarize(inventory)
+        known = self._known
+        added = [
+            device
+            for device in inventory
+            if known.get(device.mac, (None,))[0] != device.product_model
+        ]
+        removed = {
+            mac
+            for mac, (model, _) in known.items()
+            if current.get(mac, (None,))[0] != model
+        }
+        renamed = {
+            mac: nickname
+            for mac, (model, nickname) in current.items()
+            if mac in known and known[mac] != (model, nickname) and mac not in removed
+        }
+        self._known = current
+        if not (added or removed or renamed):
+            return
+
+        _LOGGER.debug(
+            "Inventory changed: %d added, %d removed, %d renamed",
+            len(added),
+            len(removed),
+            len(renamed),
+        )
+        self._on_inventory(inventory)
+        if removed:
+            # Finishes before a device that changed model is added back
+            await self._async_remove_devices(removed)
+        if renamed:
+            self._async_rename_devices(renamed)
+        if added:
+            await self._async_add_devices(added)
+
+    async def _async_remove_devices(self, macs: set[str]) -> None:
+        await self._on_removed(macs)
+        device_registry = dr.async_get(self._hass)
+        for mac in macs:
+            if device := device_registry.async_get_device(identifiers={(DOMAIN, mac)}):
+                # Removing the device removes its entities as well
+                device_registry.async_remove_device(device.id)
+                self.removed += 1
+
+    @callback
+    def _async_rename_devices(self, nicknames: dict[str, str]) -> None:
+        device_registry = dr.async_get(self._hass)
+        for mac, nickname in nicknames.items():
+            if device := device_registry.async_get_device(identifiers={(DOMAIN, mac)}):
+                device_registry.async_update_device(device.id, name=nickname)
+                self.renamed += 1
+
+    async def _async_add_devices(self, devices: list[Device]) -> None:
+        await self._on_added(devices)
+        loaded = set(loaded_platforms(self._hass, self._config_entry))
+        # Platforms loaded for the first time add the new devices themselves
+        await async_load_platforms(self._hass, self._config_entry, devices)
+        wanted = plan_platforms(devices) & loaded
+        adders = self._hass.data[DOMAIN][self._config_entry.entry_id].get(
+            DEVICE_ADDERS, {}
+        )
+        for platform in PLATFORMS:
+            if platform in wanted and (adder := adders.get(platform)) is not None:
+                await adder(devices)
+        self.added += len(devices)
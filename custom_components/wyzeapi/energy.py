@@ -0,0 +1,373 @@
+"""Hourly energy ledger for the Wyze Outdoor Plug (WLPPO).
+
+Wyze reports plug usage as one record per UTC day whose ``data`` field is a
+JSON-encoded list of 24 hourly Wh readings. ``SwitchUsageService.update``
+returns the last 25 hours of those records on every poll, so the same readings
+are seen over and over while only the current (and occasionally the previous)
+hour actually changes.
+
+The ledger keeps a rolling window of hourly kWh values in a compact
+``array('d')`` indexed by absolute UTC hour. A day record is only re-parsed when
+its raw payload changed, and the energy added since the previous poll is the sum
+of the per-hour increases recorded in the ledger, so hour and day rollovers need
+no special casing. The ledger (including the running total) is persisted with a
+:class:`Store`, so it survives restarts.
+
+Completed hours are also imported into the recorder as external long-term
+statistics (``wyzeapi:energy_<mac>``). The ledger remembers the last imported
+hour and its cumulative sum, so after downtime every missed hour still present
+in the usage history is written in a single batched insert.
+
+As with the irrigation helpers, one updater is registered per plug; its callback
+feeds the ledger and fans out via the dispatcher to every energy entity of that
+plug. A per-plug reference count tears the updater down once the last entity is
+removed.
+"""
+
+from array import array
+import json
+import logging
+import time
+from typing import Any
+
+from wyzeapy.services.switch_service import Switch, SwitchUsageService
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.const import UnitOfEnergy
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+from homeassistant.util.unit_conversion import EnergyConverter
+
+from .const import DOMAIN, ENERGY_UPDATED
+from .device_store import async_start_update_manager
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key under hass.data[DOMAIN] holding the per-plug ledger/updater registry.
+ENERGY_LEDGERS = "energy_ledgers"
+# Poll interval (seconds). Every 2 minutes seems to work fine, probably could be
+# longer.
+UPDATE_INTERVAL = 120
+# Number of hours kept in the rolling window.
+LEDGER_HOURS = 24 * 35
+STORAGE_VERSION = 1
+# Coalesce ledger writes; the store flushes pending saves on shutdown.
+SAVE_DELAY = 60
+# Hours that must have passed before an hour is imported into the statistics,
+# giving Wyze time to settle the reading.
+IMPORT_LAG_HOURS = 1
+
+_SECONDS_PER_HOUR = 3600
+_ZERO = array("d", [0.0])
+
+
+def energy_signal(mac: str) -> str:
+    """Return the per-plug dispatcher signal name."""
+    return f"{ENERGY_UPDATED}-{mac}"
+
+
+def utc_hour(timestamp: float | None = None) -> int:
+    """Return the absolute UTC hour (hours since the epoch) for ``timestamp``."""
+    if timestamp is None:
+        timestamp = time.time()
+    return int(timestamp // _SECONDS_PER_HOUR)
+
+
+class WyzePlugEnergyLedger:
+    """Rolling window of hourly energy readings for a single plug."""
+
+    def __init__(self, hass: HomeAssistant, mac: str) -> None:
+        """Initialize an empty ledger."""
+        self.hass = hass
+        self.mac = mac
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.energy_{mac}"
+        )
+        # Absolute UTC hour of ``_hours[0]``; None until the first reading.
+        self._start: int | None = None
+        self._hours = array("d")
+        # Last raw ``data`` payload seen for each UTC day (keyed by its first hour)
+        self._raw: dict[int, str] = {}
+        self.total = 0.0
+        self.restored = False
+        # First hour not yet imported into the statistics, and the cumulative
+        # sum of everything imported before it.
+        self._stat_hour: int | None = None
+        self._stat_sum = 0.0
+
+    async def async_load(self) -> None:
+        """Load the persisted ledger, if any."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        self.restored = True
+        self._start = data.get("start")
+        self._hours = array("d", data.get("hours", []))
+        self.total = float(data.get("total", 0.0))
+        self._stat_hour = data.get("stat_hour")
+        self._stat_sum = float(data.get("stat_sum", 0.0))
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {
+            "start": self._start,
+            "hours": self._hours.tolist(),
+            "total": self.total,
+            "stat_hour": self._stat_hour,
+            "stat_sum": self._stat_sum,
+        }
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a coalesced write of the ledger."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    async def async_save(self) -> None:
+        """Write the ledger now instead of waiting for the scheduled save."""
+        await self._store.async_save(self._data_to_save())
+
+    @property
+    def first_hour(self) -> int | None:
+        """Return the oldest UTC hour held by the ledger."""
+        return self._start
+
+    @property
+    def end_hour(self) -> int | None:
+        """Return the UTC hour just past the newest reading."""
+        if self._start is None:
+            return None
+        return self._start + len(self._hours)
+
+    def value(self, hour: int) -> float:
+        """Return the energy (kWh) used during the given UTC hour."""
+        if self._start is None:
+            return 0.0
+        index = hour - self._start
+        if 0 <= index < len(self._hours):
+            return self._hours[index]
+        return 0.0
+
+    def sum_range(self, start_hour: int, end_hour: int) -> float:
+        """Return the energy (kWh) used in ``[start_hour, end_hour)``."""
+        if self._start is None:
+            return 0.0
+        first = max(start_hour - self._start, 0)
+        last = min(end_hour - self._start, len(self._hours))
+        if first >= last:
+            return 0.0
+        return sum(self._hours[first:last])
+
+    @callback
+    def async_reset_total(self) -> None:
+        """Reset the running total to zero."""
+        self.total = 0.0
+        self.async_schedule_save()
+
+    @callback
+    def async_seed_total(self, total: float) -> None:
+        """Seed the running total, e.g. when migrating from a restored state."""
+        self.total = total
+        self.async_schedule_save()
+
+    def _set(self, hour: int, value: float) -> float:
+        """Store a reading and return how much it increased the hour by."""
+        if self._start is None:
+            self._start = hour
+        elif hour < self._start:
+            self._hours[0:0] = _ZERO * (self._start - hour)
+            self._start = hour
+        index = hour - self._start
+        if index >= len(self._hours):
+            self._hours.extend(_ZERO * (index - len(self._hours) + 1))
+        previous = self._hours[index]
+        self._hours[index] = value
+        return value - previous if value > previous else 0.0
+
+    def _trim(self, oldest: int) -> None:
+        """Drop readings older than ``oldest``."""
+        if self._start is None or self._start >= oldest:
+            return
+        excess = min(oldest - self._start, len(self._hours))
+        del self._hours[:excess]
+        self._start += excess
+        for day in [day for day in self._raw if day + 24 <= oldest]:
+            del self._raw[day]
+
+    @callback
+    def async_ingest(
+        self, usage_history: list[dict[str, Any]] | None, now: float | None = None
+    ) -> float:
+        """Merge a usage history response and return the energy (kWh) added.
+
+        Records are consecutive UTC days; the first one is the day containing
+        the previous hour (so right after midnight UTC the response starts with
+        yesterday and the current day follows).
+        """
+        if not usage_history:
+            return 0.0
+
+        current_hour = utc_hour(now)
+        oldest = current_hour - LEDGER_HOURS + 1
+        first_day = (current_hour - 1) // 24 * 24
+        seeding = self._start is None
+        added = 0.0
+
+        for index, record in enumerate(usage_history):
+            day = first_day + index * 24
+            raw = record.get("data")
+            if not raw or self._raw.get(day) == raw:
+                continue
+            try:
+                readings = json.loads(raw)
+            except (TypeError, ValueError):
+                _LOGGER.debug(
+                    "Ignoring malformed usage record for %s: %s", self.mac, raw
+                )
+                continue
+            self._raw[day] = raw
+            for offset, reading in enumerate(readings[:24]):
+                hour = day + offset
+                if oldest <= hour <= current_hour:
+                    added += self._set(hour, float(reading) / 1000)
+
+        self._trim(oldest)
+
+        if seeding:
+            # The first readings only establish the baseline
+            added = 0.0
+        self.total += added
+        self.async_schedule_save()
+        _LOGGER.debug("Total Value Added to device %s is %s", self.mac, added)
+        return added
+
+    @property
+    def statistic_id(self) -> str:
+        """Return the external statistic id for this plug."""
+        return f"{DOMAIN}:energy_{slugify(self.mac)}"
+
+    @callback
+    def async_import_statistics(self, name: str, now: float | None = None) -> int:
+        """Import every completed, not yet imported hour in one batch.
+
+        Returns the number of hours written.
+        """
+        if self._start is None or "recorder" not in self.hass.config.components:
+            return 0
+
+        first = self._start if self._stat_hour is None else self._stat_hour
+        # Hours that have dropped out of the window were lost; skip past them.
+        first = max(first, self._start)
+        last = min(utc_hour(now) - IMPORT_LAG_HOURS, self.end_hour)
+        if first >= last:
+            return 0
+
+        statistics: list[StatisticData] = []
+        running = self._stat_sum
+        for hour in range(first, last):
+            usage = self.value(hour)
+            running += usage
+            statistics.append(
+                StatisticData(
+                    start=dt_util.utc_from_timestamp(hour * _SECONDS_PER_HOUR),
+                    state=usage,
+                    sum=running,
+                )
+            )
+
+        metadata = StatisticMetaData(
+            mean_type=StatisticMeanType.NONE,
+            has_sum=True,
+            name=f"{name} Energy",
+            source=DOMAIN,
+            statistic_id=self.statistic_id,
+            unit_class=EnergyConverter.UNIT_CLASS,
+            unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR,
+        )
+        async_add_external_statistics(self.hass, metadata, statistics)
+
+        self._stat_hour = last
+        self._stat_sum = running
+        self.async_schedule_save()
+        _LOGGER.debug(
+            "Imported %s hours of energy statistics for %s", len(statistics), self.mac
+        )
+        return len(statistics)
+
+
+async def async_get_energy_ledger(
+    hass: HomeAssistant, plug: Switch
+) -> WyzePlugEnergyLedger:
+    """Return the (loaded) ledger for ``plug``, creating it on first use."""
+    store = hass.data.setdefault(DOMAIN, {}).setdefault(ENERGY_LEDGERS, {})
+    entry = store.get(plug.mac)
+    if entry is None:
+        ledger = WyzePlugEnergyLedger(hass, plug.mac)
+        entry = store[plug.mac] = {"count": 0, "ledger": ledger}
+        await ledger.async_load()
+    return entry["ledger"]
+
+
+async def async_register_energy_updater(
+    hass: HomeAssistant, service: SwitchUsageService, plug: Switch
+) -> None:
+    """Ensure exactly one background usage updater exists for ``plug``.
+
+    The first caller registers the updater (its callback feeds the ledger and
+    dispatches it to all subscribed entities); subsequent callers just bump the
+    reference count.
+    """
+    ledger = await async_get_energy_ledger(hass, plug)
+    entry = hass.data[DOMAIN][ENERGY_LEDGERS][plug.mac]
+    entry["count"] += 1
+    if entry["count"] > 1:
+        return
+
+    @callback
+    def _ingest(updated: Switch) -> None:
+        ledger.async_ingest(updated.usage_history)
+        ledger.async_import_statistics(plug.nickname)
+        async_dispatcher_send(hass, energy_signal(plug.mac), ledger)
+
+    plug.usage_history = None  # type: ignore[attr-defined]
+    plug.callback_function = _ingest
+    service.register_updater(plug, UPDATE_INTERVAL)
+    await async_start_update_manager(hass, service)
+    entry["device"] = plug
+    entry["service"] = service
+
+
+@callback
+def async_deregister_energy_entity(hass: HomeAssistant, plug: Switch) -> None:
+    """Drop one reference to a plug's updater, tearing it down at zero."""
+    store = hass.data.get(DOMAIN, {}).get(ENERGY_LEDGERS, {})
+    entry = store.get(plug.mac)
+    if entry is None or entry["count"] <= 0:
+        return
+    entry["count"] -= 1
+    if entry["count"] == 0:
+        try:
+            entry["service"].unregister_updater(entry["device"])
+        except Exception as err:  # pragma: no cover - defensive cleanup
+            _LOGGER.debug("Error unregistering energy updater: %s", err)
+        # Keep the ledger itself so a re-added entity continues where it left off
+        entry.pop("device", None)
+        entry.pop("service", None)
+
+
+async def async_release_energy_ledgers(hass: HomeAssistant) -> None:
+    """Write out and drop the ledgers no entity uses anymore."""
+    store = hass.data.get(DOMAIN, {}).get(ENERGY_LEDGERS, {})
+    for mac in [mac for mac, entry in store.items() if entry["count"] <= 0]:
+        await store.pop(mac)["ledger"].async_save()
+    if not store:
+        hass.data.get(DOMAIN, {}).pop(ENERGY_LEDGERS, None)
@@ -0,0 +1,348 @@
+"""Local SQLite index of Wyze camera events.
+
+The Wyze event list only reaches back one hour, so once ``wyze_camera_event`` has
+fired its screenshot and video links are gone. Every event seen by the event
+pipeline is recorded here (camera, timestamp, AI tags and file urls) so the
+media browser can page through weeks of history without touching the cloud.
+
+All database access runs in the executor on a single connection guarded by a
+lock. Lookups by camera and time range use the ``(mac, ts)`` index and tag
+filters go through the ``event_tags`` table, indexed by ``(tag, mac, ts)``.
+"""
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from wyzeapy.services.camera_service import Camera
+from wyzeapy.types import Event
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event as HassEvent, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Keys under hass.data[DOMAIN] holding the shared index, the lock guarding
+# its creation and the removal of its stop listener.
+EVENT_INDEX = "event_index"
+EVENT_INDEX_LOCK = "event_index_lock"
+EVENT_INDEX_UNSUB = "event_index_unsub"
+DB_FILE = f"{DOMAIN}_events.db"
+# Events older than this are pruned.
+RETENTION_DAYS = 30
+# Default number of events returned per query.
+PAGE_SIZE = 100
+# Width (ms) of the buckets events are grouped in to find their local day.
+# Every time zone offset is a multiple of 15 minutes, so all events of a
+# bucket fall on the same local day.
+DAY_BUCKET = 15 * 60 * 1000
+
+# Known values of the ``ai_tag_list`` of event files.
+AI_TAG_NAMES = {
+    101: "Person",
+    102: "Vehicle",
+    103: "Pet",
+    104: "Package",
+}
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS events (
+        event_id TEXT PRIMARY KEY,
+        mac TEXT NOT NULL,
+        name TEXT,
+        ts INTEGER NOT NULL,
+        screenshot TEXT,
+        video TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS events_mac_ts ON events (mac, ts)",
+    "CREATE INDEX IF NOT EXISTS events_ts ON events (ts)",
+    """
+    CREATE TABLE IF NOT EXISTS event_tags (
+        event_id TEXT NOT NULL,
+        tag INTEGER NOT NULL,
+        mac TEXT NOT NULL,
+        ts INTEGER NOT NULL,
+        PRIMARY KEY (event_id, tag)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS event_tags_tag ON event_tags (tag, mac, ts)",
+)
+
+
+@dataclass(slots=True, frozen=True)
+class IndexedEvent:
+    """A camera event as stored in the index."""
+
+    event_id: str
+    mac: str
+    name: str | None
+    ts: int
+    screenshot: str | None
+    video: str | None
+    tags: tuple[int, ...] = ()
+
+
+def event_ai_tags(event: Event) -> set[int]:
+    """Return the AI tags of all files of ``event``."""
+    tags: set[int] = set()
+    for resource in getattr(event, "file_list", None) or []:
+        for tag in resource.get("ai_tag_list") or []:
+            try:
+                tags.add(int(tag))
+            except (TypeError, ValueError):
+                continue
+    return tags
+
+
+def event_urls(event: Event) -> tuple[str | None, str | None]:
+    """Return the screenshot and video urls of ``event``."""
+    screenshot = video = None
+    for resource in getattr(event, "file_list", None) or []:
+        if resource.get("type") == 1:
+            screenshot = resource.get("url")
+        elif resource.get("type") == 2:
+            video = resource.get("url")
+    return screenshot, video
+
+
+def _event_row(camera: Camera, event: Event) -> tuple[tuple[Any, ...], set[int]]:
+    """Return the ``events`` row and the AI tags of ``event``."""
+    screenshot, video = event_urls(event)
+    row = (
+        event.event_id,
+        camera.mac,
+        camera.nickname,
+        int(event.event_ts),
+        screenshot,
+        video,
+    )
+    return row, event_ai_tags(event)
+
+
+class WyzeEventIndex:
+    """SQLite backed index of camera events."""
+
+    def __init__(self, path: str) -> None:
+        """Initialize the index; call :meth:`open` before use."""
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def open(self) -> None:
+        """Open the database and create the schema."""
+        with self._lock:
+            self._conn = sqlite3.connect(self._path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            for statement in _SCHEMA:
+                self._conn.execute(statement)
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def add(self, rows: list[tuple[tuple[Any, ...], set[int]]]) -> None:
+        """Insert events, ignoring ones already indexed."""
+        with self._lock:
+            if self._conn is None:
+                return
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO events VALUES (?, ?, ?, ?, ?, ?)",
+                    [row for row, _ in rows],
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO event_tags VALUES (?, ?, ?, ?)",
+                    [
+                        (row[0], tag, row[1], row[3])
+                        for row, tags in rows
+                        for tag in tags
+                    ],
+                )
+
+    def prune(self, before: int) -> None:
+        """Delete events older than ``before`` (ms)."""
+        with self._lock:
+            if self._conn is None:
+                return
+            with self._conn:
+                self._conn.execute("DELETE FROM events WHERE ts < ?", (before,))
+                self._conn.execute("DELETE FROM event_tags WHERE ts < ?", (before,))
+
+    def cameras(self) -> list[tuple[str, str | None, int]]:
+        """Return ``(mac, name, event count)`` for every indexed camera."""
+        with self._lock:
+            if self._conn is None:
+                return []
+            return self._conn.execute(
+                "SELECT mac, MAX(name), COUNT(*) FROM events GROUP BY mac ORDER BY 2"
+            ).fetchall()
+
+    def tags(self, mac: str | None = None) -> list[tuple[int, int]]:
+        """Return ``(tag, event count)`` for the given camera (or all)."""
+        with self._lock:
+            if self._conn is None:
+                return []
+            if mac is None:
+                return self._conn.execute(
+                    "SELECT tag, COUNT(*) FROM event_tags GROUP BY tag ORDER BY tag"
+                ).fetchall()
+            return self._conn.execute(
+                "SELECT tag, COUNT(*) FROM event_tags WHERE mac = ? "
+                "GROUP BY tag ORDER BY tag",
+                (mac,),
+            ).fetchall()
+
+    def days(self, mac: str | None = None, tag: int | None = None) -> list[date]:
+        """Return the local calendar days with events, newest first.
+
+        Each event's day uses the UTC offset in effect at its time, so days
+        stay right across daylight saving changes.
+        """
+        clauses: list[str] = []
+        params: list[Any] = [DAY_BUCKET]
+        table = "events" if tag is None else "event_tags"
+        if tag is not None:
+            clauses.append("tag = ?")
+            params.append(tag)
+        if mac is not None:
+            clauses.append("mac = ?")
+            params.append(mac)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            if self._conn is None:
+                return []
+            rows = self._conn.execute(
+                f"SELECT DISTINCT ts / ? AS bucket FROM {table} {where}",
+                params,
+            ).fetchall()
+        days = {
+            dt_util.as_local(
+                dt_util.utc_from_timestamp(bucket * DAY_BUCKET / 1000)
+            ).date()
+            for (bucket,) in rows
+        }
+        return sorted(days, reverse=True)
+
+    def query(
+        self,
+        mac: str | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        tag: int | None = None,
+        limit: int = PAGE_SIZE,
+    ) -> list[IndexedEvent]:
+        """Return events newest first, filtered by camera, time range and tag."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if tag is not None:
+            source = "event_tags t JOIN events e ON e.event_id = t.event_id"
+            prefix = "t"
+            clauses.append("t.tag = ?")
+            params.append(tag)
+        else:
+            source = "events e"
+            prefix = "e"
+        if mac is not None:
+            clauses.append(f"{prefix}.mac = ?")
+            params.append(mac)
+        if start is not None:
+            clauses.append(f"{prefix}.ts >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append(f"{prefix}.ts < ?")
+            params.append(end)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            "SELECT e.event_id, e.mac, e.name, e.ts, e.screenshot, e.video, "
+            "(SELECT GROUP_CONCAT(tag) FROM event_tags g "
+            "WHERE g.event_id = e.event_id) "
+            f"FROM {source} {where} ORDER BY {prefix}.ts DESC LIMIT ?"
+        )
+        params.append(limit)
+        with self._lock:
+            if self._conn is None:
+                return []
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            IndexedEvent(
+                *row[:6],
+                tags=tuple(int(tag) for tag in row[6].split(",")) if row[6] else (),
+            )
+            for row in rows
+        ]
+
+    def get(self, event_id: str) -> IndexedEvent | None:
+        """Return a single event."""
+        with self._lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT event_id, mac, name, ts, screenshot, video "
+                "FROM events WHERE event_id = ?",
+                (event_id,),
+            ).fetchone()
+        return IndexedEvent(*row) if row else None
+
+
+async def async_get_event_index(hass: HomeAssistant) -> WyzeEventIndex:
+    """Return the shared event index, opening it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (index := domain_data.get(EVENT_INDEX)) is not None:
+        return index
+
+    # Callers arriving while the index opens wait for it instead of using it
+    # half open or opening a second one
+    async with domain_data.setdefault(EVENT_INDEX_LOCK, asyncio.Lock()):
+        if (index := domain_data.get(EVENT_INDEX)) is not None:
+            return index
+        index = WyzeEventIndex(hass.config.path(DB_FILE))
+        await hass.async_add_executor_job(index.open)
+        await hass.async_add_executor_job(
+            index.prune, int((time.time() - RETENTION_DAYS * 86400) * 1000)
+        )
+
+        @callback
+        def _async_close(event: HassEvent) -> None:
+            domain_data.pop(EVENT_INDEX_UNSUB, None)
+            hass.async_add_executor_job(index.close)
+
+        domain_data[EVENT_INDEX_UNSUB] = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_STOP, _async_close
+        )
+        domain_data[EVENT_INDEX] = index
+    return index
+
+
+async def async_close_event_index(hass: HomeAssistant) -> None:
+    """Close the shared index once no entry uses it anymore."""
+    domain_data = hass.data.get(DOMAIN, {})
+    if (unsub := domain_data.pop(EVENT_INDEX_UNSUB, None)) is not None:
+        unsub()
+    if (index := domain_data.pop(EVENT_INDEX, None)) is not None:
+        await hass.async_add_executor_job(index.close)
+
+
+@callback
+def async_index_events(
+    hass: HomeAssistant,
+    index: WyzeEventIndex,
+    events: Iterable[tuple[Camera, Event]],
+) -> None:
+    """Record ``events`` in the index in the background."""
+    if rows := [_event_row(camera, event) for camera, event in events]:
+        hass.async_add_executor_job(index.add, rows)
@@ -0,0 +1,394 @@
+"""Centralised camera event ingestion for a config entry.
+
+Previously every camera power switch compared ``last_event_ts`` between its own
+polls to decide whether to fire ``wyze_camera_event``. Anything that happened
+between two polls was lost, and a restart reset the baseline.
+
+A single :class:`WyzeCameraEventPipeline` per entry now pulls the account-wide
+event list (one call covers every camera, paging back to the newest event
+already fired when more arrived since the last poll than fit in one page, and
+finishing a burst too large for one poll in the next ones), drops events it
+has already seen using a bounded ring buffer of event ids, and fires every new
+event in chronological order. The ring buffer and the newest fired timestamp are
+persisted so that events which arrived while Home Assistant was briefly down
+(the Wyze event list covers the last hour) are replayed on startup instead of
+being dropped or fired twice.
+
+Besides the bus event, each event is dispatched on a per-camera signal so that
+entities (e.g. camera motion) can react to it without polling on their own, and
+recorded in the local event index behind the media browser.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+from datetime import timedelta
+import logging
+import time
+from typing import Any
+
+from aiohttp.client_exceptions import ClientError
+from wyzeapy import CameraService
+from wyzeapy.const import APP_NAME, APP_VER, APP_VERSION, PHONE_ID, PHONE_SYSTEM_TYPE
+from wyzeapy.exceptions import AccessTokenError, UnknownApiError
+from wyzeapy.services.camera_service import Camera
+from wyzeapy.types import Event
+from wyzeapy.utils import check_for_errors_standard
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from .const import CAMERA_EVENT_RECEIVED, DOMAIN, WYZE_CAMERA_EVENT
+from .event_index import WyzeEventIndex, async_index_events
+from .token_refresh import TOKEN_REFRESHER
+
+_LOGGER = logging.getLogger(__name__)
+
+POLL_INTERVAL = timedelta(seconds=15)
+# Number of events requested per page (across all cameras).
+EVENT_BATCH_SIZE = 20
+# Pages fetched per poll at most. When a burst needs more, the range left
+# over is remembered and fetched by the next polls, after the newest events.
+MAX_PAGES = 10
+# How far back the Wyze event list goes, in ms.
+EVENT_WINDOW = 60 * 60 * 1000
+EVENT_LIST_URL = "https://api.wyzecam.com/app/v2/device/get_event_list"
+# Number of event ids remembered for de-duplication.
+RING_SIZE = 256
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+
+def camera_event_signal(mac: str) -> str:
+    """Return the per-camera dispatcher signal name for new events."""
+    return f"{CAMERA_EVENT_RECEIVED}-{mac}"
+
+
+def event_payload(camera: Camera, event: Event) -> dict[str, Any]:
+    """Build the ``wyze_camera_event`` payload for ``event``."""
+    # The screenshot/video urls are not always in the same positions in the
+    # lists, so we have to loop through them
+    screenshot_url = None
+    video_url = None
+    ai_tag_list = []
+    for resource in getattr(event, "file_list", None) or []:
+        ai_tag_list = ai_tag_list + (resource.get("ai_tag_list") or [])
+        if resource.get("type") == 1:
+            screenshot_url = resource.get("url")
+        elif resource.get("type") == 2:
+            video_url = resource.get("url")
+    return {
+        "device_name": camera.nickname,
+        "device_mac": camera.mac,
+        "event_id": event.event_id,
+        "event_ts": event.event_ts,
+        "ai_tag_list": ai_tag_list,
+        "tag_list": getattr(event, "tag_list", []),
+        "event_screenshot": screenshot_url,
+        "event_video": video_url,
+    }
+
+
+class WyzeCameraEventPipeline:
+    """Polls, de-duplicates and fires camera events for one config entry."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        camera_service: CameraService,
+        event_index: WyzeEventIndex | None = None,
+    ) -> None:
+        """Initialize the pipeline."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._camera_service = camera_service
+        self._event_index = event_index
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.events_{config_entry.entry_id}"
+        )
+        self._cameras: dict[str, Camera] = {}
+        self._seen: deque[str] = deque(maxlen=RING_SIZE)
+        self._seen_ids: set[str] = set()
+        self._high_water = 0
+        # Range (ms) of older events a capped poll left to fetch, if any
+        self._gap: tuple[int, int] | None = None
+        self._polling = False
+        self._baseline_only = False
+        self._unsub_poll = None
+
+    @property
+    def high_water(self) -> int:
+        """Return the timestamp (ms) of the newest event fired."""
+        return self._high_water
+
+    @property
+    def cameras(self) -> list[Camera]:
+        """Return the cameras whose events are followed."""
+        return list(self._cameras.values())
+
+    def stats(self) -> dict[str, Any]:
+        """Return the pipeline state."""
+        return {
+            "cameras": len(self._cameras),
+            "high_water": self._high_water,
+            "seen": len(self._seen),
+            "gap": self._gap,
+        }
+
+    @callback
+    def async_set_cameras(self, cameras: Iterable[Camera]) -> None:
+        """Set the cameras whose events should be fired."""
+        self._cameras = {camera.mac: camera for camera in cameras}
+
+    @callback
+    def async_add_cameras(self, cameras: Iterable[Camera]) -> None:
+        """Start firing the events of ``cameras`` too."""
+        self._cameras.update((camera.mac, camera) for camera in cameras)
+
+    @callback
+    def async_remove_cameras(self, macs: Iterable[str]) -> None:
+        """Stop firing the events of the cameras with ``macs``."""
+        for mac in macs:
+            self._cameras.pop(mac, None)
+
+    async def async_start(self, cameras: Iterable[Camera]) -> None:
+        """Restore the persisted state, replay missed events and start polling."""
+        self.async_set_cameras(cameras)
+        if data := await self._store.async_load():
+            self._high_water = data.get("high_water", 0)
+            if gap := data.get("gap"):
+                self._gap = (gap[0], gap[1])
+            for event_id in data.get("seen", []):
+                self._remember(event_id)
+        else:
+            # Nothing to replay on the very first start; only set the baseline
+            self._baseline_only = True
+        await self.async_poll()
+        self._unsub_poll = async_track_time_interval(
+            self._hass,
+            self.async_poll,
+            POLL_INTERVAL,
+            name=f"{DOMAIN} camera events",
+            cancel_on_shutdown=True,
+        )
+
+    async def async_stop(self) -> None:
+        """Stop polling and flush the persisted state."""
+        if self._unsub_poll is not None:
+            self._unsub_poll()
+            self._unsub_poll = None
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to persist."""
+        return {
+            "high_water": self._high_water,
+            "seen": list(self._seen),
+            "gap": self._gap,
+        }
+
+    def _remember(self, event_id: str) -> None:
+        """Add ``event_id`` to the ring buffer."""
+        if len(self._seen) == self._seen.maxlen:
+            self._seen_ids.discard(self._seen[0])
+        self._seen.append(event_id)
+        self._seen_ids.add(event_id)
+
+    def _is_new(self, event: Event) -> bool:
+        """Return True if ``event`` has not been fired yet."""
+        if event.event_id in self._seen_ids:
+            return False
+        # Events of a capped poll's left over range are older than the ones
+        # fired since, but have not been fetched before
+        if self._gap is not None and self._gap[0] <= event.event_ts <= self._gap[1]:
+            return True
+        # Anything older than the ring buffer's reach has been handled already
+        return not (
+            len(self._seen) == self._seen.maxlen and event.event_ts < self._high_water
+        )
+
+    async def _async_get_page(self, begin: int, end: int) -> list[dict[str, Any]]:
+        """Return the newest events between ``begin`` and ``end`` (ms).
+
+        wyzeapy's ``_get_event_list`` always covers the last hour, so the
+        request is built here with the same payload and a chosen window.
+        """
+        auth_lib = self._camera_service._auth_lib  # noqa: SLF001
+        await auth_lib.refresh_if_should()
+        payload = {
+            "phone_id": PHONE_ID,
+            "begin_time": begin,
+            "event_type": "",
+            "app_name": APP_NAME,
+            "count": EVENT_BATCH_SIZE,
+            "app_version": APP_VERSION,
+            # Newest first
+            "order_by": 2,
+            "event_value_list": ["1", "13", "10", "12"],
+            "sc": "9f275790cab94a72bd206c8876429f3c",
+            "device_mac_list": [],
+            "event_tag_list": [],
+            "sv": "782ced6909a44d92a1f70d582bbe88be",
+            "end_time": end,
+            "phone_system_type": PHONE_SYSTEM_TYPE,
+            "app_ver": APP_VER,
+            "ts": int(time.time() * 1000),
+            "device_mac": "",
+            "access_token": auth_lib.token.access_token,
+        }
+        response = await auth_lib.post(EVENT_LIST_URL, json=payload)
+        check_for_errors_standard(self._camera_service, response)
+        return response.get("data", {}).get("event_list", [])
+
+    async def _async_page_back(
+        self, begin: int, end: int, pages: int
+    ) -> tuple[list[dict[str, Any]], int | None, int]:
+        """Page back from ``end`` to ``begin`` with at most ``pages`` requests.
+
+        Returns the raw events, the end of the range still to fetch (None
+        once ``begin`` was reached) and the number of pages requested.
+        """
+        raw_events: list[dict[str, Any]] = []
+        for used in range(1, pages + 1):
+            page = await self._async_get_page(begin, end)
+            raw_events.extend(page)
+            if len(page) < EVENT_BATCH_SIZE:
+                return raw_events, None, used
+            oldest = min(raw_event["event_ts"] for raw_event in page)
+            if oldest <= begin or oldest >= end:
+                return raw_events, None, used
+            # Events sharing the oldest timestamp may straddle the pages;
+            # the overlap is dropped as already seen
+            end = oldest
+        return raw_events, end, pages
+
+    async def _async_fetch(self) -> tuple[list[Event], tuple[int, int] | None] | None:
+        """Fetch the events since the newest one fired, across all cameras.
+
+        Pages go back from now until they reach the newest event fired
+        already, so a burst of events between two polls isn't cut off at
+        one page. Pages left over after that continue the range a previous
+        capped poll did not reach. Returns the events and the range still
+        left to fetch.
+        """
+        if self._polling or not self._cameras:
+            return None
+        self._polling = True
+        now = int(time.time() * 1000)
+        window_start = now - EVENT_WINDOW
+        begin = max(self._high_water, window_start)
+        gap = self._gap
+        try:
+            raw_events, stopped, used = await self._async_page_back(
+                begin, now, MAX_PAGES
+            )
+            if gap is not None and gap[1] < window_start:
+                _LOGGER.warning(
+                    "Camera events between %s and %s were not fetched before "
+                    "they left the Wyze event list",
+                    gap[0],
+                    gap[1],
+                )
+                gap = None
+            elif gap is not None:
+                gap_begin = max(gap[0], window_start)
+                older, gap_end, _ = await self._async_page_back(
+                    gap_begin, gap[1], MAX_PAGES - used
+                )
+                raw_events.extend(older)
+                gap = None if gap_end is None else (gap_begin, gap_end)
+            if stopped is not None:
+                _LOGGER.debug(
+                    "More camera events than %d pages, fetching the rest on the "
+                    "next polls",
+                    MAX_PAGES,
+                )
+                gap = (begin if gap is None else gap[0], stopped)
+        except AccessTokenError:
+            await self._async_refresh_token()
+            return None
+        except (UnknownApiError, ClientError, TimeoutError) as err:
+            _LOGGER.debug("Unable to fetch the camera event list: %s", err)
+            return None
+        finally:
+            self._polling = False
+        return [Event(raw_event) for raw_event in raw_events], gap
+
+    async def async_fetch_event(self, event_id: str, event_ts: int) -> Event | None:
+        """Fetch an event again, with freshly signed file links.
+
+        Returns None once the event is older than the cloud's event list
+        reaches back, or if it can't be fetched.
+        """
+        if event_ts < time.time() * 1000 - EVENT_WINDOW:
+            return None
+        try:
+            page = await self._async_get_page(event_ts, event_ts)
+        except (AccessTokenError, UnknownApiError, ClientError, TimeoutError) as err:
+            _LOGGER.debug("Unable to fetch event %s: %s", event_id, err)
+            return None
+        return next(
+            (Event(raw) for raw in page if raw.get("event_id") == event_id), None
+        )
+
+    async def _async_refresh_token(self) -> None:
+        """Refresh the rejected token; the next poll fetches the events."""
+        entry_data = self._hass.data[DOMAIN].get(self._config_entry.entry_id, {})
+        if (refresher := entry_data.get(TOKEN_REFRESHER)) is None:
+            return
+        try:
+            await refresher.async_refresh()
+        except Exception as err:  # noqa: BLE001
+            # The refresher starts a reauth or retries on its own
+            _LOGGER.debug("Token refresh for the event list failed: %s", err)
+
+    async def async_poll(self, now=None) -> None:
+        """Fetch the latest events for all cameras and fire the new ones."""
+        if (fetched := await self._async_fetch()) is None:
+            return
+        events, gap = fetched
+        self.async_process_events(events, fire=not self._baseline_only)
+        # Moved only now so the events of the previous range count as new;
+        # the baseline has nothing to catch up on
+        if self._baseline_only:
+            gap = None
+        if gap != self._gap:
+            self._gap = gap
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+        self._baseline_only = False
+
+    @callback
+    def async_process_events(self, events: Iterable[Event], fire: bool = True) -> int:
+        """Fire every new event in chronological order and return the count."""
+        new_events = sorted(
+            (
+                event
+                for event in events
+                if event.device_mac in self._cameras and self._is_new(event)
+            ),
+            key=lambda event: event.event_ts,
+        )
+        for event in new_events:
+            camera = self._cameras[event.device_mac]
+            self._remember(event.event_id)
+            self._high_water = max(self._high_water, event.event_ts)
+            if not fire:
+                continue
+            _LOGGER.debug("Camera: %s has a new event", camera.nickname)
+            self._hass.bus.async_fire(WYZE_CAMERA_EVENT, event_payload(camera, event))
+            async_dispatcher_send(
+                self._hass, camera_event_signal(camera.mac), camera, event
+            )
+        if new_events:
+            self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+            if self._event_index is not None:
+                async_index_events(
+                    self._hass,
+                    self._event_index,
+                    ((self._cameras[event.device_mac], event) for event in new_events),
+                )
+        return len(new_events)
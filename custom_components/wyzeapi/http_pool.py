@@ -0,0 +1,187 @@
+"""One connection pool for the Wyze cloud, shared by every account.
+
+wyzeapy opens a new ``ClientSession`` (and connector) for every request, so
+each request pays a DNS lookup, a TCP connect and a TLS handshake, and the
+sockets scale with the number of accounts and devices polled. The pool
+keeps a single session per process, with keep-alive and a per-host
+connection limit, and :class:`WyzeAccountHttp` routes one account's requests
+through it: it takes over the request methods of that account's
+``WyzeAuthLib``, so the auth state stays per account while connections are
+reused across all of them.
+
+Each account also gets its own budget of concurrent requests, so an account
+with hundreds of devices can't starve the others of connections, and its
+own request counters for diagnostics.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import ssl
+import time
+from typing import Any
+
+from aiohttp import ClientError, ClientSession, ClientTimeout, TCPConnector
+from wyzeapy.wyze_auth_lib import WyzeAuthLib
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Keys under hass.data[DOMAIN] holding the shared pool and the removal of
+# its close listener, and under hass.data[DOMAIN][entry_id] holding the
+# entry's account.
+HTTP_POOL = "http_pool"
+HTTP_POOL_UNSUB = "http_pool_unsub"
+ACCOUNT_HTTP = "account_http"
+
+# Connections kept open to one Wyze host, for all accounts together.
+LIMIT_PER_HOST = 16
+# Requests one account can have in flight.
+ACCOUNT_CONCURRENCY = 8
+KEEPALIVE_TIMEOUT = 60
+DNS_CACHE_TTL = 30 * 60
+REQUEST_TIMEOUT = ClientTimeout(total=30)
+
+
+def _ssl_context() -> ssl.SSLContext | None:
+    """Return wyzeapy's SSL context, or None for aiohttp's default one."""
+    try:
+        from wyzeapy.wyze_auth_lib import get_ssl_context
+    except ImportError:  # older wyzeapy without the shared context helper
+        return None
+    return get_ssl_context()
+
+
+async def async_get_http_pool(hass: HomeAssistant) -> ClientSession:
+    """Return the shared session, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (session := domain_data.get(HTTP_POOL)) is not None:
+        return session
+
+    # The SSL context loads the CA bundle from disk
+    ssl_context = await hass.async_add_executor_job(_ssl_context)
+    if (session := domain_data.get(HTTP_POOL)) is not None:
+        return session
+    session = ClientSession(
+        connector=TCPConnector(
+            limit_per_host=LIMIT_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            ssl=ssl_context if ssl_context is not None else True,
+        ),
+        timeout=REQUEST_TIMEOUT,
+    )
+    domain_data[HTTP_POOL] = session
+
+    @callback
+    def _async_close(event: Event) -> None:
+        domain_data.pop(HTTP_POOL_UNSUB, None)
+        hass.async_create_task(session.close())
+
+    domain_data[HTTP_POOL_UNSUB] = hass.bus.async_listen_once(
+        EVENT_HOMEASSISTANT_CLOSE, _async_close
+    )
+    return session
+
+
+async def async_close_http_pool(hass: HomeAssistant) -> None:
+    """Close the shared session once no account uses it anymore."""
+    domain_data = hass.data.get(DOMAIN, {})
+    if (unsub := domain_data.pop(HTTP_POOL_UNSUB, None)) is not None:
+        unsub()
+    if (session := domain_data.pop(HTTP_POOL, None)) is not None:
+        await session.close()
+
+
+class WyzeAccountHttp:
+    """Sends the requests of one account through the shared pool."""
+
+    def __init__(self, session: ClientSession) -> None:
+        """Initialize the account."""
+        self._session = session
+        self._semaphore = asyncio.Semaphore(ACCOUNT_CONCURRENCY)
+        self.requests = 0
+        self.errors = 0
+        self.waited = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the request counters for diagnostics."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "waited_for_budget": self.waited,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "mean_latency_ms": (
+                round(self.total_latency / self.requests * 1000)
+                if self.requests
+                else None
+            ),
+            "max_latency_ms": round(self.max_latency * 1000),
+        }
+
+    @callback
+    def async_attach(self, auth_lib: WyzeAuthLib) -> None:
+        """Send the requests of ``auth_lib`` through the pool from now on.
+
+        Token refreshes keep using wyzeapy's own session; they happen about
+        once a day.
+        """
+
+        async def post(url, json=None, headers=None, data=None):
+            return await self._async_request(
+                "POST", url, json=json, headers=headers, data=data
+            )
+
+        async def put(url, json=None, headers=None, data=None):
+            return await self._async_request(
+                "PUT", url, json=json, headers=headers, data=data
+            )
+
+        async def get(url, headers=None, params=None):
+            return await self._async_request("GET", url, headers=headers, params=params)
+
+        async def patch(url, headers=None, params=None, json=None):
+            return await self._async_request(
+                "PATCH", url, headers=headers, params=params, json=json
+            )
+
+        async def delete(url, headers=None, json=None):
+            return await self._async_request("DELETE", url, headers=headers, json=json)
+
+        auth_lib.post = post
+        auth_lib.put = put
+        auth_lib.get = get
+        auth_lib.patch = patch
+        auth_lib.delete = delete
+
+    async def _async_request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request and return its JSON body, like wyzeapy does."""
+        if self._semaphore.locked():
+            self.waited += 1
+        async with self._semaphore:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            start = time.monotonic()
+            try:
+                async with self._session.request(method, url, **kwargs) as response:
+                    _LOGGER.debug("%s %s: %s", method, url, response.status)
+                    return await response.json()
+            except (ClientError, TimeoutError):
+                self.errors += 1
+                raise
+            finally:
+                latency = time.monotonic() - start
+                self.in_flight -= 1
+                self.requests += 1
+                self.total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
@@ -25,6 +25,7 @@ from homeassistant.helpers.dispatcher import (
 from homeassistant.helpers.entity import DeviceInfo
 
 from .const import DOMAIN, IRRIGATION_UPDATED
+from .device_store import async_start_update_manager
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -61,7 +62,7 @@ async def async_register_irrigation_updater(
 
     device.callback_function = _dispatch
     service.register_updater(device, UPDATE_INTERVAL)
-    await service.start_update_manager()
+    await async_start_update_manager(hass, service)
     store[device.mac] = {"count": 1, "device": device, "service": service}
 
 
@@ -79,6 +80,8 @@ def async_deregister_irrigation_entity(hass: HomeAssistant, device: Irrigation)
         except Exception as err:  # pragma: no cover - defensive cleanup
             _LOGGER.debug("Error unregistering irrigation updater: %s", err)
         store.pop(device.mac, None)
+        if not store:
+            hass.data[DOMAIN].pop(IRRIGATION_UPDATERS, None)
 
 
 class WyzeIrrigationEntity:
@@ -1,6 +1,6 @@
 """Platform for light integration."""
 
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from datetime import timedelta
 import logging
 from typing import Any
@@ -10,7 +10,7 @@ from wyzeapy import BulbService, CameraService, Wyzeapy
 from wyzeapy.exceptions import AccessTokenError, ParameterError, UnknownApiError
 from wyzeapy.services.bulb_service import Bulb
 from wyzeapy.services.camera_service import Camera
-from wyzeapy.types import DeviceTypes, PropertyIDs
+from wyzeapy.types import Device, DeviceTypes, PropertyIDs
 from wyzeapy.utils import create_pid_pair
 
 from homeassistant.components.light import (
@@ -39,6 +39,10 @@ from .const import (
     DOMAIN,
     LIGHT_UPDATED,
 )
+from .capabilities import BULB_TYPES, camera_light_kind
+from .device_store import async_get_device_store, async_start_update_manager
+from .discovery import async_register_device_adder
+from .local_mode import LOCAL_MODE
 from .token_manager import token_exception_handler
 
 _LOGGER = logging.getLogger(__name__)
@@ -60,40 +64,43 @@ async def async_setup_entry(
     """Set up the entities in the config entry."""
 
     _LOGGER.debug("""Creating new WyzeApi light component""")
-    client: Wyzeapy = hass.data[DOMAIN][config_entry.entry_id][CONF_CLIENT]
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    if (local := entry_data.get(LOCAL_MODE)) is not None:
+        # The cloud is unreachable; only the cached bulbs work, over the LAN
+        async_add_entities(
+            [
+                WyzeLight(local.bulb_service, bulb, config_entry, local_only=True)
+                for bulb in local.bulbs
+            ],
+            False,
+        )
+        return
+
+    client: Wyzeapy = entry_data[CONF_CLIENT]
     camera_service = await client.camera_service
 
     bulb_service = await client.bulb_service
-
-    lights = [
-        WyzeLight(bulb_service, light, config_entry)
-        for light in await bulb_service.get_bulbs()
-    ]
-
-    for camera in await camera_service.get_cameras():
-        if camera.product_model == "HL_BC":
-            # Wyze Bulb Cam has integrated light
-            lights.append(WyzeCamerafloodlight(camera, camera_service, "bulbcam"))
-        elif (
-            camera.product_model == "WYZE_CAKP2JFUS"
-            and camera.device_params["dongle_product_model"] == "HL_CFL"
-            or camera.product_model in ("LD_CFP", "HL_CFL2")  # Floodlight v2
-        ):
-            lights.append(WyzeCamerafloodlight(camera, camera_service, "floodlight"))
-
-        elif (
-            camera.product_model in ("WYZE_CAKP2JFUS", "HL_CAM4")
-        ) and camera.device_params[
-            "dongle_product_model"
-        ] == "HL_CAM3SS":  # Cam v3 with lamp socket accessory
-            lights.append(WyzeCamerafloodlight(camera, camera_service, "lampsocket"))
-
-        elif (
-            camera.product_model == "AN_RSCW"
-        ):  # Battery cam pro (integrated spotlight)
-            lights.append(WyzeCamerafloodlight(camera, camera_service, "spotlight"))
-
-    async_add_entities(lights, True)
+    store = async_get_device_store(hass, config_entry.entry_id)
+
+    async def _async_add_devices(devices: list[Device]) -> None:
+        lights = [
+            WyzeLight(bulb_service, Bulb(device.raw_dict), config_entry)
+            for device in devices
+            if device.type in BULB_TYPES
+        ]
+        for device in devices:
+            if (
+                device.type is DeviceTypes.CAMERA
+                and (kind := camera_light_kind(device)) is not None
+            ):
+                camera = store.device(Camera(device.raw_dict))
+                lights.append(WyzeCamerafloodlight(camera, camera_service, kind))
+        async_add_entities(lights, True)
+
+    await _async_add_devices(
+        [*await bulb_service.get_bulbs(), *await camera_service.get_cameras()]
+    )
+    async_register_device_adder(hass, config_entry, "light", _async_add_devices)
 
 
 class WyzeLight(LightEntity):
@@ -102,9 +109,20 @@ class WyzeLight(LightEntity):
     _just_updated = False
     _attr_should_poll = False
 
-    def __init__(self, bulb_service: BulbService, bulb: Bulb, config_entry) -> None:
-        """Initialize a Wyze Bulb."""
+    def __init__(
+        self,
+        bulb_service: BulbService,
+        bulb: Bulb,
+        config_entry,
+        local_only: bool = False,
+    ) -> None:
+        """Initialize a Wyze Bulb.
+
+        A ``local_only`` bulb is controlled over the LAN while the cloud is
+        unreachable; its state isn't polled.
+        """
         self._bulb = bulb
+        self._local_only = local_only
         self._device_type = DeviceTypes(self._bulb.product_type)
         self._config_entry = config_entry
         self._local_control = config_entry.options.get(BULB_LOCAL_CONTROL)
@@ -235,31 +253,41 @@ class WyzeLight(LightEntity):
                     self._bulb.effects = "3"
 
         _LOGGER.debug("Turning on light")
-        try:
-            await self._bulb_service.turn_on(self._bulb, self._local_control, options)
-        except (AccessTokenError, ParameterError, UnknownApiError) as err:
-            raise HomeAssistantError(f"Wyze returned an error: {err.args}") from err
-        except ClientConnectionError as err:
-            raise HomeAssistantError(err) from err
-        else:
-            self._bulb.on = True
-            self._just_updated = True
-            self.async_schedule_update_ha_state()
+        await self._async_send(
+            self._bulb_service.turn_on(self._bulb, self._local_control, options)
+        )
+        self._bulb.on = True
+        self._just_updated = True
+        self.async_schedule_update_ha_state()
 
     @token_exception_handler
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
         self._local_control = self._config_entry.options.get(BULB_LOCAL_CONTROL)
+        await self._async_send(
+            self._bulb_service.turn_off(self._bulb, self._local_control)
+        )
+        self._bulb.on = False
+        self._just_updated = True
+        self.async_schedule_update_ha_state()
+
+    async def _async_send(self, command: Awaitable[None]) -> None:
+        """Send a command, turning its failures into HomeAssistantError."""
         try:
-            await self._bulb_service.turn_off(self._bulb, self._local_control)
+            await command
         except (AccessTokenError, ParameterError, UnknownApiError) as err:
             raise HomeAssistantError(f"Wyze returned an error: {err.args}") from err
         except ClientConnectionError as err:
             raise HomeAssistantError(err) from err
-        else:
-            self._bulb.on = False
-            self._just_updated = True
-            self.async_schedule_update_ha_state()
+        except Exception as err:
+            if not self._local_only:
+                raise
+            # A bulb unreachable over the LAN falls back to the cloud, which
+            # is down (or was never logged in to) in local mode
+            raise HomeAssistantError(
+                f"{self.name} is unreachable over the LAN and the Wyze cloud is "
+                "unavailable"
+            ) from err
 
     @property
     def supported_color_modes(self):
@@ -350,6 +378,8 @@ class WyzeLight(LightEntity):
     @token_exception_handler
     async def async_update(self):
         """Update the lock to be up to date with the Wyze Servers."""
+        if self._local_only:
+            return
         if not self._just_updated:
             self._bulb = await self._bulb_service.update(self._bulb)
         else:
@@ -365,14 +395,16 @@ class WyzeLight(LightEntity):
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to update events."""
-        self._bulb.callback_function = self.async_update_callback
-        self._bulb_service.register_updater(self._bulb, 30)
-        await self._bulb_service.start_update_manager()
+        if not self._local_only:
+            self._bulb.callback_function = self.async_update_callback
+            self._bulb_service.register_updater(self._bulb, 30)
+            await async_start_update_manager(self.hass, self._bulb_service)
         return await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self) -> None:
         """Unregister the updater."""
-        self._bulb_service.unregister_updater(self._bulb)
+        if not self._local_only:
+            self._bulb_service.unregister_updater(self._bulb)
 
 
 class WyzeCamerafloodlight(LightEntity):
@@ -0,0 +1,142 @@
+"""Keep local devices working while the Wyze cloud is unreachable.
+
+Bulbs under local control are commanded over the LAN, and Lock Bolts over
+Bluetooth, but both need details only the cloud hands out: the bulb's ip and
+local key, the bolt's BLE address and token. :class:`WyzeInventoryCache`
+persists those for every local capable device after each successful setup.
+
+When login then fails because the cloud can't be reached, the entry starts
+in local mode from the cache: only the light and lock platforms are loaded,
+with the cached bulbs and bolts, so every cloud only entity stays
+unavailable, and a background task keeps retrying the login with an
+exponential backoff and reloads the entry once it succeeds.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import logging
+import random
+from typing import Any
+
+from wyzeapy.services.bulb_service import Bulb, BulbService
+from wyzeapy.services.lock_service import Lock, LockService
+from wyzeapy.types import Device, DeviceTypes
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, LOCK_BOLT_MODELS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Keys under hass.data[DOMAIN][entry_id] holding the entry's inventory cache
+# and, while the cloud is unreachable, its local mode state.
+INVENTORY_CACHE = "inventory_cache"
+LOCAL_MODE = "local_mode"
+
+# Platforms that can work without the cloud.
+LOCAL_PLATFORMS = frozenset({"light", "lock"})
+
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+# Seconds between cloud login attempts in local mode, and between attempts
+# to load the info of a Lock Bolt.
+RETRY_INITIAL_DELAY = 30
+RETRY_MAX_DELAY = 15 * 60
+
+_BULB_TYPES = (DeviceTypes.LIGHT, DeviceTypes.MESH_LIGHT, DeviceTypes.LIGHTSTRIP)
+
+
+def _is_local_bulb(device: Device) -> bool:
+    return device.type in _BULB_TYPES and bool(
+        (device.raw_dict.get("device_params") or {}).get("ip")
+    )
+
+
+def retry_delays() -> Iterator[float]:
+    """Yield the delays between retries, doubling up to the maximum."""
+    delay = RETRY_INITIAL_DELAY
+    while True:
+        # Spread the retries of several entries (and installs) apart
+        yield delay * random.uniform(0.9, 1.1)
+        delay = min(delay * 2, RETRY_MAX_DELAY)
+
+
+class WyzeInventoryCache:
+    """The local capable devices of an account, persisted between restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the cache."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.inventory_{entry_id}"
+        )
+        self._devices: list[dict[str, Any]] = []
+        self._lock_info: dict[str, dict[str, Any]] = {}
+
+    async def async_load(self) -> None:
+        """Load the persisted inventory, if any."""
+        if data := await self._store.async_load():
+            self._devices = data.get("devices", [])
+            self._lock_info = data.get("lock_info", {})
+
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"devices": self._devices, "lock_info": self._lock_info}
+
+    @callback
+    def async_set_inventory(self, devices: Iterable[Device]) -> None:
+        """Remember the local capable devices of a fresh inventory."""
+        self._devices = [
+            device.raw_dict
+            for device in devices
+            if _is_local_bulb(device) or device.product_model in LOCK_BOLT_MODELS
+        ]
+        macs = {device["mac"] for device in self._devices}
+        self._lock_info = {
+            mac: info for mac, info in self._lock_info.items() if mac in macs
+        }
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def async_set_lock_info(self, lock: Lock) -> None:
+        """Remember the BLE details of a Lock Bolt."""
+        self._lock_info[lock.mac] = {
+            "raw_dict": lock.raw_dict,
+            "ble_id": lock.ble_id,
+            "ble_token": lock.ble_token,
+        }
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    def bulbs(self) -> list[Bulb]:
+        """Return the cached bulbs that can be controlled over the LAN."""
+        return [Bulb(raw) for raw in self._devices if _is_local_bulb(Device(raw))]
+
+    def lock_bolts(self) -> list[tuple[Lock, dict[str, Any]]]:
+        """Return the cached Lock Bolts whose BLE details are known."""
+        return [
+            (Lock(raw), self._lock_info[raw["mac"]])
+            for raw in self._devices
+            if raw.get("product_model") in LOCK_BOLT_MODELS
+            and raw["mac"] in self._lock_info
+        ]
+
+
+class WyzeLocalMode:
+    """An entry running without the cloud."""
+
+    def __init__(
+        self,
+        bulb_service: BulbService,
+        lock_service: LockService,
+        bulbs: list[Bulb],
+    ) -> None:
+        """Initialize local mode."""
+        self.bulb_service = bulb_service
+        self.lock_service = lock_service
+        self.bulbs = bulbs
+        self.login_attempts = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the local mode state for diagnostics."""
+        return {"bulbs": len(self.bulbs), "login_attempts": self.login_attempts}
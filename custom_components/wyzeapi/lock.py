@@ -3,6 +3,7 @@
 """Platform for light integration."""
 
 from abc import ABC
+import asyncio
 from datetime import timedelta
 import logging
 from typing import Any, Callable, List
@@ -10,7 +11,7 @@ from aiohttp.client_exceptions import ClientConnectionError
 
 from wyzeapy import LockService, Wyzeapy
 from wyzeapy.services.lock_service import Lock
-from wyzeapy.types import DeviceTypes
+from wyzeapy.types import Device, DeviceTypes
 from wyzeapy.exceptions import AccessTokenError, ParameterError, UnknownApiError
 
 import homeassistant.components.lock
@@ -22,7 +23,10 @@ from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers import device_registry as dr
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import CONF_CLIENT, DOMAIN, LOCK_UPDATED
+from .const import CONF_CLIENT, DOMAIN, LOCK_BOLT_MODELS, LOCK_UPDATED
+from .device_store import async_start_update_manager
+from .discovery import async_register_device_adder
+from .local_mode import LOCAL_MODE
 from .token_manager import token_exception_handler
 
 _LOGGER = logging.getLogger(__name__)
@@ -47,31 +51,81 @@ async def async_setup_entry(
     """
 
     _LOGGER.debug("""Creating new WyzeApi lock component""")
-    client: Wyzeapy = hass.data[DOMAIN][config_entry.entry_id][CONF_CLIENT]
+    entry_data = hass.data[DOMAIN][config_entry.entry_id]
+    if LOCAL_MODE in entry_data:
+        # The cloud is unreachable; only Lock Bolts work, over Bluetooth, with
+        # their lock info restored from the cache
+        async_add_entities(
+            [
+                WyzeLockBolt(coordinator)
+                for coordinator in entry_data["coordinators"].values()
+            ],
+            False,
+        )
+        return
+
+    client: Wyzeapy = entry_data[CONF_CLIENT]
     lock_service = await client.lock_service
 
-    all_locks = await lock_service.get_locks()
-
-    locks = [
-        WyzeLock(lock_service, lock)
-        for lock in all_locks
-        if lock.product_model != "YD_BT1"
-    ]
-    lock_bolts = []
-    coordinators = hass.data[DOMAIN][config_entry.entry_id].get("coordinators", {})
-    for lock in all_locks:
-        if lock.product_model == "YD_BT1":
-            coordinator = coordinators.get(lock.mac)
-            if coordinator is None:
-                _LOGGER.warning(
-                    "No coordinator found for Lock Bolt %s (%s), skipping",
-                    lock.nickname,
-                    lock.mac,
-                )
-                continue
-            lock_bolts.append(WyzeLockBolt(coordinator))
+    async def _async_add_devices(devices: list[Device]) -> None:
+        all_locks = [
+            Lock(device.raw_dict)
+            for device in devices
+            if device.type is DeviceTypes.LOCK
+        ]
+        locks = [
+            WyzeLock(lock_service, lock)
+            for lock in all_locks
+            if lock.product_model not in LOCK_BOLT_MODELS
+        ]
+        lock_bolts = []
+        coordinators = entry_data.get("coordinators", {})
+        for lock in all_locks:
+            if lock.product_model in LOCK_BOLT_MODELS:
+                coordinator = coordinators.get(lock.mac)
+                if coordinator is None:
+                    _LOGGER.warning(
+                        "No coordinator found for Lock Bolt %s (%s), skipping",
+                        lock.nickname,
+                        lock.mac,
+                    )
+                    continue
+                task = coordinator.info_task
+                if task is None or (task.done() and _lock_info_loaded(task)):
+                    lock_bolts.append(WyzeLockBolt(coordinator))
+                elif not task.done():
+                    # The BLE address is still being fetched; add the entity
+                    # when it is known instead of holding up the platform setup
+                    task.add_done_callback(
+                        _add_lock_bolt_when_loaded(coordinator, async_add_entities)
+                    )
+        async_add_entities(locks + lock_bolts, False)
+
+    await _async_add_devices(await lock_service.get_locks())
+    async_register_device_adder(hass, config_entry, "lock", _async_add_devices)
+
+
+def _lock_info_loaded(task: asyncio.Task) -> bool:
+    """Return True if a Lock Bolt info task loaded the info."""
+    return not task.cancelled() and task.exception() is None and task.result()
+
+
+def _add_lock_bolt_when_loaded(coordinator, async_add_entities):
+    """Return a done callback adding the coordinator's Lock Bolt entity."""
+
+    @callback
+    def _done(task: asyncio.Task) -> None:
+        if task.cancelled():  # the entry is being unloaded
+            return
+        if _lock_info_loaded(task):
+            async_add_entities([WyzeLockBolt(coordinator)], False)
+        else:
+            _LOGGER.warning(
+                "Lock Bolt %s was not added, the Wyze credentials were rejected",
+                coordinator._lock.nickname,
+            )
 
-    async_add_entities(locks + lock_bolts, False)
+    return _done
 
 
 class WyzeLock(homeassistant.components.lock.LockEntity, ABC):
@@ -209,7 +263,7 @@ class WyzeLock(homeassistant.components.lock.LockEntity, ABC):
         """Subscribe to update events."""
         self._lock.callback_function = self.async_update_callback
         self._lock_service.register_updater(self._lock, 10)
-        await self._lock_service.start_update_manager()
+        await async_start_update_manager(self.hass, self._lock_service)
         return await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self) -> None:
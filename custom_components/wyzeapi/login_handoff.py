@@ -0,0 +1,73 @@
+"""Hand the config flow's authenticated client to the entry's first setup.
+
+The config flow logs in to validate the credentials, and setting up the
+entry it creates would log in again right after. Each login is a round trip
+through Wyze's auth service, which rate limits (especially with 2FA). The
+flow therefore parks its logged in client, together with the device
+inventory it prefetched, and the first setup of the account picks it up
+instead of logging in. Handoffs that aren't picked up expire.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import logging
+import time
+
+from wyzeapy import Wyzeapy
+from wyzeapy.types import Device
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key under hass.data[DOMAIN] holding the pending handoffs, by username.
+LOGIN_HANDOFFS = "login_handoffs"
+# Seconds a handoff stays usable; the entry is normally set up right away.
+HANDOFF_TTL = 300
+
+
+@dataclass
+class LoginHandoff:
+    """A client logged in by the config flow."""
+
+    client: Wyzeapy
+    inventory: list[Device] | None = None
+    created: float = field(default_factory=time.monotonic)
+
+    @property
+    def expired(self) -> bool:
+        """Return True if the handoff is too old to be used."""
+        return time.monotonic() - self.created > HANDOFF_TTL
+
+
+def _key(username: str) -> str:
+    return username.strip().lower()
+
+
+@callback
+def async_store_login(
+    hass: HomeAssistant,
+    username: str,
+    client: Wyzeapy,
+    inventory: list[Device] | None = None,
+) -> None:
+    """Park ``client`` for the next setup of ``username``'s entry."""
+    handoffs = hass.data.setdefault(DOMAIN, {}).setdefault(LOGIN_HANDOFFS, {})
+    for key in [key for key, handoff in handoffs.items() if handoff.expired]:
+        del handoffs[key]
+    handoffs[_key(username)] = LoginHandoff(client, inventory)
+
+
+@callback
+def async_pop_login(hass: HomeAssistant, username: str | None) -> LoginHandoff | None:
+    """Return and remove the handoff for ``username``, if a usable one exists."""
+    handoffs = hass.data.get(DOMAIN, {}).get(LOGIN_HANDOFFS, {})
+    if not username or (handoff := handoffs.pop(_key(username), None)) is None:
+        return None
+    if handoff.expired:
+        _LOGGER.debug("Discarding expired login handoff")
+        return None
+    return handoff
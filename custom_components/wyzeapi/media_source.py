@@ -0,0 +1,254 @@
+"""Browse past Wyze camera events through the media browser.
+
+Events come from the local :mod:`event_index`, so browsing never calls the Wyze
+cloud. Identifiers are paths: ``<camera>`` (a mac address or ``all``) followed
+by optional ``tag/<ai tag>`` and ``day/<YYYY-MM-DD>`` filters, and
+``event/<event_id>`` for a single event. Days are local calendar days.
+
+The file links of an event are signed and expire. Playing an event serves
+its archived clip when there is one (see :mod:`archive`), and otherwise
+fetches the event again for fresh links while the cloud still lists it.
+"""
+
+from datetime import date, datetime, timedelta
+from http import HTTPStatus
+from pathlib import Path
+
+from aiohttp import web
+
+from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.media_player import BrowseError, MediaClass, MediaType
+from homeassistant.components.media_source import (
+    BrowseMediaSource,
+    MediaSource,
+    MediaSourceItem,
+    PlayMedia,
+    Unresolvable,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .archive import ARCHIVE_DIR, find_clip
+from .const import DOMAIN, EVENT_PIPELINE
+from .event_index import (
+    AI_TAG_NAMES,
+    IndexedEvent,
+    async_get_event_index,
+    event_urls,
+)
+
+ALL_CAMERAS = "all"
+# Events listed in a single day folder.
+DAY_LIMIT = 500
+# Events listed in a folder without a day filter.
+RECENT_LIMIT = 50
+CLIP_URL = f"/api/{DOMAIN}/clips"
+
+
+async def async_get_media_source(hass: HomeAssistant) -> MediaSource:
+    """Set up the Wyze media source."""
+    hass.http.register_view(WyzeClipView(hass))
+    return WyzeMediaSource(hass)
+
+
+class WyzeClipView(HomeAssistantView):
+    """Serve archived event clips to the media player."""
+
+    url = CLIP_URL + "/{entry_id}/{mac}/{name}"
+    name = f"api:{DOMAIN}:clips"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the view."""
+        self._hass = hass
+        self._root = Path(hass.config.path(ARCHIVE_DIR))
+
+    async def get(
+        self, request: web.Request, entry_id: str, mac: str, name: str
+    ) -> web.StreamResponse:
+        """Return an archived clip."""
+        if any(part.startswith(".") for part in (entry_id, mac, name)):
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        path = self._root / entry_id / mac / name
+        if not await self._hass.async_add_executor_job(path.is_file):
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        return web.FileResponse(path)
+
+
+def _tag_name(tag: int) -> str:
+    """Return a readable name for an AI tag."""
+    return AI_TAG_NAMES.get(tag, f"Tag {tag}")
+
+
+def _parse(identifier: str) -> tuple[str, dict[str, str]]:
+    """Split a folder identifier into the camera and its filters."""
+    camera, *rest = identifier.split("/")
+    if len(rest) % 2:
+        raise BrowseError(f"Unknown media identifier: {identifier}")
+    filters = dict(zip(rest[::2], rest[1::2], strict=True))
+    if not set(filters) <= {"tag", "day"}:
+        raise BrowseError(f"Unknown media identifier: {identifier}")
+    return camera, filters
+
+
+def _day_range(day: str) -> tuple[int, int]:
+    """Return the ``[start, end)`` timestamps (ms) of a local calendar day."""
+    try:
+        start = dt_util.start_of_local_day(date.fromisoformat(day))
+    except ValueError as err:
+        raise BrowseError(f"Invalid day: {day}") from err
+    end = dt_util.start_of_local_day(start.date() + timedelta(days=1))
+    return int(start.timestamp() * 1000), int(end.timestamp() * 1000)
+
+
+class WyzeMediaSource(MediaSource):
+    """Provide Wyze camera events as media sources."""
+
+    name = "Wyze"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the media source."""
+        super().__init__(DOMAIN)
+        self.hass = hass
+
+    async def async_resolve_media(self, item: MediaSourceItem) -> PlayMedia:
+        """Resolve an event to its video, or its screenshot if there is none."""
+        kind, _, event_id = (item.identifier or "").partition("/")
+        if kind != "event" or not event_id:
+            raise Unresolvable(f"Unknown media item: {item.identifier}")
+        index = await async_get_event_index(self.hass)
+        event = await self.hass.async_add_executor_job(index.get, event_id)
+        if event is None:
+            raise Unresolvable(f"Event {event_id} is no longer available")
+        root = Path(self.hass.config.path(ARCHIVE_DIR))
+        if event.video and (
+            clip := await self.hass.async_add_executor_job(
+                find_clip, root, event.mac, event.ts, event.event_id
+            )
+        ):
+            return PlayMedia(
+                f"{CLIP_URL}/{clip.relative_to(root).as_posix()}", "video/mp4"
+            )
+        screenshot, video = await self._async_fresh_urls(event)
+        if video:
+            return PlayMedia(video, "video/mp4")
+        if screenshot:
+            return PlayMedia(screenshot, "image/jpeg")
+        raise Unresolvable(f"Event {event_id} has no media")
+
+    async def _async_fresh_urls(
+        self, event: IndexedEvent
+    ) -> tuple[str | None, str | None]:
+        """Return the screenshot and video urls of ``event``, signed anew.
+
+        Falls back to the stored urls when the cloud no longer lists the
+        event; those have likely expired.
+        """
+        for entry_data in self.hass.data.get(DOMAIN, {}).values():
+            if not isinstance(entry_data, dict) or (
+                (pipeline := entry_data.get(EVENT_PIPELINE)) is None
+                or event.mac not in {camera.mac for camera in pipeline.cameras}
+            ):
+                continue
+            if fresh := await pipeline.async_fetch_event(event.event_id, event.ts):
+                return event_urls(fresh)
+            break
+        return event.screenshot, event.video
+
+    async def async_browse_media(self, item: MediaSourceItem) -> BrowseMediaSource:
+        """Return a folder of cameras, filters or events."""
+        if not item.identifier:
+            return await self._async_browse_root()
+        camera, filters = _parse(item.identifier)
+        return await self._async_browse_camera(item.identifier, camera, filters)
+
+    async def _async_browse_root(self) -> BrowseMediaSource:
+        """List the cameras with indexed events."""
+        index = await async_get_event_index(self.hass)
+        cameras = await self.hass.async_add_executor_job(index.cameras)
+        children = [_folder(ALL_CAMERAS, "All cameras")]
+        children.extend(
+            _folder(mac, f"{name or mac} ({count})") for mac, name, count in cameras
+        )
+        return _folder("", self.name, children)
+
+    async def _async_browse_camera(
+        self, identifier: str, camera: str, filters: dict[str, str]
+    ) -> BrowseMediaSource:
+        """List the filters and events of a camera folder."""
+        index = await async_get_event_index(self.hass)
+        mac = None if camera == ALL_CAMERAS else camera
+        try:
+            tag = int(filters["tag"]) if "tag" in filters else None
+        except ValueError as err:
+            raise BrowseError(f"Invalid tag: {filters['tag']}") from err
+        title = "All cameras"
+        if mac is not None:
+            latest = await self.hass.async_add_executor_job(
+                index.query, mac, None, None, None, 1
+            )
+            title = latest[0].name if latest and latest[0].name else mac
+        if tag is not None:
+            title = f"{title} - {_tag_name(tag)}"
+
+        children: list[BrowseMediaSource] = []
+        if "day" in filters:
+            start, end = _day_range(filters["day"])
+            title = f"{title} - {filters['day']}"
+            events = await self.hass.async_add_executor_job(
+                index.query, mac, start, end, tag, DAY_LIMIT
+            )
+        else:
+            if tag is None:
+                tags = await self.hass.async_add_executor_job(index.tags, mac)
+                children.extend(
+                    _folder(
+                        f"{identifier}/tag/{value}", f"{_tag_name(value)} ({count})"
+                    )
+                    for value, count in tags
+                )
+            days = await self.hass.async_add_executor_job(index.days, mac, tag)
+            for day in map(date.isoformat, days):
+                children.append(_folder(f"{identifier}/day/{day}", day))
+            events = await self.hass.async_add_executor_job(
+                index.query, mac, None, None, tag, RECENT_LIMIT
+            )
+
+        children.extend(_event_item(event, mac is None) for event in events)
+        return _folder(identifier, title, children)
+
+
+def _folder(
+    identifier: str, title: str, children: list[BrowseMediaSource] | None = None
+) -> BrowseMediaSource:
+    """Return a browsable folder."""
+    return BrowseMediaSource(
+        domain=DOMAIN,
+        identifier=identifier,
+        media_class=MediaClass.DIRECTORY,
+        media_content_type=MediaType.VIDEO,
+        children_media_class=MediaClass.VIDEO,
+        title=title,
+        can_play=False,
+        can_expand=True,
+        children=children,
+    )
+
+
+def _event_item(event: IndexedEvent, with_camera: bool) -> BrowseMediaSource:
+    """Return a playable event."""
+    when = dt_util.as_local(datetime.fromtimestamp(event.ts / 1000, dt_util.UTC))
+    title = when.strftime("%Y-%m-%d %H:%M:%S")
+    if event.tags:
+        title = f"{title} - {', '.join(_tag_name(tag) for tag in event.tags)}"
+    if with_camera:
+        title = f"{event.name or event.mac}: {title}"
+    return BrowseMediaSource(
+        domain=DOMAIN,
+        identifier=f"event/{event.event_id}",
+        media_class=MediaClass.VIDEO if event.video else MediaClass.IMAGE,
+        media_content_type=MediaType.VIDEO if event.video else MediaType.IMAGE,
+        title=title,
+        can_play=bool(event.video or event.screenshot),
+        can_expand=False,
+        thumbnail=event.screenshot,
+    )
@@ -10,8 +10,11 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers import device_registry as dr
 from wyzeapy import Wyzeapy
 from wyzeapy.services.irrigation_service import IrrigationService, Irrigation, Zone
+from wyzeapy.types import Device
 
+from .capabilities import is_irrigation
 from .const import DOMAIN, CONF_CLIENT
+from .discovery import async_register_device_adder
 from .token_manager import token_exception_handler
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,21 +31,23 @@ async def async_setup_entry(
     client: Wyzeapy = hass.data[DOMAIN][config_entry.entry_id][CONF_CLIENT]
     irrigation_service = await client.irrigation_service
 
-    # Get all irrigation devices
-    irrigation_devices = await irrigation_service.get_irrigations()
-
-    # Create a number entity for each zone in each irrigation device
-    entities = []
-    for device in irrigation_devices:
-        # Update the device to get its zones
-        device = await irrigation_service.update(device)
-        for zone in device.zones:
-            if zone.enabled:
-                entities.append(
-                    WyzeIrrigationQuickrunDuration(irrigation_service, device, zone)
-                )
-
-    async_add_entities(entities, True)
+    async def _async_add_devices(devices: List[Device]) -> None:
+        # Create a number entity for each zone in each irrigation device
+        entities = []
+        for device in devices:
+            if not is_irrigation(device):
+                continue
+            # Update the device to get its zones
+            device = await irrigation_service.update(Irrigation(device.raw_dict))
+            for zone in device.zones:
+                if zone.enabled:
+                    entities.append(
+                        WyzeIrrigationQuickrunDuration(irrigation_service, device, zone)
+                    )
+        async_add_entities(entities, True)
+
+    await _async_add_devices(await irrigation_service.get_irrigations())
+    async_register_device_adder(hass, config_entry, "number", _async_add_devices)
 
 
 class WyzeIrrigationQuickrunDuration(RestoreNumber):
@@ -2,7 +2,6 @@
 
 from collections.abc import Callable
 import datetime
-import json
 import logging
 from typing import Any
 
@@ -11,6 +10,7 @@ from wyzeapy.services.camera_service import Camera
 from wyzeapy.services.irrigation_service import Irrigation, IrrigationService, Zone
 from wyzeapy.services.lock_service import Lock
 from wyzeapy.services.switch_service import Switch, SwitchUsageService
+from wyzeapy.types import Device, DeviceTypes
 
 from homeassistant.components.sensor import (
     RestoreSensor,
@@ -24,31 +24,47 @@ from homeassistant.const import (
     PERCENTAGE,
     EntityCategory,
     UnitOfEnergy,
+    UnitOfTime,
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
-import homeassistant.helpers.entity_registry as er
-from homeassistant.helpers.event import (
-    async_track_state_change_event,
-    async_track_time_change,
-)
+from homeassistant.helpers.event import async_track_time_change
+from homeassistant.util import dt as dt_util
 
+from .capabilities import is_irrigation
 from .const import (
     CAMERA_UPDATED,
+    CAMERAS_WITH_BATTERIES,
     CONF_CLIENT,
     DOMAIN,
     LOCK_UPDATED,
+    OUTDOOR_PLUGS,
     RESET_BUTTON_PRESSED,
 )
+from .device_store import async_get_device_store
+from .discovery import async_register_device_adder
+from .energy import (
+    WyzePlugEnergyLedger,
+    async_deregister_energy_entity,
+    async_get_energy_ledger,
+    async_register_energy_updater,
+    energy_signal,
+    utc_hour,
+)
 from .irrigation import WyzeIrrigationEntity, WyzeIrrigationZoneEntity
+from .stream_stats import (
+    STAGE_ANSWER,
+    STAGES,
+    CameraStreamStats,
+    async_get_stream_statistics,
+    stream_stats_signal,
+)
 from .token_manager import token_exception_handler
 
 _LOGGER = logging.getLogger(__name__)
 ATTRIBUTION = "Data provided by Wyze"
-CAMERAS_WITH_BATTERIES = ["WVOD1", "HL_WCO2", "AN_RSCW", "GW_BE1"]
-OUTDOOR_PLUGS = ["WLPPO"]
 
 
 @token_exception_handler
@@ -67,67 +83,111 @@ async def async_setup_entry(
     _LOGGER.debug("""Creating new WyzeApi sensor component""")
     client: Wyzeapy = hass.data[DOMAIN][config_entry.entry_id][CONF_CLIENT]
 
-    # Get the list of locks so that we can create lock and keypad battery sensors
     lock_service = await client.lock_service
     camera_service = await client.camera_service
     switch_usage_service = await client.switch_usage_service
     irrigation_service = await client.irrigation_service
+    store = async_get_device_store(hass, config_entry.entry_id)
+    stream_stats = async_get_stream_statistics(hass, config_entry.entry_id)
+
+    async def _async_add_devices(devices: list[Device]) -> None:
+        sensors = []
+        # Lock and keypad battery sensors
+        for device in devices:
+            if device.type is DeviceTypes.LOCK:
+                lock = Lock(device.raw_dict)
+                sensors.append(
+                    WyzeLockBatterySensor(lock, WyzeLockBatterySensor.LOCK_BATTERY)
+                )
+                sensors.append(
+                    WyzeLockBatterySensor(lock, WyzeLockBatterySensor.KEYPAD_BATTERY)
+                )
 
-    locks = await lock_service.get_locks()
-    sensors = []
-    for lock in locks:
-        sensors.append(WyzeLockBatterySensor(lock, WyzeLockBatterySensor.LOCK_BATTERY))
-        sensors.append(
-            WyzeLockBatterySensor(lock, WyzeLockBatterySensor.KEYPAD_BATTERY)
-        )
-
-    cameras = await camera_service.get_cameras()
-    sensors.extend(
-        [
-            WyzeCameraBatterySensor(camera)
-            for camera in cameras
-            if camera.product_model in CAMERAS_WITH_BATTERIES
+        cameras = [
+            store.device(Camera(device.raw_dict))
+            for device in devices
+            if device.type is DeviceTypes.CAMERA
         ]
-    )
-
-    plugs = await switch_usage_service.get_switches()
-    for plug in plugs:
-        if plug.product_model in OUTDOOR_PLUGS:
-            sensors.append(WyzePlugEnergySensor(plug, switch_usage_service))
-            sensors.append(WyzePlugDailyEnergySensor(plug))
-
-    # Get all irrigation devices
-    irrigation_devices = await irrigation_service.get_irrigations()
-
-    # Create sensor entities for each irrigation device
-    for device in irrigation_devices:
-        # Update the device to get its properties
-        device = await irrigation_service.update(device)
-        # Diagnostic + status sensors (device level)
         sensors.extend(
             [
-                WyzeIrrigationRSSI(irrigation_service, device),
-                WyzeIrrigationIP(irrigation_service, device),
-                WyzeIrrigationSSID(irrigation_service, device),
-                WyzeIrrigationCurrentZone(irrigation_service, device),
-                WyzeIrrigationNextScheduledRun(irrigation_service, device),
-                WyzeIrrigationActiveSchedules(irrigation_service, device),
-                WyzeIrrigationLastRunDuration(irrigation_service, device),
+                WyzeCameraBatterySensor(camera)
+                for camera in cameras
+                if camera.product_model in CAMERAS_WITH_BATTERIES
             ]
         )
-        # Per-zone status sensors
-        for zone in device.zones:
-            if zone.enabled:
+        sensors.extend(
+            WyzeCameraStreamStartSensor(camera, stream_stats.camera(camera.mac))
+            for camera in cameras
+        )
+
+        for device in devices:
+            if (
+                device.type in (DeviceTypes.PLUG, DeviceTypes.OUTDOOR_PLUG)
+                and device.product_model in OUTDOOR_PLUGS
+            ):
+                plug = Switch(device.raw_dict)
+                ledger = await async_get_energy_ledger(hass, plug)
+                sensors.append(WyzePlugEnergySensor(plug, switch_usage_service, ledger))
                 sensors.extend(
-                    [
-                        WyzeIrrigationZoneSmartDuration(irrigation_service, device, zone),
-                        WyzeIrrigationZoneRemainingTime(irrigation_service, device, zone),
-                        WyzeIrrigationZoneLastWatered(irrigation_service, device, zone),
-                        WyzeIrrigationZoneSoilMoisture(irrigation_service, device, zone),
-                    ]
+                    WyzePlugPeriodEnergySensor(
+                        plug, switch_usage_service, ledger, period
+                    )
+                    for period in (
+                        WyzePlugPeriodEnergySensor.DAILY,
+                        WyzePlugPeriodEnergySensor.WEEKLY,
+                        WyzePlugPeriodEnergySensor.MONTHLY,
+                    )
                 )
 
-    async_add_entities(sensors, True)
+        # Create sensor entities for each irrigation device
+        for device in devices:
+            if not is_irrigation(device):
+                continue
+            # Update the device to get its properties
+            device = await irrigation_service.update(Irrigation(device.raw_dict))
+            # Diagnostic + status sensors (device level)
+            sensors.extend(
+                [
+                    WyzeIrrigationRSSI(irrigation_service, device),
+                    WyzeIrrigationIP(irrigation_service, device),
+                    WyzeIrrigationSSID(irrigation_service, device),
+                    WyzeIrrigationCurrentZone(irrigation_service, device),
+                    WyzeIrrigationNextScheduledRun(irrigation_service, device),
+                    WyzeIrrigationActiveSchedules(irrigation_service, device),
+                    WyzeIrrigationLastRunDuration(irrigation_service, device),
+                ]
+            )
+            # Per-zone status sensors
+            for zone in device.zones:
+                if zone.enabled:
+                    sensors.extend(
+                        [
+                            WyzeIrrigationZoneSmartDuration(
+                                irrigation_service, device, zone
+                            ),
+                            WyzeIrrigationZoneRemainingTime(
+                                irrigation_service, device, zone
+                            ),
+                            WyzeIrrigationZoneLastWatered(
+                                irrigation_service, device, zone
+                            ),
+                            WyzeIrrigationZoneSoilMoisture(
+                                irrigation_service, device, zone
+                            ),
+                        ]
+                    )
+
+        async_add_entities(sensors, True)
+
+    await _async_add_devices(
+        [
+            *await lock_service.get_locks(),
+            *await camera_service.get_cameras(),
+            *await switch_usage_service.get_switches(),
+            *await irrigation_service.get_irrigations(),
+        ]
+    )
+    async_register_device_adder(hass, config_entry, "sensor", _async_add_devices)
 
 
 class WyzeLockBatterySensor(SensorEntity):
@@ -310,6 +370,57 @@ class WyzeCameraBatterySensor(SensorEntity):
         return self._camera.device_params.get("electricity")
 
 
+class WyzeCameraStreamStartSensor(SensorEntity):
+    """Median time until a camera answers a stream request."""
+
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_native_unit_of_measurement = UnitOfTime.SECONDS
+    _attr_should_poll = False
+    _attr_suggested_display_precision = 2
+
+    def __init__(self, camera: Camera, stats: CameraStreamStats) -> None:
+        """Initialize the sensor."""
+        self._camera = camera
+        self._stats = stats
+        self._attr_name = f"{camera.nickname} Stream Start Time"
+        self._attr_unique_id = f"{camera.mac}.stream_start_time"
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, camera.mac)})
+
+    async def async_added_to_hass(self) -> None:
+        """Add listener on startup."""
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                stream_stats_signal(self._camera.mac),
+                self.async_write_ha_state,
+            )
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the median time to the SDP answer."""
+        return self._stats.stage_percentiles(STAGE_ANSWER)["p50"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the per-stage percentiles and failure counts."""
+        attributes: dict[str, Any] = {
+            ATTR_ATTRIBUTION: ATTRIBUTION,
+            "attempts": self._stats.attempts,
+            "failures": dict(self._stats.failures),
+        }
+        for stage in STAGES:
+            for name, value in self._stats.stage_percentiles(stage).items():
+                attributes[f"{stage}_{name}"] = (
+                    round(value, 3) if value is not None else None
+                )
+        if (last := self._stats.last) is not None:
+            attributes["last_start"] = last.as_dict()
+        return attributes
+
+
 class WyzePlugEnergySensor(RestoreSensor):
     """Respresents an Outdoor Plug Total Energy Sensor."""
 
@@ -319,20 +430,17 @@ class WyzePlugEnergySensor(RestoreSensor):
     _attr_suggested_display_precision = 3
     _attr_should_poll = False
     _attr_name = "Total Energy Usage"
-    _previous_hour = None
-    _previous_value = None
-    _past_hours_previous_value = None
-    _current_value = 0
-    _past_hours_value = 0
-    _hourly_energy_usage_added = 0
 
     def __init__(
-        self, switch: Switch, switch_usage_service: SwitchUsageService
+        self,
+        switch: Switch,
+        switch_usage_service: SwitchUsageService,
+        ledger: WyzePlugEnergyLedger,
     ) -> None:
         """Initialize an energy sensor."""
         self._switch = switch
         self._switch_usage_service = switch_usage_service
-        self._switch.usage_history = None  # type: ignore[attr-defined]
+        self._ledger = ledger
 
     @property
     def unique_id(self):
@@ -347,97 +455,39 @@ class WyzePlugEnergySensor(RestoreSensor):
             "name": self._switch.nickname,
         }
 
-    def update_energy(self):
-        """Update the energy sensor."""
-        _now = int(datetime.datetime.now(datetime.UTC).hour)
-        self._hourly_energy_usage_added = 0
-
-        if (
-            self._switch.usage_history and len(self._switch.usage_history) > 0
-        ):  # Confirm there is data
-            _raw_data = self._switch.usage_history
-            _LOGGER.debug(_raw_data)
-            _current_day_list = json.loads(_raw_data[0]["data"])
-            if _now == 0:  # Handle rolling to the next UTC day
-                self._past_hours_value = _current_day_list[23] / 1000
-                if len(_raw_data) > 1:  # New Day's value
-                    _next_day_list = json.loads(_raw_data[1]["data"])
-                    self._current_value = _next_day_list[_now] / 1000
-                else:
-                    self._current_value = 0
-            else:
-                self._past_hours_value = _current_day_list[_now - 1] / 1000
-                self._current_value = _current_day_list[_now] / 1000
-
-            # Set inital values to current values on startup.
-            # Has to be done after we check for current or next UTC day
-            if self._previous_hour is None:
-                self._previous_hour = _now
-            if self._past_hours_previous_value is None:
-                self._past_hours_previous_value = self._past_hours_value
-            if self._previous_value is None:
-                self._previous_value = self._current_value
-
-            if _now != self._previous_hour:  # New Hour
-                if self._past_hours_value > self._previous_value:
-                    self._hourly_energy_usage_added = (
-                        self._past_hours_value - self._previous_value
-                    )
-                self._hourly_energy_usage_added += self._current_value
-                self._previous_value = self._current_value
-                self._previous_hour = _now
-                self._past_hours_previous_value = self._past_hours_value
-
-            else:  # Current Hour
-                if self._current_value > self._previous_value:
-                    self._hourly_energy_usage_added += round(
-                        self._current_value - self._previous_value, 3
-                    )
-                    self._previous_value = self._current_value
-
-                if self._past_hours_value > self._past_hours_previous_value:
-                    self._hourly_energy_usage_added += round(
-                        self._past_hours_value - self._past_hours_previous_value, 3
-                    )
-                    self._past_hours_previous_value = self._past_hours_value
-
-            _LOGGER.debug(
-                "Total Value Added to device %s is %s",
-                self._switch.mac,
-                self._hourly_energy_usage_added,
-            )
-
-        return self._hourly_energy_usage_added
+    @property
+    def native_value(self) -> float:
+        """Return the running energy total from the ledger."""
+        return self._ledger.total
 
     @callback
-    def async_update_callback(self, switch: Switch):
+    def async_update_callback(self, ledger: WyzePlugEnergyLedger) -> None:
         """Update the sensor's state."""
-        self._switch = switch
-        self.update_energy()
-        self._attr_native_value += self._hourly_energy_usage_added
         self.async_write_ha_state()
 
     @callback
     def reset_energy_use(self, switch: Switch):
         """Reset the Energy Usage."""
         _LOGGER.debug("Resetting Usage of %s to 0", self._switch.nickname)
-        self._switch = switch
-        self._attr_native_value = 0
+        self._ledger.async_reset_total()
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
-        """Register Updater for the sensor and get previous data."""
-        state = await self.async_get_last_sensor_data()
-        if state:
-            self._attr_native_value = state.native_value
-        else:
-            self._attr_native_value = 0
-        self._switch.callback_function = self.async_update_callback
-        self._switch_usage_service.register_updater(
-            self._switch, 120
-        )  # Every 2 minutes seems to work fine, probably could be longer
-        await self._switch_usage_service.start_update_manager()
+        """Register Updater for the sensor."""
+        if not self._ledger.restored:
+            # One-time migration of the total kept by earlier versions in the
+            # restore state; from now on the ledger store is authoritative.
+            state = await self.async_get_last_sensor_data()
+            if state and state.native_value is not None:
+                self._ledger.async_seed_total(float(state.native_value))
 
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                energy_signal(self._switch.mac),
+                self.async_update_callback,
+            )
+        )
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
@@ -445,34 +495,52 @@ class WyzePlugEnergySensor(RestoreSensor):
                 self.reset_energy_use,
             )
         )
+        await async_register_energy_updater(
+            self.hass, self._switch_usage_service, self._switch
+        )
 
     async def async_will_remove_from_hass(self) -> None:
         """Remove updater."""
-        self._switch_usage_service.unregister_updater(self._switch)
+        async_deregister_energy_entity(self.hass, self._switch)
+
+
+class WyzePlugPeriodEnergySensor(SensorEntity):
+    """Represents an Outdoor Plug energy sensor for a calendar period.
 
+    The value is summed straight from the hourly readings in the plug's energy
+    ledger for the current local day, week or month.
+    """
 
-class WyzePlugDailyEnergySensor(RestoreSensor):
-    """Respresents an Outdoor Plug Daily Energy Sensor."""
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
 
     _attr_device_class = SensorDeviceClass.ENERGY
     _attr_native_unit_of_measurement = UnitOfEnergy.KILO_WATT_HOUR
     _attr_state_class = SensorStateClass.TOTAL_INCREASING
     _attr_suggested_display_precision = 3
-    _attr_name = "Daily Energy Usage"
+    _attr_should_poll = False
 
-    def __init__(self, switch: Switch) -> None:
-        """Initialize a daily energy sensor."""
+    def __init__(
+        self,
+        switch: Switch,
+        switch_usage_service: SwitchUsageService,
+        ledger: WyzePlugEnergyLedger,
+        period: str,
+    ) -> None:
+        """Initialize a period energy sensor."""
         self._switch = switch
+        self._switch_usage_service = switch_usage_service
+        self._ledger = ledger
+        self._period = period
+        self._attr_name = f"{period.title()} Energy Usage"
+        # Only the daily sensor existed before; keep the others opt-in.
+        self._attr_entity_registry_enabled_default = period == self.DAILY
 
     @property
     def unique_id(self):
         """Get the unique ID of the sensor."""
-        return f"{self._switch.nickname}.daily_energy-{self._switch.mac}"
-
-    @property
-    def should_poll(self) -> bool:
-        """No polling needed."""
-        return False
+        return f"{self._switch.nickname}.{self._period}_energy-{self._switch.mac}"
 
     @property
     def device_info(self):
@@ -482,51 +550,58 @@ class WyzePlugDailyEnergySensor(RestoreSensor):
             "name": self._switch.nickname,
         }
 
-    @callback
-    def _update_daily_sensor(self, event):
-        """Update the sensor when the total sensor updates."""
-        event_data = event.data
-        new_state = event_data["new_state"]
-        old_state = event_data["old_state"]
+    def _period_start(self, now: datetime.datetime) -> datetime.datetime:
+        """Return the local start of the period containing ``now``."""
+        today = dt_util.as_local(now).date()
+        if self._period == self.WEEKLY:
+            return dt_util.start_of_local_day(
+                today - datetime.timedelta(days=today.weekday())
+            )
+        if self._period == self.MONTHLY:
+            return dt_util.start_of_local_day(today.replace(day=1))
+        return dt_util.start_of_local_day(today)
 
-        if not old_state or not new_state:
-            return
+    @property
+    def native_value(self) -> float:
+        """Return the energy used so far in the current period."""
+        now = dt_util.utcnow()
+        start = utc_hour(self._period_start(now).timestamp())
+        return round(self._ledger.sum_range(start, utc_hour(now.timestamp()) + 1), 3)
 
-        updated_energy = float(new_state.state) - float(old_state.state)
-        self._attr_native_value += updated_energy
+    @callback
+    def _handle_energy_update(self, ledger: WyzePlugEnergyLedger) -> None:
+        """Recompute the period total after the ledger changed."""
         self.async_write_ha_state()
 
-    async def _async_reset_at_midnight(self, now: datetime) -> None:
-        """Reset the daily sensor."""
-        self._attr_native_value = 0
-        _LOGGER.debug("Resetting daily energy sensor %s to 0", self._switch.mac)
+    @callback
+    def _handle_period_rollover(self, now: datetime.datetime) -> None:
+        """Start the new period at local midnight."""
+        _LOGGER.debug(
+            "Starting new %s energy period for %s", self._period, self._switch.mac
+        )
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
-        """Get previous data and add listeners."""
-
-        state = await self.async_get_last_sensor_data()
-        if state:
-            self._attr_native_value = state.native_value
-        else:
-            self._attr_native_value = 0
-
-        registry = er.async_get(self.hass)
-        entity_id_total_sensor = registry.async_get_entity_id(
-            "sensor", DOMAIN, f"{self._switch.nickname}.energy-{self._switch.mac}"
-        )
-
+        """Add listeners."""
         self.async_on_remove(
-            async_track_state_change_event(
-                self.hass, [entity_id_total_sensor], self._update_daily_sensor
+            async_dispatcher_connect(
+                self.hass,
+                energy_signal(self._switch.mac),
+                self._handle_energy_update,
             )
         )
-
         self.async_on_remove(
             async_track_time_change(
-                self.hass, self._async_reset_at_midnight, hour=0, minute=0, second=0
+                self.hass, self._handle_period_rollover, hour=0, minute=0, second=0
             )
         )
+        await async_register_energy_updater(
+            self.hass, self._switch_usage_service, self._switch
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove updater."""
+        async_deregister_energy_entity(self.hass, self._switch)
 
 
 class WyzeIrrigationBaseSensor(WyzeIrrigationEntity, SensorEntity):
@@ -845,9 +920,18 @@ class WyzeIrrigationZoneSoilMoisture(WyzeIrrigationZoneSensor):
         """Expose the zone's smart-watering characteristics where available."""
         attrs = {}
         for key in (
-            "crop_type", "soil_type", "nozzle_type", "exposure_type", "slope_type",
-            "flow_rate", "efficiency", "root_depth", "available_water_capacity",
-            "number_of_sprinkler_heads", "area", "wired",
+            "crop_type",
+            "soil_type",
+            "nozzle_type",
+            "exposure_type",
+            "slope_type",
+            "flow_rate",
+            "efficiency",
+            "root_depth",
+            "available_water_capacity",
+            "number_of_sprinkler_heads",
+            "area",
+            "wired",
         ):
             value = getattr(self._zone, key, None)
             if value is not None:
@@ -9,6 +9,7 @@ from aiohttp.client_exceptions import ClientConnectionError
 from wyzeapy import CameraService, Wyzeapy
 from wyzeapy.services.camera_service import Camera
 from wyzeapy.exceptions import AccessTokenError, ParameterError, UnknownApiError
+from wyzeapy.types import Device, DeviceTypes
 
 from homeassistant.components.siren import (
     SirenEntity,
@@ -19,7 +20,9 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
-from .const import CAMERA_UPDATED, CONF_CLIENT, DOMAIN
+from .const import CAMERA_UPDATED, CONF_CLIENT, DOMAIN, SIREN_UNSUPPORTED
+from .device_store import async_get_device_store
+from .discovery import async_register_device_adder
 from .token_manager import token_exception_handler
 
 _LOGGER = logging.getLogger(__name__)
@@ -44,13 +47,19 @@ async def async_setup_entry(
     _LOGGER.debug("""Creating new WyzeApi siren component""")
     client: Wyzeapy = hass.data[DOMAIN][config_entry.entry_id][CONF_CLIENT]
     camera_service = await client.camera_service
-    sirens = []
-    for camera in await camera_service.get_cameras():
-        # The campan v1, v2 camera, and video doorbell pro don't have sirens
-        if camera.product_model not in ["WYZECP1_JEF", "WYZEC1-JZ", "GW_BE1"]:
-            sirens.append(WyzeCameraSiren(camera, camera_service))
-
-    async_add_entities(sirens, True)
+    store = async_get_device_store(hass, config_entry.entry_id)
+
+    async def _async_add_devices(devices: list[Device]) -> None:
+        sirens = [
+            WyzeCameraSiren(store.device(Camera(device.raw_dict)), camera_service)
+            for device in devices
+            if device.type is DeviceTypes.CAMERA
+            and device.product_model not in SIREN_UNSUPPORTED
+        ]
+        async_add_entities(sirens, True)
+
+    await _async_add_devices(await camera_service.get_cameras())
+    async_register_device_adder(hass, config_entry, "siren", _async_add_devices)
 
 
 class WyzeCameraSiren(SirenEntity):
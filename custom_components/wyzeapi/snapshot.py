@@ -0,0 +1,410 @@
+"""Camera still images backed by an in-memory LRU byte cache.
+
+Wyze does not offer an on-demand snapshot endpoint, but every camera carries a
+cloud thumbnail (``device_params["camera_thumbnails"]``) and every event has a
+screenshot in its ``file_list``. Stills are served from whichever of the two is
+newest, keyed by ``(mac, timestamp)``, so the same image is only downloaded once
+no matter how many dashboards or notifications ask for it.
+
+Entries are evicted least-recently-used once the cache exceeds its byte budget.
+Scaled variants requested with ``width``/``height`` are produced in the executor
+and cached alongside the original, a few sizes per still.
+
+Dashboards tend to ask for every camera at once, so a
+:class:`WyzeSnapshotPrefetcher` per entry keeps the cache warm in the
+background: on a rolling schedule it revalidates the still of every camera that
+is on and available, a few at a time, and entities then answer straight from
+the cache.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import timedelta
+import logging
+import time
+from typing import Any
+
+from aiohttp import ClientError, ClientTimeout
+from wyzeapy.services.camera_service import Camera
+from wyzeapy.types import Event
+
+from homeassistant.components.camera import Image
+from homeassistant.components.camera.img_util import scale_jpeg_camera_image
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Keys under hass.data[DOMAIN][entry_id] holding the entry's snapshot cache
+# and thumbnail prefetcher.
+SNAPSHOT_CACHE = "snapshot_cache"
+SNAPSHOT_PREFETCHER = "snapshot_prefetcher"
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+# Images larger than this are served but never cached.
+MAX_IMAGE_BYTES = 4 * 1024 * 1024
+# Scaled variants kept per still; the oldest is dropped for a new size.
+MAX_SCALED_VARIANTS = 4
+# Cached images older than this are revalidated with a conditional request.
+REVALIDATE_AFTER = 300
+FETCH_TIMEOUT = ClientTimeout(total=10)
+PREFETCH_INTERVAL = timedelta(seconds=30)
+# Number of stills downloaded concurrently by the prefetcher.
+PREFETCH_CONCURRENCY = 3
+
+SnapshotKey = tuple[str, int]
+SnapshotSource = Callable[[], tuple[Camera, Event | None]]
+
+
+@dataclass(slots=True)
+class CachedImage:
+    """A downloaded still and its scaled variants."""
+
+    content: bytes
+    content_type: str
+    etag: str | None
+    last_modified: str | None
+    fetched: float
+    scaled: dict[tuple[int | None, int | None], bytes] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes held by this entry."""
+        return len(self.content) + sum(len(image) for image in self.scaled.values())
+
+
+def snapshot_source(
+    camera: Camera, event: Event | None = None
+) -> tuple[str, int] | None:
+    """Return the newest ``(url, timestamp)`` still available for ``camera``."""
+    candidates: list[tuple[int, str]] = []
+
+    for candidate in (event, getattr(camera, "last_event", None)):
+        if candidate is None:
+            continue
+        for resource in getattr(candidate, "file_list", None) or []:
+            if resource.get("type") == 1 and resource.get("url"):
+                candidates.append((int(candidate.event_ts), resource["url"]))
+                break
+
+    thumbnails: dict[str, Any] = (camera.device_params or {}).get(
+        "camera_thumbnails"
+    ) or {}
+    if thumbnails.get("thumbnails_url"):
+        candidates.append(
+            (int(thumbnails.get("thumbnails_ts") or 0), thumbnails["thumbnails_url"])
+        )
+
+    if not candidates:
+        return None
+    timestamp, url = max(candidates, key=lambda candidate: candidate[0])
+    return url, timestamp
+
+
+class WyzeSnapshotCache:
+    """LRU cache of camera stills keyed by ``(mac, timestamp)``."""
+
+    def __init__(self, hass: HomeAssistant, max_bytes: int = MAX_CACHE_BYTES) -> None:
+        """Initialize the cache."""
+        self._hass = hass
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[SnapshotKey, CachedImage] = OrderedDict()
+        self._bytes = 0
+        # Downloads in flight, shared by concurrent requests for the same still
+        self._pending: dict[SnapshotKey, asyncio.Task[CachedImage | None]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+        self.fetch_errors = 0
+        self.fetch_time = 0.0
+        self.last_fetch_time = 0.0
+
+    @property
+    def size(self) -> int:
+        """Return the number of bytes currently cached."""
+        return self._bytes
+
+    def __len__(self) -> int:
+        """Return the number of cached stills."""
+        return len(self._entries)
+
+    def stats(self) -> dict[str, Any]:
+        """Return the cache counters."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "fetches": self.fetches,
+            "fetch_errors": self.fetch_errors,
+            "average_fetch_time": (
+                self.fetch_time / self.fetches if self.fetches else None
+            ),
+            "last_fetch_time": self.last_fetch_time,
+        }
+
+    def peek(self, mac: str, timestamp: int) -> CachedImage | None:
+        """Return the cached still for ``(mac, timestamp)`` without fetching."""
+        return self._entries.get((mac, timestamp))
+
+    def _store(self, key: SnapshotKey, entry: CachedImage) -> None:
+        """Insert or replace ``key`` and evict until within budget."""
+        if (previous := self._entries.pop(key, None)) is not None:
+            self._bytes -= previous.size
+        if entry.size > MAX_IMAGE_BYTES:
+            return
+        self._entries[key] = entry
+        self._bytes += entry.size
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop least recently used stills until within budget."""
+        while self._bytes > self._max_bytes and self._entries:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+
+    def _store_scaled(
+        self,
+        key: SnapshotKey,
+        entry: CachedImage,
+        size: tuple[int | None, int | None],
+        scaled: bytes,
+    ) -> None:
+        """Cache a scaled variant of ``entry`` and evict until within budget."""
+        if self._entries.get(key) is not entry:
+            return
+        while len(entry.scaled) >= MAX_SCALED_VARIANTS:
+            oldest = next(iter(entry.scaled))
+            self._bytes -= len(entry.scaled.pop(oldest))
+        entry.scaled[size] = scaled
+        self._bytes += len(scaled)
+        self._evict()
+
+    def _evict_older(self, mac: str, timestamp: int) -> None:
+        """Drop stills of ``mac`` superseded by ``timestamp``."""
+        stale = [key for key in self._entries if key[0] == mac and key[1] < timestamp]
+        for key in stale:
+            self._bytes -= self._entries.pop(key).size
+
+    async def _async_fetch(
+        self, url: str, previous: CachedImage | None
+    ) -> CachedImage | None:
+        """Download ``url``, revalidating ``previous`` when given."""
+        headers = {}
+        if previous is not None:
+            if previous.etag:
+                headers["If-None-Match"] = previous.etag
+            if previous.last_modified:
+                headers["If-Modified-Since"] = previous.last_modified
+        session = async_get_clientsession(self._hass)
+        started = time.monotonic()
+        self.fetches += 1
+        try:
+            async with session.get(
+                url, headers=headers, timeout=FETCH_TIMEOUT
+            ) as response:
+                if response.status == 304 and previous is not None:
+                    previous.fetched = time.monotonic()
+                    return previous
+                response.raise_for_status()
+                content = await response.read()
+                return CachedImage(
+                    content=content,
+                    content_type=response.content_type or "image/jpeg",
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    fetched=time.monotonic(),
+                )
+        except (ClientError, TimeoutError) as err:
+            self.fetch_errors += 1
+            _LOGGER.debug("Unable to fetch camera still %s: %s", url, err)
+            return previous
+        finally:
+            self.last_fetch_time = time.monotonic() - started
+            self.fetch_time += self.last_fetch_time
+
+    async def async_get(
+        self,
+        mac: str,
+        url: str,
+        timestamp: int,
+        max_age: float | None = REVALIDATE_AFTER,
+    ) -> CachedImage | None:
+        """Return the still for ``(mac, timestamp)``, downloading it if needed.
+
+        A cached still older than ``max_age`` seconds is revalidated first;
+        ``None`` serves any cached still as is.
+        """
+        key = (mac, timestamp)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            if max_age is None or time.monotonic() - entry.fetched < max_age:
+                return entry
+        else:
+            self.misses += 1
+
+        if (pending := self._pending.get(key)) is None:
+            # The download runs in its own task, so a requester that is
+            # cancelled or times out doesn't fail the others waiting for it
+            pending = self._hass.async_create_background_task(
+                self._async_fetch_and_store(key, url, entry),
+                f"{DOMAIN} snapshot {mac}",
+            )
+            self._pending[key] = pending
+            pending.add_done_callback(lambda _: self._pending.pop(key, None))
+        return await asyncio.shield(pending)
+
+    async def _async_fetch_and_store(
+        self, key: SnapshotKey, url: str, entry: CachedImage | None
+    ) -> CachedImage | None:
+        """Download the still for ``key`` and cache it."""
+        fetched = await self._async_fetch(url, entry)
+        if fetched is not None and fetched is not entry:
+            self._evict_older(*key)
+            self._store(key, fetched)
+        return fetched
+
+    async def async_get_image(
+        self,
+        mac: str,
+        url: str,
+        timestamp: int,
+        width: int | None = None,
+        height: int | None = None,
+        max_age: float | None = REVALIDATE_AFTER,
+    ) -> bytes | None:
+        """Return the still for ``(mac, timestamp)`` scaled to fit the request."""
+        entry = await self.async_get(mac, url, timestamp, max_age)
+        if entry is None:
+            return None
+        if (width is None and height is None) or entry.content_type != "image/jpeg":
+            return entry.content
+
+        size = (width, height)
+        if (scaled := entry.scaled.get(size)) is None:
+            scaled = await self._hass.async_add_executor_job(
+                scale_jpeg_camera_image,
+                Image(entry.content_type, entry.content),
+                width,
+                height,
+            )
+            self._store_scaled((mac, timestamp), entry, size, scaled)
+        return scaled
+
+
+class WyzeSnapshotPrefetcher:
+    """Keeps the stills of one entry's cameras warm in the background."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        cache: WyzeSnapshotCache,
+        ttl: float = REVALIDATE_AFTER,
+        concurrency: int = PREFETCH_CONCURRENCY,
+    ) -> None:
+        """Initialize the prefetcher."""
+        self._hass = hass
+        self._cache = cache
+        self._ttl = ttl
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._sources: dict[str, SnapshotSource] = {}
+        # Monotonic time of the last prefetch per camera
+        self._fetched: dict[str, float] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._unsub_interval: CALLBACK_TYPE | None = None
+        self.prefetches = 0
+        self.skipped = 0
+
+    @property
+    def active(self) -> bool:
+        """Return True while cameras are being prefetched."""
+        return self._unsub_interval is not None
+
+    def stats(self) -> dict[str, Any]:
+        """Return the prefetch counters."""
+        return {
+            "cameras": len(self._sources),
+            "prefetches": self.prefetches,
+            "skipped": self.skipped,
+        }
+
+    @callback
+    def async_add_camera(self, mac: str, source: SnapshotSource) -> CALLBACK_TYPE:
+        """Start prefetching the camera returned by ``source``.
+
+        Returns a callback that stops prefetching it again.
+        """
+        self._sources[mac] = source
+        if self._unsub_interval is None:
+            self._unsub_interval = async_track_time_interval(
+                self._hass,
+                self._async_tick,
+                PREFETCH_INTERVAL,
+                name=f"{DOMAIN} thumbnail prefetch",
+                cancel_on_shutdown=True,
+            )
+        self.async_request(mac)
+
+        @callback
+        def _remove() -> None:
+            self._sources.pop(mac, None)
+            self._fetched.pop(mac, None)
+            if not self._sources:
+                self.async_stop()
+
+        return _remove
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop prefetching and cancel downloads in flight."""
+        if self._unsub_interval is not None:
+            self._unsub_interval()
+            self._unsub_interval = None
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    @callback
+    def async_request(self, mac: str) -> None:
+        """Prefetch ``mac`` now, e.g. after it reported a new event."""
+        self._fetched.pop(mac, None)
+        self._async_schedule(mac)
+
+    @callback
+    def _async_tick(self, now=None) -> None:
+        """Schedule every camera whose still is due."""
+        deadline = time.monotonic() - self._ttl
+        for mac in self._sources:
+            if self._fetched.get(mac, 0.0) <= deadline:
+                self._async_schedule(mac)
+
+    @callback
+    def _async_schedule(self, mac: str) -> None:
+        """Start a background prefetch of ``mac``."""
+        if (source := self._sources.get(mac)) is None:
+            return
+        camera, event = source()
+        if not camera.on or not camera.available:
+            self.skipped += 1
+            return
+        if (still := snapshot_source(camera, event)) is None:
+            return
+        # Claim the slot so the next tick does not schedule it twice
+        self._fetched[mac] = time.monotonic()
+        task = self._hass.async_create_background_task(
+            self._async_prefetch(mac, *still), f"{DOMAIN} prefetch {mac}"
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _async_prefetch(self, mac: str, url: str, timestamp: int) -> None:
+        """Download or revalidate one still."""
+        async with self._semaphore:
+            self.prefetches += 1
+            await self._cache.async_get(mac, url, timestamp, self._ttl)
@@ -0,0 +1,183 @@
+"""Timing of WebRTC stream starts.
+
+Starting a Wyze stream goes through several round trips: fetching the stream
+info (signaling url and ICE servers) from the Wyze cloud, connecting to the
+Kinesis signaling channel, sending the SDP offer, receiving the answer and the
+camera's first ICE candidate. Every session records when each stage completed
+in a :class:`StreamStartTrace`; finished traces are kept per camera so rolling
+percentiles per stage and failure counts can be reported through the
+diagnostics download and the (disabled by default) diagnostic sensors.
+"""
+
+from collections import Counter, deque
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import DOMAIN, STREAM_STATS_UPDATED
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key under hass.data[DOMAIN][entry_id] holding the entry's statistics.
+STREAM_STATS = "stream_stats"
+# Number of finished stream starts kept per camera.
+HISTORY_SIZE = 50
+PERCENTILES = (50, 90, 95)
+
+# Stages in the order they normally complete.
+STAGE_STREAM_INFO = "stream_info"
+STAGE_SIGNALING_CONNECTED = "signaling_connected"
+STAGE_OFFER_SENT = "offer_sent"
+STAGE_ANSWER = "answer"
+STAGE_FIRST_CANDIDATE = "first_candidate"
+STAGE_CLOSED = "closed"
+STAGES = (
+    STAGE_STREAM_INFO,
+    STAGE_SIGNALING_CONNECTED,
+    STAGE_OFFER_SENT,
+    STAGE_ANSWER,
+    STAGE_FIRST_CANDIDATE,
+    STAGE_CLOSED,
+)
+
+
+def stream_stats_signal(mac: str) -> str:
+    """Return the per-camera dispatcher signal name."""
+    return f"{STREAM_STATS_UPDATED}-{mac}"
+
+
+def percentile(values: list[float], pct: int) -> float | None:
+    """Return the nearest-rank percentile of ``values``."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(0, -(-pct * len(ordered) // 100) - 1)
+    return ordered[rank]
+
+
+class StreamStartTrace:
+    """Stage timings of a single stream start."""
+
+    __slots__ = ("_stats", "failure", "session_id", "stages", "started")
+
+    def __init__(self, stats: "CameraStreamStats", session_id: str) -> None:
+        """Start timing a session."""
+        self._stats = stats
+        self.session_id = session_id
+        self.started = time.monotonic()
+        # Seconds since ``started`` at which each stage completed
+        self.stages: dict[str, float] = {}
+        self.failure: str | None = None
+
+    def mark(self, stage: str) -> float:
+        """Record ``stage`` as completed (first time only) and return its time."""
+        if stage not in self.stages:
+            self.stages[stage] = time.monotonic() - self.started
+            _LOGGER.debug(
+                "Stream %s reached %s after %.3fs",
+                self.session_id,
+                stage,
+                self.stages[stage],
+            )
+        return self.stages[stage]
+
+    def fail(self, reason: str) -> None:
+        """Record why the stream start failed; the first reason wins."""
+        if self.failure is None:
+            self.failure = reason
+
+    @callback
+    def async_finish(self) -> None:
+        """Close the trace and hand it to the camera's statistics."""
+        if STAGE_CLOSED in self.stages:
+            return
+        self.mark(STAGE_CLOSED)
+        if self.failure is None and STAGE_ANSWER not in self.stages:
+            self.failure = "no_answer"
+        self._stats.async_record(self)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trace for diagnostics."""
+        return {
+            "stages": {stage: round(value, 3) for stage, value in self.stages.items()},
+            "failure": self.failure,
+        }
+
+
+class CameraStreamStats:
+    """Rolling stream start statistics of one camera."""
+
+    def __init__(self, hass: HomeAssistant, mac: str) -> None:
+        """Initialize the statistics."""
+        self._hass = hass
+        self.mac = mac
+        self.history: deque[StreamStartTrace] = deque(maxlen=HISTORY_SIZE)
+        self.attempts = 0
+        self.failures: Counter[str] = Counter()
+
+    def start(self, session_id: str) -> StreamStartTrace:
+        """Start timing a new stream start."""
+        self.attempts += 1
+        return StreamStartTrace(self, session_id)
+
+    @callback
+    def async_record(self, trace: StreamStartTrace) -> None:
+        """Add a finished trace."""
+        self.history.append(trace)
+        if trace.failure is not None:
+            self.failures[trace.failure] += 1
+        async_dispatcher_send(self._hass, stream_stats_signal(self.mac))
+
+    def stage_percentiles(self, stage: str) -> dict[str, float | None]:
+        """Return the percentiles of the time at which ``stage`` completed."""
+        values = [
+            trace.stages[stage] for trace in self.history if stage in trace.stages
+        ]
+        return {f"p{pct}": percentile(values, pct) for pct in PERCENTILES}
+
+    @property
+    def last(self) -> StreamStartTrace | None:
+        """Return the most recent finished trace."""
+        return self.history[-1] if self.history else None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics for diagnostics."""
+        return {
+            "attempts": self.attempts,
+            "failures": dict(self.failures),
+            "percentiles": {stage: self.stage_percentiles(stage) for stage in STAGES},
+            "recent": [trace.as_dict() for trace in list(self.history)[-10:]],
+        }
+
+
+class WyzeStreamStatistics:
+    """Stream start statistics of every camera of a config entry."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the registry."""
+        self._hass = hass
+        self._cameras: dict[str, CameraStreamStats] = {}
+
+    def camera(self, mac: str) -> CameraStreamStats:
+        """Return the statistics of ``mac``, creating them on first use."""
+        if (stats := self._cameras.get(mac)) is None:
+            stats = self._cameras[mac] = CameraStreamStats(self._hass, mac)
+        return stats
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics of all cameras for diagnostics."""
+        return {mac: stats.as_dict() for mac, stats in self._cameras.items()}
+
+
+@callback
+def async_get_stream_statistics(
+    hass: HomeAssistant, entry_id: str
+) -> WyzeStreamStatistics:
+    """Return the stream statistics of a config entry."""
+    entry_data = hass.data[DOMAIN][entry_id]
+    if (stats := entry_data.get(STREAM_STATS)) is None:
+        stats = entry_data[STREAM_STATS] = WyzeStreamStatistics(hass)
+    return stats
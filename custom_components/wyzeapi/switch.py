@@ -13,7 +13,8 @@ from wyzeapy.exceptions import AccessTokenError, ParameterError, UnknownApiError
 from wyzeapy.services.bulb_service import Bulb
 from wyzeapy.services.camera_service import Camera
 from wyzeapy.services.switch_service import Switch
-from wyzeapy.types import Device, DeviceTypes, Event
+from wyzeapy.services.wall_switch_service import WallSwitch
+from wyzeapy.types import Device, DeviceTypes
 
 from homeassistant.components.automation import (
     automations_with_device,
@@ -40,26 +41,20 @@ from .const import (
     CONF_CLIENT,
     DOMAIN,
     LIGHT_UPDATED,
-    WYZE_CAMERA_EVENT,
+    MOTION_SWITCH_UNSUPPORTED,
+    NOTIFICATION_SWITCH_UNSUPPORTED,
+    OUTDOOR_PLUG_INDIVUAL_OUTLETS,
+    OUTDOOR_PLUGS,
+    POWER_SWITCH_UNSUPPORTED,
     WYZE_NOTIFICATION_TOGGLE,
 )
+from .device_store import WyzeDeviceStore, async_get_device_store, device_signal
+from .discovery import async_register_device_adder
 from .token_manager import token_exception_handler
 
 _LOGGER = logging.getLogger(__name__)
 ATTRIBUTION = "Data provided by Wyze"
 SCAN_INTERVAL = timedelta(seconds=30)
-OUTDOOR_PLUGS = "WLPPO"
-OUTDOOR_PLUG_INDIVUAL_OUTLETS = "WLPPO-SUB"
-MOTION_SWITCH_UNSUPPORTED = [
-    "GW_BE1",
-    "GW_GC1",
-    "GW_GC2",
-]  # Video doorbell pro, OG, OG 3x Telephoto
-POWER_SWITCH_UNSUPPORTED = ["GW_BE1"]  # Video doorbell pro (device has no off function)
-NOTIFICATION_SWITCH_UNSUPPORTED = {
-    "GW_GC1",
-    "GW_GC2",
-}  # OG and OG 3x Telephoto models currently unsupported due to InvalidSignature2 error
 
 
 # noinspection DuplicatedCode
@@ -83,56 +78,66 @@ async def async_setup_entry(
     wall_switch_service = await client.wall_switch_service
     camera_service = await client.camera_service
     bulb_service = await client.bulb_service
+    store = async_get_device_store(hass, config_entry.entry_id)
 
-    switches: list[SwitchEntity] = []
     has_outdoor_plug: bool = False
     devices_to_migrate: list[str] = []
     devices = []
     device_registry = dr.async_get(hass)
 
+    def _switches(devices: list[Device]) -> list[SwitchEntity]:
+        switches: list[SwitchEntity] = []
+        for device in devices:
+            model = device.product_model
+            if device.type in (DeviceTypes.PLUG, DeviceTypes.OUTDOOR_PLUG):
+                # The outdoor plug has a dummy switch that doesn't control
+                # anything on the device. So we add non-outdoor plug switches
+                # and the switches for each individual outlet on the outdoor
+                # plug.
+                if model not in OUTDOOR_PLUGS:
+                    switch = Switch(device.raw_dict)
+                    switches.append(WyzeSwitch(switch_service, switch, store))
+            elif device.type is DeviceTypes.COMMON and model == "LD_SS1":
+                switch = WallSwitch(device.raw_dict)
+                switches.append(WyzeSwitch(wall_switch_service, switch, store))
+            elif device.type is DeviceTypes.CAMERA:
+                camera = Camera(device.raw_dict)
+                # Notification toggle switch
+                if model not in NOTIFICATION_SWITCH_UNSUPPORTED:
+                    switches.append(
+                        WyzeCameraNotificationSwitch(camera_service, camera, store)
+                    )
+                # IoT Power switch
+                if model not in POWER_SWITCH_UNSUPPORTED:
+                    switches.append(WyzeSwitch(camera_service, camera, store))
+                # Motion toggle switch
+                if model not in MOTION_SWITCH_UNSUPPORTED:
+                    switches.append(
+                        WyzeCameraMotionSwitch(camera_service, camera, store)
+                    )
+            elif device.type is DeviceTypes.LIGHTSTRIP:
+                bulb = Bulb(device.raw_dict)
+                switches.append(WzyeLightstripSwitch(bulb_service, bulb, store))
+        return switches
+
+    async def _async_add_devices(devices: list[Device]) -> None:
+        async_add_entities(_switches(devices), False)
+
     base_switches = await switch_service.get_switches()
-    # The outdoor plug has a dummy switch that doesn't control anything
-    # on the device. So we add non-outdoor plug switches and then
-    # the switches for each individual outlet on the outdoor plug.
-    switches.extend(
-        WyzeSwitch(switch_service, switch)
+    has_outdoor_plug = any(
+        switch.product_model == OUTDOOR_PLUG_INDIVUAL_OUTLETS
         for switch in base_switches
-        if switch.product_model not in [OUTDOOR_PLUGS, OUTDOOR_PLUG_INDIVUAL_OUTLETS]
     )
-
-    for switch in base_switches:
-        if switch.product_model in [OUTDOOR_PLUG_INDIVUAL_OUTLETS]:
-            has_outdoor_plug = True
-            switches.append(WyzeSwitch(switch_service, switch))
-
-    switches.extend(
-        WyzeSwitch(wall_switch_service, switch)
-        for switch in await wall_switch_service.get_switches()
+    switches = _switches(
+        [
+            *base_switches,
+            *await wall_switch_service.get_switches(),
+            *await camera_service.get_cameras(),
+            *await bulb_service.get_bulbs(),
+        ]
     )
-
-    camera_switches = await camera_service.get_cameras()
-    for switch in camera_switches:
-        # Notification toggle switch
-        if switch.product_model not in NOTIFICATION_SWITCH_UNSUPPORTED:
-            switches.append(WyzeCameraNotificationSwitch(camera_service, switch))
-
-        # IoT Power switch
-        if switch.product_model not in POWER_SWITCH_UNSUPPORTED:
-            switches.append(WyzeSwitch(camera_service, switch))
-
-        # Motion toggle switch
-        if switch.product_model not in MOTION_SWITCH_UNSUPPORTED:
-            switches.append(WyzeCameraMotionSwitch(camera_service, switch))
-
     switches.append(WyzeNotifications(client))
 
-    bulb_switches = await bulb_service.get_bulbs()
-    switches.extend(
-        WzyeLightstripSwitch(bulb_service, bulb)
-        for bulb in bulb_switches
-        if bulb.type is DeviceTypes.LIGHTSTRIP
-    )
-
     # Catch old outdoor plug devices and entities and remove.
     # This can be removed at a later date.
     if has_outdoor_plug:
@@ -151,13 +156,14 @@ async def async_setup_entry(
     # Should only happen once while the old devices are still around.
     if devices_to_migrate:
         devices_to_migrate.extend(
-            device.id for device in devices if device.model == OUTDOOR_PLUGS
+            device.id for device in devices if device.model in OUTDOOR_PLUGS
         )
         await async_migrate_switch_data(
             hass, config_entry, devices_to_migrate, device_registry
         )
 
     async_add_entities(switches, False)
+    async_register_device_adder(hass, config_entry, "switch", _async_add_devices)
 
 
 async def async_migrate_switch_data(
@@ -292,22 +298,21 @@ class WyzeNotifications(SwitchEntity):
 class WyzeSwitch(SwitchEntity):
     """Representation of a Wyze Switch."""
 
-    _on: bool
-    _available: bool
     _just_updated = False
-    _old_event_ts: int = 0  # preload with 0 so that we know when it's been updated
     _attr_should_poll = False
 
-    def __init__(self, service: CameraService | SwitchService, device: Device) -> None:
+    def __init__(
+        self,
+        service: CameraService | SwitchService,
+        device: Device,
+        store: WyzeDeviceStore,
+    ) -> None:
         """Initialize a Wyze Bulb."""
-        self._device = device
+        self._store = store
+        self._device = store.device(device)
+        self._state = store.state(self._device.mac)
         self._service = service
 
-        if type(self._device) is Camera:
-            self._device = Camera(self._device.raw_dict)
-        elif type(self._device) is Switch:
-            self._device = Switch(self._device.raw_dict)
-
     @property
     def device_info(self):
         """Return the device info.
@@ -315,8 +320,8 @@ class WyzeSwitch(SwitchEntity):
         Outdoor plug needs its own setup based on how the MAC's are
         displayed and to keep the plugs organized by device.
         """
-        if self._device.product_model == OUTDOOR_PLUG_INDIVUAL_OUTLETS:
-            mac = self._device.mac.split("-")[0]
+        if self._state.product_model == OUTDOOR_PLUG_INDIVUAL_OUTLETS:
+            mac = self._state.mac.split("-")[0]
             return {
                 "identifiers": {(DOMAIN, mac)},
                 "connections": {
@@ -327,19 +332,19 @@ class WyzeSwitch(SwitchEntity):
                 },
                 "name": f"Outdoor Plug {mac}",
                 "manufacturer": "WyzeLabs",
-                "model": self._device.product_model,
+                "model": self._state.product_model,
             }
         return {
-            "identifiers": {(DOMAIN, self._device.mac)},
+            "identifiers": {(DOMAIN, self._state.mac)},
             "connections": {
                 (
                     dr.CONNECTION_NETWORK_MAC,
-                    self._device.mac,
+                    self._state.mac,
                 )
             },
-            "name": self._device.nickname,
+            "name": self._state.nickname,
             "manufacturer": "WyzeLabs",
-            "model": self._device.product_model,
+            "model": self._state.product_model,
         }
 
     @token_exception_handler
@@ -354,7 +359,7 @@ class WyzeSwitch(SwitchEntity):
         else:
             self._device.on = True
             self._just_updated = True
-            self.async_schedule_update_ha_state()
+            self._store.async_refresh(self._device.mac)
 
     @token_exception_handler
     async def async_turn_off(self, **kwargs: Any) -> None:
@@ -368,46 +373,43 @@ class WyzeSwitch(SwitchEntity):
         else:
             self._device.on = False
             self._just_updated = True
-            self.async_schedule_update_ha_state()
+            self._store.async_refresh(self._device.mac)
 
     @property
     def name(self):
         """Return the display name of this switch."""
-        if type(self._device) is Camera:
-            return f"{self._device.nickname} Power"
-        return self._device.nickname
+        if self._state.product_type == DeviceTypes.CAMERA.value:
+            return f"{self._state.nickname} Power"
+        return self._state.nickname
 
     @property
     def available(self):
         """Return the connection status of this switch."""
-        return self._device.available
+        return self._state.available
 
     @property
     def is_on(self):
         """Return true if switch is on."""
-        return self._device.on
+        return self._state.on
 
     @property
     def unique_id(self):
         """Return the unique ID."""
-        return f"{self._device.mac}-switch"
+        return f"{self._state.mac}-switch"
 
     @property
     def extra_state_attributes(self):
         """Return device attributes of the entity."""
         dev_info = {}
 
-        if self._device.device_params.get("electricity"):
-            dev_info["Battery"] = str(
-                self._device.device_params.get("electricity") + "%"
-            )
-        # noinspection DuplicatedCode
-        if self._device.device_params.get("ip"):
-            dev_info["IP"] = str(self._device.device_params.get("ip"))
-        if self._device.device_params.get("rssi"):
-            dev_info["RSSI"] = str(self._device.device_params.get("rssi"))
-        if self._device.device_params.get("ssid"):
-            dev_info["SSID"] = str(self._device.device_params.get("ssid"))
+        if self._state.battery:
+            dev_info["Battery"] = f"{self._state.battery}%"
+        if self._state.ip:
+            dev_info["IP"] = self._state.ip
+        if self._state.rssi:
+            dev_info["RSSI"] = self._state.rssi
+        if self._state.ssid:
+            dev_info["SSID"] = self._state.ssid
 
         return dev_info
 
@@ -415,83 +417,60 @@ class WyzeSwitch(SwitchEntity):
     async def async_update(self):
         """Update the entity."""
         if not self._just_updated:
-            self._device = await self._service.update(self._device)
+            self._store.async_refresh(
+                self._device.mac, await self._service.update(self._device)
+            )
         else:
             self._just_updated = False
 
     @callback
-    def async_update_callback(self, switch: Switch):
+    def async_update_callback(self, device: Device) -> None:
         """Update the switch's state."""
-        self._device = switch
-        async_dispatcher_send(
-            self.hass,
-            f"{CAMERA_UPDATED}-{switch.mac}",
-            switch,
-        )
-        self.async_schedule_update_ha_state()
-        # if the switch is from a camera, lets check for new events
-        if isinstance(switch, Camera):
-            if (
-                self._old_event_ts > 0
-                and self._old_event_ts != switch.last_event_ts
-                and switch.last_event is not None
-            ):
-                event: Event = switch.last_event
-                # The screenshot/video urls are not always in the same positions in the lists, so we have to loop
-                # through them
-                _screenshot_url = None
-                _video_url = None
-                _ai_tag_list = []
-                for resource in event.file_list:
-                    _ai_tag_list = _ai_tag_list + resource["ai_tag_list"]
-                    if resource["type"] == 1:
-                        _screenshot_url = resource["url"]
-                    elif resource["type"] == 2:
-                        _video_url = resource["url"]
-                _LOGGER.debug("Camera: %s has a new event", switch.nickname)
-                self.hass.bus.fire(
-                    WYZE_CAMERA_EVENT,
-                    {
-                        "device_name": switch.nickname,
-                        "device_mac": switch.mac,
-                        "ai_tag_list": _ai_tag_list,
-                        "tag_list": event.tag_list,
-                        "event_screenshot": _screenshot_url,
-                        "event_video": _video_url,
-                    },
-                )
-            self._old_event_ts = switch.last_event_ts
+        if self._state.product_type == DeviceTypes.CAMERA.value:
+            async_dispatcher_send(
+                self.hass,
+                f"{CAMERA_UPDATED}-{device.mac}",
+                device,
+            )
+        self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
         """Subscribe to update events."""
-        self._device.callback_function = self.async_update_callback
-        self._service.register_updater(self._device, 30)
-        await self._service.start_update_manager()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                device_signal(self._device.mac),
+                self.async_update_callback,
+            )
+        )
+        await self._store.async_register_updater(self._service, self._device, 30)
         return await super().async_added_to_hass()
 
     async def async_will_remove_from_hass(self) -> None:
         """Unregister updated on removal."""
-        self._service.unregister_updater(self._device)
+        self._store.async_deregister_updater(self._device.mac)
 
 
 class WyzeCameraNotificationSwitch(SwitchEntity):
     """Representation of a Wyze Camera Notification Switch."""
 
-    _available: bool
-
-    def __init__(self, service: CameraService, device: Camera) -> None:
+    def __init__(
+        self, service: CameraService, device: Camera, store: WyzeDeviceStore
+    ) -> None:
         """Initialize a Wyze Notification Switch."""
         self._service = service
-        self._device = device
+        self._store = store
+        self._device = store.device(device)
+        self._state = store.state(self._device.mac)
 
     @property
     def device_info(self):
         """Return the device info."""
         return {
-            "identifiers": {(DOMAIN, self._device.mac)},
-            "name": self._device.nickname,
+            "identifiers": {(DOMAIN, self._state.mac)},
+            "name": self._state.nickname,
             "manufacturer": "WyzeLabs",
-            "model": self._device.product_model,
+            "model": self._state.product_model,
         }
 
     @property
@@ -509,7 +488,7 @@ class WyzeCameraNotificationSwitch(SwitchEntity):
             raise HomeAssistantError(err) from err
         else:
             self._device.notify = True
-            self.async_write_ha_state()
+            self._store.async_refresh(self._device.mac)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
@@ -521,32 +500,31 @@ class WyzeCameraNotificationSwitch(SwitchEntity):
             raise HomeAssistantError(err) from err
         else:
             self._device.notify = False
-            self.async_write_ha_state()
+            self._store.async_refresh(self._device.mac)
 
     @property
     def name(self):
         """Return the display name of this switch."""
-        return f"{self._device.nickname} Notifications"
+        return f"{self._state.nickname} Notifications"
 
     @property
     def available(self):
         """Return the connection status of this switch."""
-        return self._device.available
+        return self._state.available
 
     @property
     def is_on(self):
         """Return true if switch is on."""
-        return self._device.notify
+        return self._state.notify
 
     @property
     def unique_id(self):
         """Add a unique ID to the switch."""
-        return f"{self._device.mac}-notification_switch"
+        return f"{self._state.mac}-notification_switch"
 
     @callback
     def handle_camera_update(self, camera: Camera) -> None:
         """Update the switch whenever there is an update."""
-        self._device = camera
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
@@ -554,7 +532,7 @@ class WyzeCameraNotificationSwitch(SwitchEntity):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{CAMERA_UPDATED}-{self._device.mac}",
+                device_signal(self._device.mac),
                 self.handle_camera_update,
             )
         )
@@ -563,21 +541,23 @@ class WyzeCameraNotificationSwitch(SwitchEntity):
 class WyzeCameraMotionSwitch(SwitchEntity):
     """Representation of a Wyze Camera Motion Detection Switch."""
 
-    _available: bool
-
-    def __init__(self, service: CameraService, device: Camera) -> None:
+    def __init__(
+        self, service: CameraService, device: Camera, store: WyzeDeviceStore
+    ) -> None:
         """Initialize a Wyze Notification Switch."""
         self._service = service
-        self._device = device
+        self._store = store
+        self._device = store.device(device)
+        self._state = store.state(self._device.mac)
 
     @property
     def device_info(self):
         """Return the device info."""
         return {
-            "identifiers": {(DOMAIN, self._device.mac)},
-            "name": self._device.nickname,
+            "identifiers": {(DOMAIN, self._state.mac)},
+            "name": self._state.nickname,
             "manufacturer": "WyzeLabs",
-            "model": self._device.product_model,
+            "model": self._state.product_model,
         }
 
     @property
@@ -595,7 +575,7 @@ class WyzeCameraMotionSwitch(SwitchEntity):
             raise HomeAssistantError(err) from err
         else:
             self._device.motion = True
-            self.async_write_ha_state()
+            self._store.async_refresh(self._device.mac)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
@@ -607,32 +587,31 @@ class WyzeCameraMotionSwitch(SwitchEntity):
             raise HomeAssistantError(err) from err
         else:
             self._device.motion = False
-            self.async_write_ha_state()
+            self._store.async_refresh(self._device.mac)
 
     @property
     def name(self):
         """Return the display name of this switch."""
-        return f"{self._device.nickname} Motion Detection"
+        return f"{self._state.nickname} Motion Detection"
 
     @property
     def available(self):
         """Return the connection status of this switch."""
-        return self._device.available
+        return self._state.available
 
     @property
     def is_on(self):
         """Return true if switch is on."""
-        return self._device.motion
+        return self._state.motion
 
     @property
     def unique_id(self):
         """Add a unique ID to the switch."""
-        return f"{self._device.mac}-motion_switch"
+        return f"{self._state.mac}-motion_switch"
 
     @callback
     def handle_camera_update(self, camera: Camera) -> None:
         """Update the switch whenever there is an update."""
-        self._device = camera
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
@@ -640,7 +619,7 @@ class WyzeCameraMotionSwitch(SwitchEntity):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{CAMERA_UPDATED}-{self._device.mac}",
+                device_signal(self._device.mac),
                 self.handle_camera_update,
             )
         )
@@ -649,19 +628,23 @@ class WyzeCameraMotionSwitch(SwitchEntity):
 class WzyeLightstripSwitch(SwitchEntity):
     """Music Mode Switch for Wyze Light Strip."""
 
-    def __init__(self, service: BulbService, device: Device) -> None:
+    def __init__(
+        self, service: BulbService, device: Bulb, store: WyzeDeviceStore
+    ) -> None:
         """Initialize a Wyze Music Mode Switch."""
         self._service = service
-        self._device = Bulb(device.raw_dict)
+        self._store = store
+        self._device = store.device(device)
+        self._state = store.state(self._device.mac)
 
     @property
     def device_info(self):
         """Return the device info."""
         return {
-            "identifiers": {(DOMAIN, self._device.mac)},
-            "name": self._device.nickname,
+            "identifiers": {(DOMAIN, self._state.mac)},
+            "name": self._state.nickname,
             "manufacturer": "WyzeLabs",
-            "model": self._device.product_model,
+            "model": self._state.product_model,
         }
 
     @property
@@ -679,7 +662,7 @@ class WzyeLightstripSwitch(SwitchEntity):
             raise HomeAssistantError(err) from err
         else:
             self._device.music_mode = True
-            self.async_schedule_update_ha_state()
+            self._store.async_refresh(self._device.mac)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the switch."""
@@ -691,32 +674,36 @@ class WzyeLightstripSwitch(SwitchEntity):
             raise HomeAssistantError(err) from err
         else:
             self._device.music_mode = False
-            self.async_schedule_update_ha_state()
+            self._store.async_refresh(self._device.mac)
 
     @property
     def name(self):
         """Return the display name of this switch."""
-        return f"{self._device.nickname} Music Mode for Effects"
+        return f"{self._state.nickname} Music Mode for Effects"
 
     @property
     def available(self):
         """Return the connection status of this switch."""
-        return self._device.available
+        return self._state.available
 
     @property
     def is_on(self):
         """Return true if switch is on."""
-        return self._device.music_mode
+        return self._state.music_mode
 
     @property
     def unique_id(self):
         """Add a unique ID to the switch."""
-        return f"{self._device.mac}-music_mode"
+        return f"{self._state.mac}-music_mode"
 
     @callback
     def handle_light_update(self, bulb: Bulb) -> None:
+        """Take in the light entity's update of the bulb."""
+        self._store.async_refresh(self._device.mac, bulb)
+
+    @callback
+    def handle_device_update(self, bulb: Bulb) -> None:
         """Update the switch whenever there is an update."""
-        self._device = bulb
         self.async_write_ha_state()
 
     async def async_added_to_hass(self) -> None:
@@ -728,3 +715,10 @@ class WzyeLightstripSwitch(SwitchEntity):
                 self.handle_light_update,
             )
         )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                device_signal(self._device.mac),
+                self.handle_device_update,
+            )
+        )
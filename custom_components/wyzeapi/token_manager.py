@@ -1,50 +1,81 @@
 import logging
 from inspect import iscoroutinefunction
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_USERNAME, CONF_PASSWORD
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_call_later
 from wyzeapy.exceptions import AccessTokenError, LoginError
 from wyzeapy.wyze_auth_lib import Token
 
-from .const import DOMAIN, ACCESS_TOKEN, REFRESH_TOKEN, REFRESH_TIME
+from .const import ACCESS_TOKEN, REFRESH_TOKEN, REFRESH_TIME
+from .token_refresh import find_token_refresher
 
 _LOGGER = logging.getLogger(__name__)
 
+# Seconds a new token waits before it is written, so tokens arriving in a
+# burst (login followed by a refresh) cause a single write.
+WRITE_DELAY = 10
+
 
 class TokenManager:
-    hass: HomeAssistant = None
-    config_entry: ConfigEntry = None
+    """Persists the tokens of one entry's client in that entry's data."""
 
     def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry):
-        TokenManager.hass = hass
-        TokenManager.config_entry = config_entry
+        self.hass = hass
+        self.config_entry = config_entry
+        self._pending: dict[str, Any] | None = None
+        self._unsub_write: CALLBACK_TYPE | None = None
 
-    @staticmethod
-    async def token_callback(token: Token = None):
+    async def token_callback(self, token: Token = None):
+        token_data = {
+            ACCESS_TOKEN: token.access_token,
+            REFRESH_TOKEN: token.refresh_token,
+            REFRESH_TIME: str(token.refresh_time),
+        }
+        if all(self.config_entry.data.get(k) == v for k, v in token_data.items()):
+            self._pending = None
+            return
         _LOGGER.debug("TokenManager: Received new token, updating config entry.")
-        if TokenManager.hass.config_entries.async_entries(DOMAIN):
-            for entry in TokenManager.hass.config_entries.async_entries(DOMAIN):
-                TokenManager.hass.config_entries.async_update_entry(
-                    entry,
-                    data={
-                        CONF_USERNAME: entry.data.get(CONF_USERNAME),
-                        CONF_PASSWORD: entry.data.get(CONF_PASSWORD),
-                        ACCESS_TOKEN: token.access_token,
-                        REFRESH_TOKEN: token.refresh_token,
-                        REFRESH_TIME: str(token.refresh_time),
-                    },
-                )
+        self._pending = token_data
+        if self._unsub_write is None:
+            self._unsub_write = async_call_later(
+                self.hass, WRITE_DELAY, self.async_flush
+            )
+
+    @callback
+    def async_flush(self, _now: Any = None) -> None:
+        """Write the newest token now if it hasn't been written yet."""
+        if self._unsub_write is not None:
+            self._unsub_write()
+            self._unsub_write = None
+        if self._pending is None:
+            return
+        # Keep everything else in the entry's data (credentials, API key...)
+        self.hass.config_entries.async_update_entry(
+            self.config_entry, data={**self.config_entry.data, **self._pending}
+        )
+        self._pending = None
 
 
 def token_exception_handler(func):
+    async def call(*args, **kwargs):
+        if iscoroutinefunction(func):
+            return await func(*args, **kwargs)
+        return func(*args, **kwargs)
+
     async def inner_function(*args, **kwargs):
         try:
-            if iscoroutinefunction(func):
-                await func(*args, **kwargs)
-            else:
-                func(*args, **kwargs)
+            try:
+                return await call(*args, **kwargs)
+            except AccessTokenError:
+                # Wait for a single refresh of the token, then retry once
+                if (refresher := find_token_refresher(args)) is None:
+                    raise
+                await refresher.async_refresh()
+                refresher.retries += 1
+                return await call(*args, **kwargs)
         except (AccessTokenError, LoginError) as err:
             _LOGGER.error("TokenManager detected a login issue please re-login.")
             raise ConfigEntryAuthFailed("Unable to login, please re-login.") from err
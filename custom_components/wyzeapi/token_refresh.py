@@ -0,0 +1,209 @@
+"""Refresh the Wyze access token before it expires, once per account.
+
+wyzeapy only refreshes the token when a request finds it past its refresh
+time or rejected by the cloud. Around expiry that is whichever of the many
+concurrent polls gets there first, while the others fail with
+``AccessTokenError``, which used to fail the whole entry with a reauth.
+
+:class:`WyzeTokenRefresher` refreshes ahead of the token's refresh time
+instead, at a jittered moment so entries (and installs) don't all refresh at
+once. Refreshes are single flight: a request rejected with an expired token
+waits for the refresh in progress, or starts one, and is then retried once
+(see :func:`.token_manager.token_exception_handler`). Refreshes hold
+wyzeapy's own refresh lock, so a refresh wyzeapy starts from a request
+doesn't run next to one started here.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any
+
+from wyzeapy import Wyzeapy
+from wyzeapy.exceptions import AccessTokenError, LoginError
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+# Key under hass.data[DOMAIN][entry_id] holding the entry's refresher.
+TOKEN_REFRESHER = "token_refresher"
+
+# Seconds before the token's refresh time the proactive refresh happens,
+# give or take the jitter.
+REFRESH_LEAD = 20 * 60
+REFRESH_JITTER = 10 * 60
+# Seconds before retrying a proactive refresh that failed for a reason other
+# than a rejected refresh token.
+RETRY_DELAY = 5 * 60
+
+
+class WyzeTokenRefresher:
+    """Keeps the access token of one entry's client fresh."""
+
+    def __init__(
+        self, hass: HomeAssistant, config_entry: ConfigEntry, client: Wyzeapy
+    ) -> None:
+        """Initialize the refresher."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._auth_lib = client._auth_lib  # noqa: SLF001
+        self._task: asyncio.Task | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._next_refresh: float | None = None
+        self.refreshes = 0
+        self.failures = 0
+        self.waiters = 0
+        self.retries = 0
+        self.last_latency: float | None = None
+        self.max_latency = 0.0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the refresh counters for diagnostics."""
+        return {
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "waiters": self.waiters,
+            "retries": self.retries,
+            "last_latency_ms": (
+                round(self.last_latency * 1000) if self.last_latency else None
+            ),
+            "max_latency_ms": round(self.max_latency * 1000),
+            "next_refresh_in": (
+                round(self._next_refresh - time.time())
+                if self._next_refresh is not None
+                else None
+            ),
+        }
+
+    @callback
+    def async_start(self) -> None:
+        """Schedule the first proactive refresh."""
+        self._async_schedule()
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the scheduled refresh and the one in progress."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._next_refresh = None
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    @callback
+    def _async_schedule(self, delay: float | None = None) -> None:
+        """Schedule the next refresh, by default ahead of the refresh time."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+        if delay is None:
+            delay = (
+                self._auth_lib.token.refresh_time
+                - time.time()
+                - REFRESH_LEAD
+                + random.uniform(-REFRESH_JITTER, REFRESH_JITTER)
+            )
+        delay = max(delay, 0)
+        self._next_refresh = time.time() + delay
+        self._unsub_timer = async_call_later(self._hass, delay, self._async_fire)
+
+    @callback
+    def _async_fire(self, _now: Any) -> None:
+        self._unsub_timer = None
+        token = self._auth_lib.token
+        if token.refresh_time - time.time() > REFRESH_LEAD + REFRESH_JITTER:
+            # wyzeapy refreshed the token on its own since this was scheduled
+            self._async_schedule()
+            return
+        self._async_refresh_task()
+
+    @callback
+    def _async_refresh_task(self) -> asyncio.Task:
+        """Return the refresh in progress, starting one if there is none."""
+        if self._task is None:
+            self._task = self._config_entry.async_create_background_task(
+                self._hass,
+                self._async_refresh(self._auth_lib.token.access_token),
+                f"{DOMAIN} token refresh {self._config_entry.entry_id}",
+            )
+        return self._task
+
+    async def async_refresh(self) -> None:
+        """Wait for a fresh token, refreshing it unless a refresh is running.
+
+        Raises what the refresh failed with.
+        """
+        if self._task is None and not self._auth_lib.token.expired:
+            # Refreshed since the caller's request was rejected
+            return
+        if self._task is not None:
+            self.waiters += 1
+        # The refresh belongs to the refresher; a cancelled caller leaves it be
+        if (err := await asyncio.shield(self._async_refresh_task())) is not None:
+            raise err
+
+    async def _async_refresh(self, stale_token: str) -> Exception | None:
+        """Refresh the token; return the error instead of raising it."""
+        try:
+            async with self._auth_lib.refresh_lock:
+                if self._auth_lib.token.access_token != stale_token:
+                    # Refreshed by wyzeapy while waiting for the lock
+                    self._async_schedule()
+                    return None
+                start = time.monotonic()
+                try:
+                    await self._auth_lib.refresh()
+                except (AccessTokenError, LoginError) as err:
+                    self.failures += 1
+                    _LOGGER.warning("The Wyze refresh token was rejected")
+                    self._config_entry.async_start_reauth(self._hass)
+                    return err
+                except Exception as err:  # noqa: BLE001
+                    self.failures += 1
+                    _LOGGER.debug("Token refresh failed, retrying later: %s", err)
+                    self._async_schedule(RETRY_DELAY)
+                    return err
+                self.last_latency = time.monotonic() - start
+                self.max_latency = max(self.max_latency, self.last_latency)
+                self.refreshes += 1
+                _LOGGER.debug(
+                    "Refreshed the access token in %.0f ms", self.last_latency * 1000
+                )
+                self._async_schedule()
+                return None
+        finally:
+            self._task = None
+
+
+def find_token_refresher(args: tuple[Any, ...]) -> WyzeTokenRefresher | None:
+    """Return the refresher of the entry a platform call belongs to.
+
+    ``args`` are the arguments of a platform setup (containing the config
+    entry), of an entity method (the entity) or of a coordinator method.
+    """
+    hass = next((arg for arg in args if isinstance(arg, HomeAssistant)), None)
+    for arg in args:
+        if isinstance(arg, ConfigEntry):
+            config_entry = arg
+        elif isinstance(arg, Entity):
+            config_entry = arg.platform.config_entry if arg.platform else None
+        else:  # a coordinator
+            config_entry = getattr(arg, "config_entry", None)
+        if isinstance(config_entry, ConfigEntry):
+            hass = getattr(arg, "hass", None) or hass
+            break
+    else:
+        return None
+    if hass is None:
+        return None
+    entry_data = hass.data.get(DOMAIN, {}).get(config_entry.entry_id, {})
+    return entry_data.get(TOKEN_REFRESHER)
@@ -0,0 +1,151 @@
+"""Tests for the outdoor plug energy ledger."""
+
+import json
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.wyzeapi.energy import (
+    LEDGER_HOURS,
+    WyzePlugEnergyLedger,
+    utc_hour,
+)
+
+# First hour of an arbitrary UTC day
+DAY = 20000 * 24
+
+
+def _now(hour: int) -> float:
+    """Return a timestamp one minute into ``hour``."""
+    return hour * 3600 + 60
+
+
+def _record(*readings: float) -> dict[str, str]:
+    """Return a usage record with the given hourly Wh readings."""
+    return {"data": json.dumps([*readings, *[0] * (24 - len(readings))])}
+
+
+@pytest.fixture
+def ledger(hass: HomeAssistant) -> WyzePlugEnergyLedger:
+    """Return an empty ledger."""
+    return WyzePlugEnergyLedger(hass, "AABBCCDDEEFF")
+
+
+def test_utc_hour() -> None:
+    """Timestamps map to hours since the epoch."""
+    assert utc_hour(0) == 0
+    assert utc_hour(3599.9) == 0
+    assert utc_hour(_now(DAY + 5)) == DAY + 5
+
+
+async def test_first_ingest_seeds_without_adding(ledger: WyzePlugEnergyLedger) -> None:
+    """The first readings are the baseline and place every hour."""
+    added = ledger.async_ingest(
+        [_record(100, 200, 300, 400, 500, 600, 700)], _now(DAY + 5)
+    )
+
+    assert added == 0.0
+    assert ledger.total == 0.0
+    assert ledger.first_hour == DAY
+    assert ledger.value(DAY) == pytest.approx(0.1)
+    assert ledger.value(DAY + 5) == pytest.approx(0.6)
+    # Hours after the current one are not trusted yet
+    assert ledger.value(DAY + 6) == 0.0
+    assert ledger.end_hour == DAY + 6
+
+
+async def test_ingest_adds_increases(ledger: WyzePlugEnergyLedger) -> None:
+    """Later polls add how much the hours grew, and only that."""
+    ledger.async_ingest([_record(100, 200, 300)], _now(DAY + 2))
+
+    assert ledger.async_ingest([_record(100, 200, 450)], _now(DAY + 2)) == (
+        pytest.approx(0.15)
+    )
+    # The same payload again is skipped
+    assert ledger.async_ingest([_record(100, 200, 450)], _now(DAY + 2)) == 0.0
+    # A lower reading replaces the hour but does not take energy away
+    assert ledger.async_ingest([_record(100, 150, 450)], _now(DAY + 2)) == 0.0
+    assert ledger.value(DAY + 1) == pytest.approx(0.15)
+    assert ledger.total == pytest.approx(0.15)
+
+
+async def test_ingest_across_midnight(ledger: WyzePlugEnergyLedger) -> None:
+    """Right after midnight the response starts with the previous day."""
+    ledger.async_ingest([_record(*[100] * 24)], _now(DAY + 23))
+
+    added = ledger.async_ingest(
+        [_record(*[100] * 23, 300), _record(50)], _now(DAY + 24)
+    )
+
+    assert added == pytest.approx(0.25)
+    assert ledger.value(DAY + 23) == pytest.approx(0.3)
+    assert ledger.value(DAY + 24) == pytest.approx(0.05)
+    assert ledger.end_hour == DAY + 25
+
+
+async def test_ingest_ignores_malformed_records(ledger: WyzePlugEnergyLedger) -> None:
+    """Empty and undecodable records are skipped."""
+    ledger.async_ingest([_record(100)], _now(DAY + 1))
+
+    assert ledger.async_ingest([{"data": "not json"}], _now(DAY + 1)) == 0.0
+    assert ledger.async_ingest([{}], _now(DAY + 1)) == 0.0
+    assert ledger.async_ingest(None, _now(DAY + 1)) == 0.0
+    assert ledger.value(DAY) == pytest.approx(0.1)
+
+
+async def test_sum_range(ledger: WyzePlugEnergyLedger) -> None:
+    """Ranges are half open and clamped to the hours held."""
+    assert ledger.sum_range(DAY, DAY + 24) == 0.0
+
+    ledger.async_ingest([_record(100, 200, 300, 400)], _now(DAY + 3))
+
+    assert ledger.sum_range(DAY, DAY + 3) == pytest.approx(0.6)
+    assert ledger.sum_range(DAY + 1, DAY + 2) == pytest.approx(0.2)
+    assert ledger.sum_range(DAY - 10, DAY + 100) == pytest.approx(1.0)
+    assert ledger.sum_range(DAY + 2, DAY + 2) == 0.0
+    assert ledger.sum_range(DAY + 10, DAY + 20) == 0.0
+
+
+async def test_window_is_trimmed(ledger: WyzePlugEnergyLedger) -> None:
+    """Hours that fall out of the rolling window are dropped."""
+    ledger.async_ingest([_record(100, 200)], _now(DAY + 1))
+
+    later = DAY + LEDGER_HOURS + 24
+    first_day = (later - 1) // 24 * 24
+    added = ledger.async_ingest([_record(*[10] * 24)], _now(later))
+
+    assert ledger.first_hour == later - LEDGER_HOURS + 1
+    assert ledger.value(DAY) == 0.0
+    assert ledger.value(first_day) == pytest.approx(0.01)
+    assert added == pytest.approx(0.24)
+
+
+async def test_seed_and_reset_total(ledger: WyzePlugEnergyLedger) -> None:
+    """A seeded total keeps growing and a reset starts over."""
+    ledger.async_ingest([_record(100)], _now(DAY + 1))
+    ledger.async_seed_total(5.0)
+
+    ledger.async_ingest([_record(300)], _now(DAY + 1))
+    assert ledger.total == pytest.approx(5.2)
+
+    ledger.async_reset_total()
+    assert ledger.total == 0.0
+    ledger.async_ingest([_record(400)], _now(DAY + 1))
+    assert ledger.total == pytest.approx(0.1)
+
+
+async def test_ledger_persists(hass: HomeAssistant, hass_storage) -> None:
+    """A saved ledger loads back with its readings and total."""
+    ledger = WyzePlugEnergyLedger(hass, "AABBCCDDEEFF")
+    ledger.async_ingest([_record(100, 200)], _now(DAY + 1))
+    ledger.async_ingest([_record(100, 500)], _now(DAY + 1))
+    await ledger.async_save()
+
+    restored = WyzePlugEnergyLedger(hass, "AABBCCDDEEFF")
+    await restored.async_load()
+
+    assert restored.restored
+    assert restored.first_hour == DAY
+    assert restored.value(DAY + 1) == pytest.approx(0.5)
+    assert restored.total == pytest.approx(0.3)
@@ -0,0 +1,191 @@
+"""Tests for the camera event pipeline."""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
+from wyzeapy.services.camera_service import Camera
+from wyzeapy.types import Event
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.wyzeapi import events
+from custom_components.wyzeapi.const import DOMAIN, WYZE_CAMERA_EVENT
+from custom_components.wyzeapi.events import (
+    EVENT_BATCH_SIZE,
+    WyzeCameraEventPipeline,
+)
+
+MAC = "AABBCCDDEEFF"
+
+
+def _raw_event(event_ts: int, mac: str = MAC) -> dict:
+    """Return an event of the event list."""
+    return {"event_id": f"{mac}-{event_ts}", "device_mac": mac, "event_ts": event_ts}
+
+
+def _since(minutes: int) -> int:
+    """Return the timestamp (ms) ``minutes`` ago."""
+    return int(time.time() * 1000) - minutes * 60 * 1000
+
+
+class FakeEventList:
+    """Serves the event list the way the cloud pages it, newest first."""
+
+    def __init__(self) -> None:
+        """Initialize an empty event list."""
+        self.events: list[dict] = []
+        self.requests: list[tuple[int, int]] = []
+
+    async def async_get_page(self, begin: int, end: int) -> list[dict]:
+        """Return the newest events between ``begin`` and ``end``."""
+        self.requests.append((begin, end))
+        matching = [event for event in self.events if begin <= event["event_ts"] <= end]
+        matching.sort(key=lambda event: event["event_ts"], reverse=True)
+        return matching[:EVENT_BATCH_SIZE]
+
+
+@pytest.fixture
+def event_list() -> FakeEventList:
+    """Return an empty event list."""
+    return FakeEventList()
+
+
+@pytest.fixture
+def pipeline(hass: HomeAssistant, event_list: FakeEventList) -> WyzeCameraEventPipeline:
+    """Return a pipeline following one camera, served by ``event_list``."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    pipeline = WyzeCameraEventPipeline(hass, entry, MagicMock())
+    pipeline._async_get_page = event_list.async_get_page
+    pipeline.async_set_cameras(
+        [Camera({"mac": MAC, "nickname": "Porch", "product_type": "Camera"})]
+    )
+    return pipeline
+
+
+async def test_seen_events_are_not_fired_again(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Events in the ring are skipped and the ring drops the oldest ids."""
+    monkeypatch.setattr(events, "RING_SIZE", 3)
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    pipeline = WyzeCameraEventPipeline(hass, entry, MagicMock())
+    pipeline.async_set_cameras(
+        [Camera({"mac": MAC, "nickname": "Porch", "product_type": "Camera"})]
+    )
+    fired = async_capture_events(hass, WYZE_CAMERA_EVENT)
+
+    # Not full yet: an old event nobody fired is still new
+    assert pipeline.async_process_events([Event(_raw_event(5))]) == 1
+    assert pipeline.async_process_events([Event(_raw_event(2))]) == 1
+    assert pipeline.async_process_events([Event(_raw_event(5))]) == 0
+
+    assert pipeline.async_process_events([Event(_raw_event(6))]) == 1
+    assert pipeline.stats()["seen"] == 3
+    assert pipeline.async_process_events([Event(_raw_event(7))]) == 1
+    assert pipeline.stats()["seen"] == 3
+    # The id of the event at 5 dropped out of the full ring, but the event is
+    # older than the newest one fired
+    assert pipeline.async_process_events([Event(_raw_event(5))]) == 0
+    assert pipeline.async_process_events([Event(_raw_event(4))]) == 0
+    assert pipeline.async_process_events([Event(_raw_event(8))]) == 1
+    # Events of cameras not followed are ignored
+    assert pipeline.async_process_events([Event(_raw_event(9, "OTHER"))]) == 0
+
+    await hass.async_block_till_done()
+    assert [event.data["event_ts"] for event in fired] == [5, 2, 6, 7, 8]
+    assert pipeline.high_water == 8
+
+
+async def test_events_fire_in_order(
+    hass: HomeAssistant, pipeline: WyzeCameraEventPipeline
+) -> None:
+    """New events fire oldest first."""
+    fired = async_capture_events(hass, WYZE_CAMERA_EVENT)
+
+    pipeline.async_process_events([Event(_raw_event(ts)) for ts in (3, 1, 2)])
+
+    await hass.async_block_till_done()
+    assert [event.data["event_ts"] for event in fired] == [1, 2, 3]
+
+
+async def test_paging_stops_at_newest_fired(
+    hass: HomeAssistant,
+    pipeline: WyzeCameraEventPipeline,
+    event_list: FakeEventList,
+) -> None:
+    """A burst is paged back until the newest event fired already."""
+    start = _since(30)
+    event_list.events = [_raw_event(start)]
+    pipeline.async_process_events([Event(_raw_event(start))], fire=False)
+    event_list.events += [_raw_event(start + i * 1000) for i in range(1, 46)]
+    fired = async_capture_events(hass, WYZE_CAMERA_EVENT)
+
+    await pipeline.async_poll()
+
+    await hass.async_block_till_done()
+    assert len(fired) == 45
+    # Two full pages and the rest
+    assert len(event_list.requests) == 3
+    assert event_list.requests[0][0] == start
+    assert pipeline.stats()["gap"] is None
+
+
+async def test_capped_poll_continues_on_the_next(
+    hass: HomeAssistant,
+    pipeline: WyzeCameraEventPipeline,
+    event_list: FakeEventList,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Events a capped poll did not reach are fetched by the next poll."""
+    monkeypatch.setattr(events, "MAX_PAGES", 2)
+    start = _since(30)
+    event_list.events = [_raw_event(start)]
+    pipeline.async_process_events([Event(_raw_event(start))], fire=False)
+    event_list.events += [_raw_event(start + i * 1000) for i in range(1, 51)]
+    fired = async_capture_events(hass, WYZE_CAMERA_EVENT)
+
+    await pipeline.async_poll()
+    await hass.async_block_till_done()
+    # The event at the page boundary comes back on the second page
+    assert len(fired) == 2 * EVENT_BATCH_SIZE - 1
+    assert pipeline.stats()["gap"] is not None
+
+    await pipeline.async_poll()
+    await hass.async_block_till_done()
+    assert sorted(event.data["event_ts"] for event in fired) == [
+        start + i * 1000 for i in range(1, 51)
+    ]
+    assert pipeline.stats()["gap"] is None
+    assert pipeline.high_water == start + 50 * 1000
+
+
+async def test_first_start_sets_the_baseline(
+    hass: HomeAssistant,
+    hass_storage,
+    pipeline: WyzeCameraEventPipeline,
+    event_list: FakeEventList,
+) -> None:
+    """The first start fires nothing and later polls fire what's new."""
+    event_list.events = [_raw_event(_since(minutes)) for minutes in (20, 10, 5)]
+    fired = async_capture_events(hass, WYZE_CAMERA_EVENT)
+
+    await pipeline.async_start(pipeline.cameras)
+    await hass.async_block_till_done()
+    assert fired == []
+    assert pipeline.high_water == event_list.events[-1]["event_ts"]
+
+    event_list.events.append(_raw_event(_since(1)))
+    await pipeline.async_poll()
+    await hass.async_block_till_done()
+    assert [event.data["event_ts"] for event in fired] == [
+        event_list.events[-1]["event_ts"]
+    ]
+
+    await pipeline.async_stop()
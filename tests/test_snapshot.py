@@ -0,0 +1,165 @@
+"""Tests for the camera still cache."""
+
+import asyncio
+import time
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.wyzeapi import snapshot
+from custom_components.wyzeapi.snapshot import (
+    MAX_SCALED_VARIANTS,
+    CachedImage,
+    WyzeSnapshotCache,
+)
+
+MAC = "AABBCCDDEEFF"
+
+
+def _image(size: int) -> CachedImage:
+    """Return a still of ``size`` bytes."""
+    return CachedImage(
+        content=b"x" * size,
+        content_type="image/jpeg",
+        etag=None,
+        last_modified=None,
+        fetched=time.monotonic(),
+    )
+
+
+@pytest.fixture
+def downloads(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Serve 100 byte stills instead of downloading, recording each URL."""
+    urls: list[str] = []
+
+    async def _fetch(self, url, previous):
+        urls.append(url)
+        return _image(100)
+
+    monkeypatch.setattr(WyzeSnapshotCache, "_async_fetch", _fetch)
+    return urls
+
+
+async def test_hit_serves_cached_still(
+    hass: HomeAssistant, downloads: list[str]
+) -> None:
+    """A still is downloaded once and then served from the cache."""
+    cache = WyzeSnapshotCache(hass)
+
+    first = await cache.async_get(MAC, "url", 1)
+    second = await cache.async_get(MAC, "url", 1)
+
+    assert second is first
+    assert downloads == ["url"]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+async def test_least_recently_used_is_evicted(
+    hass: HomeAssistant, downloads: list[str]
+) -> None:
+    """Going over budget drops the still used longest ago."""
+    cache = WyzeSnapshotCache(hass, max_bytes=250)
+
+    await cache.async_get("a", "url-a", 1)
+    await cache.async_get("b", "url-b", 1)
+    await cache.async_get("a", "url-a", 1, max_age=None)
+    await cache.async_get("c", "url-c", 1)
+
+    assert cache.peek("a", 1) is not None
+    assert cache.peek("b", 1) is None
+    assert cache.peek("c", 1) is not None
+    assert len(cache) == 2
+    assert cache.size == 200
+
+
+async def test_newer_still_replaces_older(
+    hass: HomeAssistant, downloads: list[str]
+) -> None:
+    """A newer still of a camera evicts the ones it supersedes."""
+    cache = WyzeSnapshotCache(hass)
+
+    await cache.async_get(MAC, "old", 1)
+    await cache.async_get(MAC, "new", 2)
+
+    assert cache.peek(MAC, 1) is None
+    assert cache.peek(MAC, 2) is not None
+    assert cache.size == 100
+
+
+async def test_oversized_still_is_not_cached(
+    hass: HomeAssistant, downloads: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Stills over the per-image limit are served but not kept."""
+    monkeypatch.setattr(snapshot, "MAX_IMAGE_BYTES", 50)
+    cache = WyzeSnapshotCache(hass)
+
+    assert await cache.async_get_image(MAC, "url", 1) == b"x" * 100
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+async def test_scaled_variants_are_capped(
+    hass: HomeAssistant, downloads: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Each still keeps a few scaled sizes, counted against the budget."""
+    monkeypatch.setattr(
+        snapshot, "scale_jpeg_camera_image", lambda image, width, height: b"s" * width
+    )
+    cache = WyzeSnapshotCache(hass)
+
+    for width in range(1, MAX_SCALED_VARIANTS + 2):
+        assert await cache.async_get_image(MAC, "url", 1, width=width) == (b"s" * width)
+
+    entry = cache.peek(MAC, 1)
+    assert list(entry.scaled) == [
+        (width, None) for width in range(2, MAX_SCALED_VARIANTS + 2)
+    ]
+    assert cache.size == entry.size
+
+
+async def test_scaled_variants_are_evicted(
+    hass: HomeAssistant, downloads: list[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Adding a scaled size that overflows the budget evicts old stills."""
+    monkeypatch.setattr(
+        snapshot, "scale_jpeg_camera_image", lambda image, width, height: b"s" * width
+    )
+    cache = WyzeSnapshotCache(hass, max_bytes=250)
+
+    await cache.async_get("a", "url-a", 1)
+    await cache.async_get("b", "url-b", 1)
+    await cache.async_get_image("b", "url-b", 1, width=60)
+
+    assert cache.peek("a", 1) is None
+    assert cache.size == 160
+
+
+async def test_cancelled_requester_does_not_fail_others(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Concurrent requests share one download that outlives any of them."""
+    release = asyncio.Event()
+    fetches = 0
+
+    async def _fetch(self, url, previous):
+        nonlocal fetches
+        fetches += 1
+        await release.wait()
+        return _image(100)
+
+    monkeypatch.setattr(WyzeSnapshotCache, "_async_fetch", _fetch)
+    cache = WyzeSnapshotCache(hass)
+
+    first = hass.async_create_task(cache.async_get(MAC, "url", 1))
+    second = hass.async_create_task(cache.async_get(MAC, "url", 1))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert (await second).content == b"x" * 100
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert fetches == 1
+    assert cache.peek(MAC, 1) is not None
@@ -0,0 +1,115 @@
+"""Tests for persisting the tokens of an entry."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+from wyzeapy.wyze_auth_lib import Token
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.wyzeapi.const import (
+    ACCESS_TOKEN,
+    DOMAIN,
+    REFRESH_TIME,
+    REFRESH_TOKEN,
+)
+from custom_components.wyzeapi.token_manager import WRITE_DELAY, TokenManager
+
+STORED = {
+    "username": "user@example.com",
+    ACCESS_TOKEN: "access",
+    REFRESH_TOKEN: "refresh",
+    REFRESH_TIME: "100.0",
+}
+
+
+@pytest.fixture
+def entry(hass: HomeAssistant) -> MockConfigEntry:
+    """Return an entry holding a stored token."""
+    entry = MockConfigEntry(domain=DOMAIN, data=STORED)
+    entry.add_to_hass(hass)
+    return entry
+
+
+async def _async_after_delay(hass: HomeAssistant) -> None:
+    """Move time past the write delay."""
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=WRITE_DELAY + 1))
+    await hass.async_block_till_done()
+
+
+async def test_burst_is_written_once(
+    hass: HomeAssistant, entry: MockConfigEntry
+) -> None:
+    """Tokens arriving together are merged into one write of the newest."""
+    manager = TokenManager(hass, entry)
+
+    with patch.object(
+        hass.config_entries,
+        "async_update_entry",
+        wraps=hass.config_entries.async_update_entry,
+    ) as update_entry:
+        await manager.token_callback(Token("access-1", "refresh-1", 200.0))
+        await manager.token_callback(Token("access-2", "refresh-2", 300.0))
+        assert entry.data[ACCESS_TOKEN] == "access"
+
+        await _async_after_delay(hass)
+
+    assert update_entry.call_count == 1
+    assert entry.data == {
+        "username": "user@example.com",
+        ACCESS_TOKEN: "access-2",
+        REFRESH_TOKEN: "refresh-2",
+        REFRESH_TIME: "300.0",
+    }
+
+
+async def test_stored_token_is_not_written(
+    hass: HomeAssistant, entry: MockConfigEntry
+) -> None:
+    """A token equal to the stored one causes no write."""
+    manager = TokenManager(hass, entry)
+
+    with patch.object(hass.config_entries, "async_update_entry") as update_entry:
+        await manager.token_callback(Token("access", "refresh", 100.0))
+        await _async_after_delay(hass)
+
+    update_entry.assert_not_called()
+
+
+async def test_returning_to_stored_token_drops_pending(
+    hass: HomeAssistant, entry: MockConfigEntry
+) -> None:
+    """A pending token superseded by the stored one is never written."""
+    manager = TokenManager(hass, entry)
+
+    with patch.object(hass.config_entries, "async_update_entry") as update_entry:
+        await manager.token_callback(Token("access-1", "refresh-1", 200.0))
+        await manager.token_callback(Token("access", "refresh", 100.0))
+        await _async_after_delay(hass)
+
+    update_entry.assert_not_called()
+
+
+async def test_flush_writes_now(hass: HomeAssistant, entry: MockConfigEntry) -> None:
+    """Flushing writes the pending token at once and cancels the delayed write."""
+    manager = TokenManager(hass, entry)
+
+    with patch.object(
+        hass.config_entries,
+        "async_update_entry",
+        wraps=hass.config_entries.async_update_entry,
+    ) as update_entry:
+        await manager.token_callback(Token("access-1", "refresh-1", 200.0))
+        manager.async_flush()
+        assert entry.data[ACCESS_TOKEN] == "access-1"
+
+        await _async_after_delay(hass)
+        manager.async_flush()
+
+    assert update_entry.call_count == 1